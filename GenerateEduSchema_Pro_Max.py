@@ -1,263 +1,164 @@
-import streamlit as st
-import json
-from datetime import date
-
-st.set_page_config(page_title="🎓 SEO + AEO + GEO + AIO Schema Generator", page_icon="🎓", layout="wide")
-
-st.title("🎓 SEO + AEO + GEO + AIO Schema Generator")
-st.caption("Generate fully optimized JSON-LD schema for Courses and Blogs — including FAQs, LocalBusiness, and AI-enhanced metadata.")
-
-# Sidebar Navigation
-page = st.sidebar.radio(
-    "Select Schema Type",
-    ["📘 Course Schema (Full SEO + AEO + GEO + AIO)", "📝 Education Article Schema (Full SEO + AEO + GEO + AIO)"]
-)
-
-# -------------------------------------------------------------------
-# 📘 COURSE SCHEMA (FULL)
-# -------------------------------------------------------------------
-if page == "📘 Course Schema (Full SEO + AEO + GEO + AIO)":
-    st.header("🏫 Institute Information")
-    inst_name = st.text_input("Institute Name", "Future Vision Computer Institute")
-    inst_url = st.text_input("Website URL", "https://futurevisioncomputers.com/")
-    inst_logo = st.text_input("Logo URL", "")
-    inst_phone = st.text_input("Phone Number", "+91-9825771678")
-    inst_email = st.text_input("Institute Email", "info@futurevisioncomputers.com")
-    inst_address = st.text_area("Full Address", "G-40, Navmanglam Complex, Citylight, Surat, Gujarat 395007, India")
-    inst_lat = st.text_input("Latitude", "21.1702")
-    inst_long = st.text_input("Longitude", "72.8311")
-    inst_area = st.text_input("Area Served", "Surat, Gujarat, India")
-    inst_map = st.text_input("Google Map URL", "https://goo.gl/maps/xyz")
-    inst_social = st.text_area("Social Links (comma separated)", "https://facebook.com/fvcomputers, https://instagram.com/fvcomputers")
-
-    st.subheader("⏰ Opening Hours")
-    opens = st.text_input("Opens", "08:00")
-    closes = st.text_input("Closes", "20:00")
-    open_days = ["Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"]
-
-    st.header("🎓 Course Information")
-    course_name = st.text_input("Course Name", "MS Office Professional Training")
-    course_code = st.text_input("Course Code / Identifier", "MSO-101")
-    course_desc = st.text_area("Course Description", "A complete Microsoft Office course from beginner to expert level.")
-    course_url = st.text_input("Course URL", "https://yourwebsite.com/courses/ms-office")
-    course_fee = st.text_input("Course Fee", "₹5000")
-    course_currency = st.text_input("Currency", "INR")
-    course_duration = st.text_input("Duration (e.g., 3 Months / P3M)", "3 Months")
-    course_mode = st.multiselect("Course Mode", ["Online", "Offline"], default=["Offline"])
-    course_level = st.selectbox("Educational Level", ["Beginner", "Intermediate", "Advanced"])
-    course_prereq = st.text_input("Prerequisites", "Basic computer knowledge")
-    course_lang = st.text_input("Language (ISO code)", "en-IN")
-    cert_award = st.text_input("Certification Awarded", "Certificate of Completion")
-
-    st.header("📚 Learning Details")
-    topics = st.text_area("Topics Covered", "MS Word, Excel, PowerPoint, Outlook")
-    methods = st.text_area("Learning Methods", "Hands-on Practice, Assignments, Projects")
-    outcomes = st.text_area("Learning Outcomes", "Create Excel dashboards, Design PowerPoint templates")
-
-    st.header("🖼️ Course Images & Video")
-    image_urls = st.text_area("Image URLs (comma separated)", "https://yourwebsite.com/images/ms-office.webp")
-    video_url = st.text_input("Video URL (optional)", "")
-    video_embed = st.text_input("Video Embed URL", "")
-
-    st.header("👨‍🏫 Instructor & Author")
-    instructor_name = st.text_input("Instructor Name", "Siddharth Parakh")
-    instructor_desc = st.text_area("Instructor Bio", "Certified trainer with 20+ years of experience.")
-    author_sameas = st.text_area("Author Social / Profile URLs (comma separated)", "https://linkedin.com/in/siddharthparakh")
-    author_knows = st.text_area("Author Expertise (comma separated)", "Excel, Power BI, Computer Skills")
-
-    st.header("🔗 SEO & Trust Signals")
-    rating_value = st.text_input("Average Rating", "4.8")
-    review_count = st.text_input("Review Count", "152")
-    license_url = st.text_input("License / Terms URL", "https://yourwebsite.com/license")
-    citations = st.text_area("Citations / References (comma separated)", "https://learn.microsoft.com/en-us/office/")
-    keywords = st.text_input("Keywords", "MS Office, Excel, Computer Course, Job Oriented")
-    about_tags = st.text_input("About Topics", "Microsoft Office, IT Training, Office Productivity")
-
-    st.header("💬 FAQ Section")
-    faqs = []
-    n_faqs = st.number_input("Number of FAQs", 1, 10, 3)
-    for i in range(n_faqs):
-        q = st.text_input(f"Question {i+1}", "")
-        a = st.text_area(f"Answer {i+1}", "")
-        if q and a:
-            faqs.append({
-                "@type": "Question",
-                "name": q,
-                "acceptedAnswer": {"@type": "Answer", "text": a}
-            })
-
-    if st.button("✅ Generate Full Course Schema"):
-        org_schema = {
-            "@context": "https://schema.org",
-            "@type": ["EducationalOrganization", "LocalBusiness"],
-            "name": inst_name,
-            "url": inst_url,
-            "logo": inst_logo,
-            "telephone": inst_phone,
-            "email": inst_email,
-            "address": inst_address,
-            "areaServed": inst_area,
-            "geo": {"@type": "GeoCoordinates", "latitude": inst_lat, "longitude": inst_long},
-            "hasMap": inst_map,
-            "openingHoursSpecification": [{
-                "@type": "OpeningHoursSpecification",
-                "dayOfWeek": open_days,
-                "opens": opens,
-                "closes": closes
-            }],
-            "sameAs": [s.strip() for s in inst_social.split(",")]
-        }
-
-        course_schema = {
-            "@context": "https://schema.org",
-            "@type": "Course",
-            "identifier": {"@type": "PropertyValue", "propertyID": "CourseCode", "value": course_code},
-            "name": course_name,
-            "description": course_desc,
-            "url": course_url,
-            "image": [i.strip() for i in image_urls.split(",")],
-            "video": {"@type": "VideoObject", "url": video_url, "embedUrl": video_embed} if video_url else None,
-            "provider": {"@type": "EducationalOrganization", "name": inst_name, "url": inst_url},
-            "educationalLevel": course_level,
-            "coursePrerequisites": course_prereq,
-            "educationalCredentialAwarded": cert_award,
-            "inLanguage": course_lang,
-            "timeRequired": course_duration,
-            "teaches": [t.strip() for t in topics.split(",")],
-            "learningResourceType": [m.strip() for m in methods.split(",")],
-            "learningOutcome": [o.strip() for o in outcomes.split(",")],
-            "aggregateRating": {"@type": "AggregateRating", "ratingValue": rating_value, "reviewCount": review_count},
-            "author": {
-                "@type": "Person",
-                "name": instructor_name,
-                "description": instructor_desc,
-                "sameAs": [s.strip() for s in author_sameas.split(",")],
-                "knowsAbout": [k.strip() for k in author_knows.split(",")],
-                "worksFor": {"@type": "Organization", "name": inst_name}
-            },
-            "educationalAlignment": {
-                "@type": "AlignmentObject",
-                "alignmentType": "educationalLevel",
-                "targetName": course_level
-            },
-            "potentialAction": {
-                "@type": "EnrollAction",
-                "target": f"{course_url}/enroll",
-                "name": f"Enroll in {course_name}"
-            },
-            "license": license_url,
-            "citation": [c.strip() for c in citations.split(",")],
-            "keywords": [k.strip() for k in keywords.split(",")],
-            "about": [a.strip() for a in about_tags.split(",")],
-            "interactionStatistic": {
-                "@type": "InteractionCounter",
-                "interactionType": "https://schema.org/LikeAction",
-                "userInteractionCount": "300"
-            }
-        }
-
-        faq_schema = {"@context": "https://schema.org", "@type": "FAQPage", "mainEntity": faqs}
-        schema = [org_schema, course_schema, faq_schema]
-        st.success("✅ Full SEO + AEO + GEO + AIO Course Schema Generated!")
-        st.code(json.dumps(schema, indent=2), language="json")
-        st.download_button("💾 Download JSON-LD", json.dumps(schema, indent=2), file_name="course_full_schema.json")
-
-# -------------------------------------------------------------------
-# 📝 BLOG SCHEMA (FULL)
-# -------------------------------------------------------------------
-elif page == "📝 Education Article Schema (Full SEO + AEO + GEO + AIO)":
-    st.header("📰 Blog Details")
-    headline = st.text_input("Headline", "Master Excel Formulas for Business Analytics")
-    description = st.text_area("Description", "Learn essential Excel formulas every analyst should know.")
-    blog_url = st.text_input("Blog URL", "https://yourdomain.com/blog/excel-formulas")
-    image_url = st.text_input("Main Image URL (1200px)", "")
-    date_published = st.date_input("Date Published", date.today())
-    date_modified = st.date_input("Date Modified", date.today())
-    author_name = st.text_input("Author Name", "Siddharth")
-    author_sameas = st.text_area("Author Social Links", "https://linkedin.com/in/siddharthparakh")
-    author_knows = st.text_area("Author Expertise", "Excel, Analytics, Data Visualization")
-    pub_name = st.text_input("Publisher Name", "Future Vision Computer Institute")
-    pub_logo = st.text_input("Publisher Logo", "")
-    pub_social = st.text_area("Publisher Social Links", "https://facebook.com/fvcomputers, https://linkedin.com/company/fvcomputers")
-    keywords = st.text_input("Keywords", "Excel, Education, Data Analytics")
-    about_tags = st.text_input("About Topics", "Microsoft Excel, Business Analytics")
-    word_count = st.number_input("Word Count", 300, 5000, 1200)
-    license_url = st.text_input("License URL", "https://yourdomain.com/license")
-    citations = st.text_area("Citations", "https://learn.microsoft.com/en-us/office/")
-    free_access = st.checkbox("Is Accessible for Free?", True)
-
-    st.header("🎥 Optional Video")
-    video_url = st.text_input("Video URL", "")
-    video_embed = st.text_input("Embed URL", "")
-    video_duration = st.text_input("Video Duration (ISO e.g., PT5M30S)", "PT5M")
-
-    st.header("💬 FAQ Section")
-    faqs = []
-    n_faq = st.number_input("Number of FAQs", 1, 10, 2)
-    for i in range(n_faq):
-        q = st.text_input(f"Question {i+1}", "")
-        a = st.text_area(f"Answer {i+1}", "")
-        if q and a:
-            faqs.append({
-                "@type": "Question",
-                "name": q,
-                "acceptedAnswer": {"@type": "Answer", "text": a}
-            })
-
-    if st.button("🚀 Generate Full Blog Schema"):
-        blog_schema = {
-            "@context": "https://schema.org",
-            "@type": "BlogPosting",
-            "headline": headline,
-            "description": description,
-            "url": blog_url,
-            "image": image_url,
-            "datePublished": str(date_published),
-            "dateModified": str(date_modified),
-            "isAccessibleForFree": free_access,
-            "author": {
-                "@type": "Person",
-                "name": author_name,
-                "sameAs": [s.strip() for s in author_sameas.split(",")],
-                "knowsAbout": [k.strip() for k in author_knows.split(",")]
-            },
-            "publisher": {
-                "@type": "Organization",
-                "name": pub_name,
-                "logo": {"@type": "ImageObject", "url": pub_logo},
-                "sameAs": [s.strip() for s in pub_social.split(",")]
-            },
-            "keywords": [k.strip() for k in keywords.split(",")],
-            "about": [a.strip() for a in about_tags.split(",")],
-            "wordCount": word_count,
-            "articleBody": description,
-            "license": license_url,
-            "citation": [c.strip() for c in citations.split(",")],
-            "educationalAlignment": {
-                "@type": "AlignmentObject",
-                "alignmentType": "educationalLevel",
-                "targetName": "Intermediate"
-            },
-            "speakable": {"@type": "SpeakableSpecification", "xpath": ["/html/head/title", "/html/body/h1"]},
-            "audience": {"@type": "Audience", "audienceType": "Students and Professionals"},
-            "isPartOf": {"@type": "Blog", "name": "Education Blog"},
-            "potentialAction": {
-                "@type": "ReadAction",
-                "target": blog_url,
-                "name": f"Read {headline}"
-            }
-        }
-
-        if video_url:
-            blog_schema["video"] = {
-                "@type": "VideoObject",
-                "url": video_url,
-                "embedUrl": video_embed,
-                "duration": video_duration
-            }
-
-        faq_schema = {"@context": "https://schema.org", "@type": "FAQPage", "mainEntity": faqs}
-        schema = [blog_schema, faq_schema]
-        st.success("✅ Full SEO + AEO + GEO + AIO Blog Schema Generated!")
-        st.code(json.dumps(schema, indent=2), language="json")
-        st.download_button("💾 Download JSON-LD", json.dumps(schema, indent=2), file_name="blog_full_schema.json")
+import streamlit as st
+from datetime import date
+
+from app_cache import form_schema, save_button, saved_choices, saved_record, saved_value, show_validation, table_editor
+from schemagen.site import load_site
+
+FAQ_COLUMNS = {"question": "Question", "answer": "Answer"}
+LEVELS = ["Beginner", "Intermediate", "Advanced"]
+MODES = ["Online", "Offline"]
+
+st.set_page_config(page_title="🎓 SEO + AEO + GEO + AIO Schema Generator", page_icon="🎓", layout="wide")
+
+st.title("🎓 SEO + AEO + GEO + AIO Schema Generator")
+st.caption("Generate fully optimized JSON-LD schema for Courses and Blogs — including FAQs, LocalBusiness, and AI-enhanced metadata.")
+
+# Sidebar Navigation
+page = st.sidebar.radio(
+    "Select Schema Type",
+    ["📘 Course Schema (Full SEO + AEO + GEO + AIO)", "📝 Education Article Schema (Full SEO + AEO + GEO + AIO)"]
+)
+
+# -------------------------------------------------------------------
+# 📘 COURSE SCHEMA (FULL)
+# -------------------------------------------------------------------
+if page == "📘 Course Schema (Full SEO + AEO + GEO + AIO)":
+    # Institute defaults come from the site config (schemagen/site.json), shared with the blog generator;
+    # a course loaded from the project store (schemagen/store.py) overrides them
+    site = load_site()
+    saved = saved_record("full-course", key="pro_max_course")
+    st.header("🏫 Institute Information")
+    inst_id = st.text_input("Organization @id", saved.get("inst_id", site.get("@id")))
+    inst_name = st.text_input("Institute Name", saved.get("inst_name", site.get("name")))
+    inst_url = st.text_input("Website URL", saved.get("inst_url", site.get("url")))
+    inst_logo = st.text_input("Logo URL", saved.get("inst_logo", site.get("logo")))
+    inst_phone = st.text_input("Phone Number", saved.get("inst_phone", site.get("telephone")))
+    inst_email = st.text_input("Institute Email", saved.get("inst_email", site.get("email")))
+    inst_address = st.text_area("Full Address", saved.get("inst_address", "G-40, Navmanglam Complex, Citylight, Surat, Gujarat 395007, India"))
+    inst_lat = st.text_input("Latitude", saved.get("inst_lat", site.get("location.geo.latitude")))
+    inst_long = st.text_input("Longitude", saved.get("inst_long", site.get("location.geo.longitude")))
+    inst_area = st.text_input("Area Served", saved.get("inst_area", "Surat, Gujarat, India"))
+    inst_map = st.text_input("Google Map URL", saved.get("inst_map", "https://goo.gl/maps/xyz"))
+    inst_social = st.text_area("Social Links (comma separated)", saved.get("inst_social", site.get("sameAs")))
+
+    st.subheader("⏰ Opening Hours")
+    opens = st.text_input("Opens", saved.get("opens", "08:00"))
+    closes = st.text_input("Closes", saved.get("closes", "20:00"))
+
+    st.header("🎓 Course Information")
+    course_name = st.text_input("Course Name", saved.get("course_name", "MS Office Professional Training"))
+    course_code = st.text_input("Course Code / Identifier", saved.get("course_code", "MSO-101"))
+    course_desc = st.text_area("Course Description", saved.get("course_desc", "A complete Microsoft Office course from beginner to expert level."))
+    course_url = st.text_input("Course URL", saved.get("course_url", "https://yourwebsite.com/courses/ms-office"))
+    course_fee = st.text_input("Course Fee", saved_value(saved, "course_fee", "5000", str))
+    course_currency = st.text_input("Currency", saved_value(saved, "course_currency", "INR", str))
+    course_duration = st.text_input("Duration (e.g., 3 Months / P3M)", saved.get("course_duration", "3 Months"))
+    course_mode = st.multiselect("Course Mode", MODES, default=saved_value(saved, "course_mode", ["Offline"], saved_choices(MODES)))
+    course_level = st.selectbox("Educational Level", LEVELS,
+                                index=LEVELS.index(saved["course_level"]) if saved.get("course_level") in LEVELS else 0)
+    course_prereq = st.text_input("Prerequisites", saved.get("course_prereq", "Basic computer knowledge"))
+    course_lang = st.text_input("Language (ISO code)", saved.get("course_lang", "en-IN"))
+    cert_award = st.text_input("Certification Awarded", saved.get("cert_award", "Certificate of Completion"))
+
+    st.header("📚 Learning Details")
+    topics = st.text_area("Topics Covered", saved.get("topics", "MS Word, Excel, PowerPoint, Outlook"))
+    methods = st.text_area("Learning Methods", saved.get("methods", "Hands-on Practice, Assignments, Projects"))
+    outcomes = st.text_area("Learning Outcomes", saved.get("outcomes", "Create Excel dashboards, Design PowerPoint templates"))
+
+    st.header("🖼️ Course Images & Video")
+    image_urls = st.text_area("Image URLs (comma separated)", saved.get("image_urls", "https://yourwebsite.com/images/ms-office.webp"))
+    video_url = st.text_input("Video URL (optional)", saved.get("video_url", ""))
+    video_embed = st.text_input("Video Embed URL", saved.get("video_embed", ""))
+
+    st.header("👨‍🏫 Instructor & Author")
+    instructor_name = st.text_input("Instructor Name", saved.get("instructor_name", "Siddharth Parakh"))
+    instructor_desc = st.text_area("Instructor Bio", saved.get("instructor_desc", "Certified trainer with 20+ years of experience."))
+    author_sameas = st.text_area("Author Social / Profile URLs (comma separated)", saved.get("author_sameas", "https://linkedin.com/in/siddharthparakh"))
+    author_knows = st.text_area("Author Expertise (comma separated)", saved.get("author_knows", "Excel, Power BI, Computer Skills"))
+
+    st.header("🔗 SEO & Trust Signals")
+    rating_value = st.text_input("Average Rating", saved.get("rating_value", "4.8"))
+    review_count = st.text_input("Review Count", saved.get("review_count", "152"))
+    license_url = st.text_input("License / Terms URL", saved.get("license_url", "https://yourwebsite.com/license"))
+    citations = st.text_area("Citations / References (comma separated)", saved.get("citations", "https://learn.microsoft.com/en-us/office/"))
+    keywords = st.text_input("Keywords", saved.get("keywords", "MS Office, Excel, Computer Course, Job Oriented"))
+    about_tags = st.text_input("About Topics", saved.get("about_tags", "Microsoft Office, IT Training, Office Productivity"))
+
+    st.header("💬 FAQ Section")
+    faqs = list(table_editor("FAQs", FAQ_COLUMNS, key="course_faqs", rows=saved.get("faqs") or [("", "")] * 3,
+                             wide=("question", "answer")).itertuples(index=False, name=None))
+
+    linked = st.checkbox("🔗 Link entities in one @graph", help="Organization, people, places and course instances become separate nodes referenced by @id")
+    fields = dict(
+        inst_id=inst_id, inst_name=inst_name, inst_url=inst_url, inst_logo=inst_logo, inst_phone=inst_phone,
+        inst_email=inst_email, inst_address=inst_address, inst_lat=inst_lat, inst_long=inst_long,
+        inst_area=inst_area, inst_map=inst_map, inst_social=inst_social, opens=opens, closes=closes,
+        course_name=course_name, course_code=course_code, course_desc=course_desc, course_url=course_url,
+        course_duration=course_duration, course_fee=course_fee, course_currency=course_currency,
+        course_mode=course_mode, course_level=course_level, course_prereq=course_prereq,
+        course_lang=course_lang, cert_award=cert_award, topics=topics, methods=methods, outcomes=outcomes,
+        image_urls=image_urls, video_url=video_url, video_embed=video_embed,
+        instructor_name=instructor_name, instructor_desc=instructor_desc, author_sameas=author_sameas,
+        author_knows=author_knows, rating_value=rating_value, review_count=review_count,
+        license_url=license_url, citations=citations, keywords=keywords, about_tags=about_tags, faqs=faqs,
+    )
+    save_button("full-course", fields)
+    if st.button("✅ Generate Full Course Schema"):
+        schema, json_ld = form_schema("full_course", linked=linked, **fields)
+        st.success("✅ Full SEO + AEO + GEO + AIO Course Schema Generated!")
+        st.code(json_ld, language="json")
+        show_validation(schema)
+        st.download_button("💾 Download JSON-LD", json_ld, file_name="course_full_schema.json")
+
+# -------------------------------------------------------------------
+# 📝 BLOG SCHEMA (FULL)
+# -------------------------------------------------------------------
+elif page == "📝 Education Article Schema (Full SEO + AEO + GEO + AIO)":
+    saved = saved_record("article", key="pro_max_article")
+    st.header("📰 Blog Details")
+    headline = st.text_input("Headline", saved.get("headline", "Master Excel Formulas for Business Analytics"))
+    description = st.text_area("Description", saved.get("description", "Learn essential Excel formulas every analyst should know."))
+    blog_url = st.text_input("Blog URL", saved.get("blog_url", "https://yourdomain.com/blog/excel-formulas"))
+    image_url = st.text_input("Main Image URL (1200px)", saved.get("image_url", ""))
+    date_published = st.date_input("Date Published", saved_value(saved, "date_published", date.today(), date.fromisoformat))
+    date_modified = st.date_input("Date Modified", saved_value(saved, "date_modified", date.today(), date.fromisoformat))
+    author_name = st.text_input("Author Name", saved.get("author_name", "Siddharth"))
+    author_sameas = st.text_area("Author Social Links", saved.get("author_sameas", "https://linkedin.com/in/siddharthparakh"))
+    author_knows = st.text_area("Author Expertise", saved.get("author_knows", "Excel, Analytics, Data Visualization"))
+    pub_name = st.text_input("Publisher Name", saved.get("pub_name", "Future Vision Computer Institute"))
+    pub_logo = st.text_input("Publisher Logo", saved.get("pub_logo", ""))
+    pub_social = st.text_area("Publisher Social Links", saved.get("pub_social", "https://facebook.com/fvcomputers, https://linkedin.com/company/fvcomputers"))
+    keywords = st.text_input("Keywords", saved.get("keywords", "Excel, Education, Data Analytics"))
+    about_tags = st.text_input("About Topics", saved.get("about_tags", "Microsoft Excel, Business Analytics"))
+    word_count = st.number_input("Word Count", 300, 5000,
+                                 saved_value(saved, "word_count", 1200, lambda value: min(max(int(value), 300), 5000)))
+    license_url = st.text_input("License URL", saved.get("license_url", "https://yourdomain.com/license"))
+    citations = st.text_area("Citations", saved.get("citations", "https://learn.microsoft.com/en-us/office/"))
+    free_access = st.checkbox("Is Accessible for Free?", saved_value(saved, "free_access", True,
+                              lambda value: str(value).strip().lower() in ("1", "true", "yes", "y")))
+
+    st.header("🎥 Optional Video")
+    video_url = st.text_input("Video URL", saved.get("video_url", ""))
+    video_embed = st.text_input("Embed URL", saved.get("video_embed", ""))
+    video_duration = st.text_input("Video Duration (ISO e.g., PT5M30S)", saved.get("video_duration", "PT5M"))
+
+    st.header("💬 FAQ Section")
+    faqs = list(table_editor("FAQs", FAQ_COLUMNS, key="article_faqs", rows=saved.get("faqs") or [("", "")] * 2,
+                             wide=("question", "answer")).itertuples(index=False, name=None))
+
+    linked = st.checkbox("🔗 Link entities in one @graph", help="Organization, people, places and course instances become separate nodes referenced by @id")
+    fields = dict(
+        headline=headline, description=description, blog_url=blog_url, image_url=image_url,
+        date_published=date_published, date_modified=date_modified, author_name=author_name,
+        author_sameas=author_sameas, author_knows=author_knows, pub_name=pub_name, pub_logo=pub_logo,
+        pub_social=pub_social, keywords=keywords, about_tags=about_tags, word_count=word_count,
+        license_url=license_url, citations=citations, free_access=free_access,
+        video_url=video_url, video_embed=video_embed, video_duration=video_duration, faqs=faqs,
+    )
+    save_button("article", fields)
+    if st.button("🚀 Generate Full Blog Schema"):
+        schema, json_ld = form_schema("education_article", linked=linked, **fields)
+        st.success("✅ Full SEO + AEO + GEO + AIO Blog Schema Generated!")
+        st.code(json_ld, language="json")
+        show_validation(schema)
+        st.download_button("💾 Download JSON-LD", json_ld, file_name="blog_full_schema.json")
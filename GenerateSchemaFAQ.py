@@ -1,122 +1,78 @@
-import streamlit as st
-import json
-
-st.set_page_config(page_title="Course Schema Generator", layout="centered")
-
-st.title("🎓 Course Schema Generator (JSON-LD)")
-st.caption("Generate SEO + AI optimized schema markup for your courses with multiple branches and FAQs.")
-
-# --- Course Information ---
-st.header("🧾 Course Details")
-
-course_name = st.text_input("Course Name", "MS Office Training")
-course_desc = st.text_area(
-    "Course Description",
-    "Learn Microsoft Office (Word, Excel, PowerPoint) from beginner to advanced level with certification."
-)
-course_url = st.text_input("Course URL", "https://yourwebsite.com/ms-office")
-course_duration = st.text_input("Course Duration", "3 Months")
-course_fee = st.text_input("Course Fee", "₹5000")
-course_mode = st.selectbox("Course Mode", ["Offline", "Online", "Both"])
-
-# --- Provider Information ---
-st.header("🏫 Institute Details")
-
-provider_name = st.text_input("Institute Name", "Siddharth Computer Institute")
-provider_url = st.text_input("Institute Website", "https://yourwebsite.com")
-provider_logo = st.text_input("Institute Logo URL", "https://yourwebsite.com/logo.png")
-
-# --- Branch Details (Fixed: 3 Branches) ---
-st.header("📍 Branch Locations (3 Branches)")
-
-branches = []
-for i in range(3):
-    st.subheader(f"🏢 Branch {i+1}")
-    street = st.text_input(f"Street Address (Branch {i+1})", key=f"street_{i}")
-    city = st.text_input(f"City (Branch {i+1})", key=f"city_{i}")
-    region = st.text_input(f"State/Region (Branch {i+1})", key=f"region_{i}")
-    postal = st.text_input(f"Postal Code (Branch {i+1})", key=f"postal_{i}")
-    country = st.text_input(f"Country (Branch {i+1})", "IN", key=f"country_{i}")
-    telephone = st.text_input(f"Phone (Branch {i+1})", key=f"phone_{i}")
-
-    if street and city:
-        branches.append({
-            "@type": "Place",
-            "name": f"{provider_name} - {city}",
-            "address": {
-                "@type": "PostalAddress",
-                "streetAddress": street,
-                "addressLocality": city,
-                "addressRegion": region,
-                "postalCode": postal,
-                "addressCountry": country
-            },
-            "telephone": telephone
-        })
-
-# --- FAQ Section ---
-st.header("💬 Course FAQs")
-
-faq_list = []
-num_faqs = st.number_input("Number of FAQs", min_value=1, max_value=10, value=3)
-
-for i in range(int(num_faqs)):
-    st.subheader(f"❓ FAQ {i+1}")
-    question = st.text_input(f"Question {i+1}", key=f"q_{i}")
-    answer = st.text_area(f"Answer {i+1}", key=f"a_{i}")
-    if question and answer:
-        faq_list.append({
-            "@type": "Question",
-            "name": question,
-            "acceptedAnswer": {
-                "@type": "Answer",
-                "text": answer
-            }
-        })
-
-# --- Generate JSON-LD ---
-if st.button("✅ Generate Course Schema"):
-    course_schema = {
-        "@context": "https://schema.org",
-        "@type": "Course",
-        "name": course_name,
-        "description": course_desc,
-        "provider": {
-            "@type": "Organization",
-            "name": provider_name,
-            "url": provider_url,
-            "logo": provider_logo
-        },
-        "hasCourseInstance": {
-            "@type": "CourseInstance",
-            "courseMode": course_mode,
-            "courseWorkload": course_duration,
-            "offers": {
-                "@type": "Offer",
-                "price": course_fee,
-                "priceCurrency": "INR",
-                "availability": "https://schema.org/InStock",
-                "url": course_url
-            },
-            "location": branches
-        }
-    }
-
-    faq_schema = {
-        "@context": "https://schema.org",
-        "@type": "FAQPage",
-        "mainEntity": faq_list
-    }
-
-    full_schema = [course_schema, faq_schema]
-
-    st.success("✅ JSON-LD Schema Generated Successfully!")
-    st.code(json.dumps(full_schema, indent=2), language="json")
-
-    # Download button
-    st.download_button(
-        label="⬇️ Download JSON-LD File",
-        data=json.dumps(full_schema, indent=2),
-        file_name=f"{course_name.lower().replace(' ', '_')}_schema.json",
-        mime="application/json"
-    )
+import streamlit as st
+
+from app_cache import form_schema, save_button, saved_record, show_validation, table_editor
+
+st.set_page_config(page_title="Course Schema Generator", layout="centered")
+
+st.title("🎓 Course Schema Generator (JSON-LD)")
+st.caption("Generate SEO + AI optimized schema markup for your courses with multiple branches and FAQs.")
+
+MODES = ["Offline", "Online", "Both"]
+# A course loaded from the project store (schemagen/store.py) replaces the defaults below
+saved = saved_record("course-branches", key="faq_course")
+
+# --- Course Information ---
+st.header("🧾 Course Details")
+
+course_name = st.text_input("Course Name", saved.get("course_name", "MS Office Training"))
+course_desc = st.text_area(
+    "Course Description",
+    saved.get("course_desc",
+              "Learn Microsoft Office (Word, Excel, PowerPoint) from beginner to advanced level with certification.")
+)
+course_url = st.text_input("Course URL", saved.get("course_url", "https://yourwebsite.com/ms-office"))
+course_duration = st.text_input("Course Duration", saved.get("course_duration", "3 Months"))
+course_fee = st.text_input("Course Fee", saved.get("course_fee", "₹5000"))
+course_mode = st.selectbox("Course Mode", MODES,
+                           index=MODES.index(saved["course_mode"]) if saved.get("course_mode") in MODES else 0)
+
+# --- Provider Information ---
+st.header("🏫 Institute Details")
+
+provider_name = st.text_input("Institute Name", saved.get("provider_name", "Siddharth Computer Institute"))
+provider_url = st.text_input("Institute Website", saved.get("provider_url", "https://yourwebsite.com"))
+provider_logo = st.text_input("Institute Logo URL", saved.get("provider_logo", "https://yourwebsite.com/logo.png"))
+
+# --- Branch Details ---
+st.header("📍 Branch Locations")
+st.caption("One row per branch — add rows, paste from a spreadsheet or upload a CSV. Rows without a street and city are skipped.")
+
+branches = table_editor(
+    "branches",
+    {"street": "Street Address", "city": "City", "region": "State/Region", "postal": "Postal Code",
+     "country": "Country", "telephone": "Phone"},
+    key="branches", rows=saved.get("branches") or [{"country": "IN"}] * 3, wide=("street",),
+).to_dict("records")
+
+# --- FAQ Section ---
+st.header("💬 Course FAQs")
+
+faq_list = list(table_editor("FAQs", {"question": "Question", "answer": "Answer"}, key="faqs",
+                             rows=saved.get("faqs") or [("", "")] * 3,
+                             wide=("question", "answer")).itertuples(index=False, name=None))
+
+# --- Generate JSON-LD ---
+linked = st.checkbox("🔗 Link entities in one @graph", help="Organization, people, places and course instances become separate nodes referenced by @id")
+
+fields = dict(
+    course_name=course_name, course_desc=course_desc, course_url=course_url,
+    course_duration=course_duration, course_fee=course_fee, course_mode=course_mode,
+    provider_name=provider_name, provider_url=provider_url, provider_logo=provider_logo,
+    branches=branches, faqs=faq_list,
+)
+save_button("course-branches", fields)
+
+if st.button("✅ Generate Course Schema"):
+    full_schema, json_ld = form_schema("course_branches", linked=linked, **fields)
+
+    st.success("✅ JSON-LD Schema Generated Successfully!")
+    st.code(json_ld, language="json")
+    show_validation(full_schema)
+
+    # Download button
+    st.download_button(
+        label="⬇️ Download JSON-LD File",
+        data=json_ld,
+        file_name=f"{course_name.lower().replace(' ', '_')}_schema.json",
+        mime="application/json"
+    )
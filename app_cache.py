@@ -0,0 +1,283 @@
+"""Streamlit cache layers shared by the generator apps.
+
+Streamlit reruns the whole script on every widget change, so the apps go
+through these wrappers instead of calling ``schemagen`` directly: a schema
+and its JSON text are built once per distinct set of form values and then
+served from ``st.cache_data`` to every later rerun and every editor looking
+at the same inputs. Entries expire after a TTL and the least recently used
+are dropped past ``MAX_ENTRIES``. ``show_validation`` renders the
+``schemagen.validate`` result for a generated schema the same way in every
+app, and ``show_timings`` the per-stage ``schemagen.timing`` breakdown.
+``table_editor`` is the one editable table (with CSV upload) that stands in
+for a repeated form section such as branches or FAQs. ``saved_record`` and
+``save_button`` load a form from, and save it to, the ``schemagen.store``
+project store.
+"""
+
+import importlib
+import json
+from datetime import date
+from urllib.parse import urlsplit, urlunsplit
+
+import streamlit as st
+
+from schemagen.store import POST_KINDS, default_store
+from schemagen.timing import StageStats, Timings, profiled
+
+MAX_ENTRIES = 256
+FORM_TTL = 3600
+BLOG_TTL = 300  # same as PageCache.max_age: after that the page is revalidated with the server
+
+# Imported on first use, so that a form renders before the generators (and the HTML stack) are loaded
+GENERATORS = {
+    "course": ("schemagen.course", "course_schema"),
+    "course_branches": ("schemagen.course", "course_branches_schema"),
+    "full_course": ("schemagen.course", "full_course_schema"),
+    "education_article": ("schemagen.article", "education_article_schema"),
+    "blog_posting": ("schemagen.article", "blog_posting_schema"),
+}
+PAGE_URL_FIELDS = ("course_url", "blog_url", "provider_url", "inst_url")  # the page the schema goes on
+SITE_URL_FIELDS = ("inst_url", "provider_url")  # base of the derived @ids
+
+
+def _freeze(value):
+    """Lists become tuples so equal form values always hash to the same cache key."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _freeze(item) for key, item in value.items()}
+    return value
+
+
+def normalize_url(url):
+    """Strip whitespace and the fragment, lower-case scheme and host."""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", parts.query, ""))
+
+
+@st.cache_data(ttl=FORM_TTL, max_entries=MAX_ENTRIES, show_spinner=False)
+def _form_schema(kind, fields, ensure_ascii, linked=False, day=None):
+    # ``day`` is only part of the cache key: generators fill in today's date (start dates, validFrom)
+    module, name = GENERATORS[kind]
+    schema = getattr(importlib.import_module(module), name)(**fields)
+    page_url = next((fields[key] for key in PAGE_URL_FIELDS if str(fields.get(key, "")).startswith("http")), None)
+    if linked and page_url:
+        from schemagen.graph import linked_graph
+
+        site_url = next((fields[key] for key in SITE_URL_FIELDS if str(fields.get(key, "")).startswith("http")), None)
+        schema = linked_graph(schema, page_url, site_url)
+    return schema, json.dumps(schema, indent=2, ensure_ascii=ensure_ascii)
+
+
+def form_schema(kind, ensure_ascii=True, linked=False, **fields):
+    """``(schema, json_text)`` for a form, from the ``GENERATORS[kind]`` function called with ``fields``.
+
+    With ``linked`` the result is one ``@graph`` whose organization, people,
+    places and course instances are separate nodes referenced by ``@id``
+    (``schemagen.graph.linked_graph``); forms without a page URL stay nested.
+    Results are cached per day as well, since defaults such as a course's
+    start date are today's.
+    """
+    return _form_schema(kind, _freeze(fields), ensure_ascii, linked, date.today())
+
+
+def _generate_blog(blog_url, category):
+    from schemagen.blog import generate_blog_schema
+    from schemagen.fetch import default_cache
+    from schemagen.keywords import default_stats
+
+    timings = Timings()
+    schema, checklist, from_cache = generate_blog_schema(
+        blog_url, category, timeout=10, cache=default_cache(), stats=default_stats(), timings=timings)
+    default_stats().maybe_save()  # every few posts, not on every click
+    with timings.stage("serialize"):
+        json_text = json.dumps(schema, indent=2, ensure_ascii=False)
+    timings.count("json_bytes", len(json_text.encode("utf-8")))
+    return schema, checklist, from_cache, json_text, timings.as_dict()
+
+
+@st.cache_data(ttl=BLOG_TTL, max_entries=MAX_ENTRIES, show_spinner="Fetching and analysing the blog post…")
+def _blog_schema(blog_url, category):
+    return _generate_blog(blog_url, category)
+
+
+def blog_schema(blog_url, category):
+    """``(schema, checklist, from_cache, json_text, timings)`` for a live blog post.
+
+    The URL is normalised first so trivially different spellings share one
+    entry. Failed fetches are not cached. ``timings`` (``Timings.as_dict()``)
+    are those of the run that filled the cache entry.
+    """
+    return _blog_schema(normalize_url(blog_url), category)
+
+
+def profile_blog_schema(blog_url, category, profiler="cprofile"):
+    """``blog_schema`` run uncached under ``profiler``, with the profile report appended to the tuple."""
+    with profiled(profiler) as profile:
+        result = _generate_blog(normalize_url(blog_url), category)
+    return (*result, profile.text)
+
+
+def show_validation(schema):
+    """Render rich-result problems in ``schema`` (``schemagen.validate``) above the download button."""
+    from schemagen.validate import ERROR, validate
+
+    issues = validate(schema)
+    errors = [str(issue) for issue in issues if issue.severity == ERROR]
+    warnings = [str(issue) for issue in issues if issue.severity != ERROR]
+    if errors:
+        st.error(f"❌ {len(errors)} rich-result error(s) — fix before publishing:\n\n" + "\n".join(f"- {e}" for e in errors))
+    if warnings:
+        with st.expander(f"⚠️ {len(warnings)} warning(s)"):
+            st.markdown("\n".join(f"- {w}" for w in warnings))
+    if not issues:
+        st.success("✅ Passes rich-result checks")
+    return issues
+
+
+def show_timings(timings, profile_text=None, expanded=False):
+    """A "Performance" expander: time per stage (a ``Timings.as_dict()`` or ``StageStats``), counts and profile."""
+    with st.expander("⏱️ Performance", expanded=expanded):
+        if isinstance(timings, StageStats):
+            st.caption(f"{timings.runs} pages")
+            st.table([{"stage": name, "pages": n, "total s": f"{seconds:.2f}", "mean ms": f"{mean:.1f}",
+                       "max ms": f"{peak:.1f}", "share": f"{share:.0%}"}
+                      for name, n, seconds, mean, peak, share in timings.rows()])
+            counts = timings.counts
+        else:
+            timings = Timings(timings)
+            st.caption(f"{1000 * timings.total:.0f} ms in total")
+            st.table([{"stage": name, "ms": f"{ms:.1f}", "share": f"{share:.0%}"} for name, ms, share in timings.rows()])
+            counts = timings.counts
+        if counts:
+            st.caption(" · ".join(f"{name.replace('_', ' ')}: {n:,}" for name, n in sorted(counts.items())))
+        if profile_text:
+            st.code(profile_text, language="text")
+
+
+def _csv_table(upload, columns):
+    """An uploaded CSV as a DataFrame with ``columns``, matching headers by field name or label, case-insensitively."""
+    import pandas as pd
+
+    table = pd.read_csv(upload, dtype=str, keep_default_na=False)
+    names = {}
+    for field, label in columns.items():
+        names[field.lower()] = names[label.lower()] = field
+    table = table.rename(columns=lambda header: names.get(str(header).strip().lower(), header))
+    if not set(columns) & set(table.columns):  # no recognised header: take the columns in order
+        upload.seek(0)
+        table = pd.read_csv(upload, dtype=str, keep_default_na=False, header=None).iloc[:, :len(columns)]
+        table.columns = list(columns)[:table.shape[1]]
+    return table
+
+
+def table_editor(label, columns, key, rows=(), wide=()):
+    """An editable table for a repeated form section, returning its filled-in rows as a DataFrame.
+
+    ``columns`` maps field names to column labels. Rows can be added, pasted
+    from a spreadsheet or loaded from a CSV file (headers may be the field
+    names or the labels; without a known header the columns are taken in
+    order); there is no limit on their number. The result has every field
+    as a stripped string and no blank rows, so a generator takes
+    ``df.itertuples(index=False, name=None)`` or ``df.to_dict("records")``.
+    """
+    import pandas as pd
+
+    upload = st.file_uploader(f"Upload {label} CSV", type="csv", key=f"{key}_csv",
+                              help="Replaces the table below; headers: " + ", ".join(columns.values()))
+    if upload is not None:
+        data = _csv_table(upload, columns)
+        key = f"{key}_{upload.file_id}"  # a new file starts a new table
+    else:
+        try:
+            data = pd.DataFrame(list(rows), columns=list(columns))
+        except (TypeError, ValueError):  # rows of a saved record in another shape: start empty
+            data = pd.DataFrame(columns=list(columns))
+    edited = st.data_editor(
+        data.reindex(columns=list(columns)).fillna(""), key=key, num_rows="dynamic", use_container_width=True,
+        hide_index=True,
+        column_config={field: st.column_config.TextColumn(label, width="large" if field in wide else "medium")
+                       for field, label in columns.items()},
+    )
+    table = edited.reindex(columns=list(columns)).fillna("").astype(str).apply(lambda column: column.str.strip())
+    return table[table.ne("").any(axis=1)].reset_index(drop=True)
+
+
+def _record_label(kind, record):
+    if kind == "course":
+        record_id, code, name, url = record
+        return record_id, f"{name} ({code})" if code else name or url
+    record_id, _, headline, url = record
+    return record_id, headline or url
+
+
+def saved_record(kind, key):
+    """Sidebar picker over the project store; returns the fields of the record loaded into form ``key``, or ``{}``.
+
+    ``kind`` is a CLI kind ("full-course", "article"...): courses are shared
+    by every course form, posts belong to the form they were saved from.
+    Typing searches names, codes, descriptions and FAQs; otherwise every
+    course (by name) or post (most recent first) is listed. Loaded fields
+    are the widgets' new defaults, so the form shows them until edited.
+    """
+    store = default_store()
+    record_kind = "post" if kind in POST_KINDS else "course"
+    state_key = f"saved_{key}"
+    with st.sidebar:
+        st.subheader("📂 Project Store")
+        listed = store.posts(kind) if record_kind == "post" else store.courses()
+        records = dict(_record_label(record_kind, record) for record in listed)
+        query = st.text_input(f"Search saved {record_kind}s", key=f"{state_key}_query")
+        if query:
+            records = {record_id: title for _, record_id, title in store.search(query, kind=record_kind, limit=50)
+                       if record_id in records}
+        choice = st.selectbox(f"Saved {record_kind}s ({len(records)})", list(records), format_func=records.get,
+                              index=None, placeholder="Choose one to load", key=f"{state_key}_choice")
+        if st.button("📂 Load", disabled=choice is None, key=f"{state_key}_load"):
+            st.session_state[state_key] = (store.post_fields(choice) if record_kind == "post"
+                                           else store.course_fields(choice))
+    return st.session_state.get(state_key, {})
+
+
+def saved_value(saved, key, default, parse=None):
+    """A loaded field as a widget default: ``default`` when it is missing, blank or ``parse`` rejects it.
+
+    Records can come from another form or an earlier version of this one
+    ("₹5000" where a number is expected, a date that is not ISO), and a
+    widget given a value it cannot take stops the whole script.
+    """
+    value = saved.get(key)
+    if value is None or value == "":
+        return default
+    if parse is None:
+        return value
+    try:
+        return parse(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def saved_choices(options):
+    """A ``saved_value`` parser for a multiselect: the stored list (or single value) limited to ``options``."""
+    def parse(value):
+        chosen = [item for item in ([value] if isinstance(value, str) else value) if item in options]
+        if not chosen:
+            raise ValueError(value)
+        return chosen
+    return parse
+
+
+def save_button(kind, fields):
+    """A "Save to project store" button for a form's generator ``fields``; ``kind`` as for ``saved_record``."""
+    if not st.button("💾 Save to Project Store", key=f"save_{kind}"):
+        return
+    store = default_store()
+    try:
+        if kind in POST_KINDS:
+            store.save_post(kind, fields)
+        else:
+            store.save_course(fields)
+    except ValueError as e:
+        st.error(f"Not saved: {e}")
+    else:
+        st.success(f"💾 Saved to the project store ({store.path})")
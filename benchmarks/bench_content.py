@@ -0,0 +1,95 @@
+"""Benchmark main-content extraction: text analysed, keyword quality and FAQ noise per page.
+
+    python benchmarks/bench_content.py [--repeat 3]
+
+Two layouts from the fixture corpus: the WordPress pages as generated
+(``<article>`` with ``.entry-content``), and the same pages with the
+``<main>`` / ``<article>`` tags and the ``entry-content`` class renamed, so
+neither the pre-parse narrowing nor a known selector applies and the
+density scorer (then the learned per-host selector) has to find the body.
+
+"whole text" is the previous analysis input, ``soup.get_text()`` of the
+parsed page; "main content" is ``schemagen.content``. Keyword precision is
+the share of the top-10 terms that are also in the top 10 of the true
+article body (the ``.entry-content`` text of the original page); FAQ noise
+counts detected questions that are not in the body.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import corpus  # noqa: E402
+from schemagen.content import main_content, main_text  # noqa: E402
+from schemagen.extract import PARSER, parse_html  # noqa: E402
+from schemagen.faq import extract_faqs  # noqa: E402
+from schemagen.keywords import count_terms, score_counts  # noqa: E402
+
+TOP_K = 10
+NO_LIMIT = 10**6  # count every detected question, not just the first MAX_FAQS
+
+
+def no_article(html):
+    """The page without the anchors the fast paths rely on."""
+    return (html.replace("<main ", "<div ").replace("</main>", "</div>")
+                .replace("<article ", "<div ").replace("</article>", "</div>")
+                .replace("entry-content", "post-copy"))
+
+
+def top_terms(text):
+    return set(score_counts([count_terms(text.lower())], None, top_k=TOP_K)[0])
+
+
+def whole_text(html, host):
+    soup = parse_html(html)
+    return soup.get_text(separator=" "), extract_faqs(soup, limit=NO_LIMIT)
+
+
+def main_content_text(html, host):
+    soup = parse_html(html)
+    content = main_content(soup, host)
+    return main_text(content), extract_faqs(soup, limit=NO_LIMIT, content=content)
+
+
+def measure(fn, pages, truth, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outputs = [fn(html, "bench.example") for _, html in pages]
+        best = min(best, time.perf_counter() - start)
+    chars = sum(len(text) for text, _ in outputs) / len(pages)
+    precision = sum(len(top_terms(text) & gold_terms) / TOP_K
+                    for (text, _), (gold_terms, _) in zip(outputs, truth)) / len(pages)
+    noise = sum(sum(q not in gold_questions for q, _ in faqs)
+                for (_, faqs), (_, gold_questions) in zip(outputs, truth)) / len(pages)
+    return best, chars, precision, noise
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    pages = corpus.load()
+    truth = []
+    for _, html in pages:
+        body = BeautifulSoup(html, PARSER).select_one(".entry-content")
+        truth.append((top_terms(body.get_text(" ")), {q for q, _ in extract_faqs(body, limit=NO_LIMIT)}))
+
+    print(f"corpus: {len(pages)} pages, parser: {PARSER}")
+    print(f"{'layout':<14}{'analysis':<14}{'ms/page':>9}{'KB text':>9}{'kw prec':>9}{'FAQ noise':>11}")
+    for layout, transform in (("wordpress", None), ("no <article>", no_article)):
+        variant = [(name, transform(html) if transform else html) for name, html in pages]
+        for name, fn in (("whole text", whole_text), ("main content", main_content_text)):
+            seconds, chars, precision, noise = measure(fn, variant, truth, args.repeat)
+            print(f"{layout:<14}{name:<14}{1000 * seconds / len(pages):>9.1f}{chars / 1024:>9.1f}"
+                  f"{precision:>9.2f}{noise:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark bulk crawl throughput (pages/second) against the number of worker processes.
+
+    python benchmarks/bench_engine.py [--pages 96] [--processes 0 1 2 4] [--chunk-size 2]
+
+The corpus is served from a local HTTP server so downloads cost next to
+nothing and the crawl is CPU-bound, which is the case the process pool is
+for. ``0`` processes is the thread-only crawl. Each page is requested under
+its own query string so every URL is parsed afresh, and no page cache is
+used.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import corpus  # noqa: E402
+from schemagen.crawl import crawl  # noqa: E402
+from schemagen.keywords import CorpusStats  # noqa: E402
+from schemagen.schedule import Scheduler  # noqa: E402
+from stub_server import serve  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=96)
+    parser.add_argument("--processes", type=int, nargs="+", default=[0, 1, 2, 4])
+    parser.add_argument("--threads", type=int, default=8, help="download threads")
+    parser.add_argument("--chunk-size", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    pages = {f"/{name}": html.encode("utf-8") for name, html in corpus.load()}
+    server = serve(pages)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    paths = sorted(pages)
+    urls = [f"{base}{paths[i % len(paths)]}?n={i}" for i in range(args.pages)]
+
+    print(f"{args.pages} pages, {sum(map(len, pages.values())) / len(pages) / 1024:.0f} KB average, "
+          f"{os.cpu_count()} CPUs")
+    print(f"{'processes':>10}{'seconds':>10}{'pages/s':>10}{'failed':>8}")
+    try:
+        for processes in args.processes:
+            start = time.perf_counter()
+            # No politeness limits against the local server: measure parsing, not the rate limiter
+            scheduler = Scheduler(rate=1e6, burst=len(urls), per_host=args.threads, respect_robots=False)
+            results = list(crawl(urls, "Excel", workers=args.threads, stats=CorpusStats(), scheduler=scheduler,
+                                 processes=processes, chunk_size=args.chunk_size))
+            elapsed = time.perf_counter() - start
+            failed = sum(not r.ok for r in results)
+            print(f"{processes:>10}{elapsed:>10.2f}{len(results) / elapsed:>10.1f}{failed:>8}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
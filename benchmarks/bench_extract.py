@@ -0,0 +1,82 @@
+"""Benchmark the blog extractor against the original inline implementation.
+
+    python benchmarks/bench_extract.py [--repeat 3]
+
+``legacy_extract`` is the extraction code as it stood in
+``blog_auto_schema_generator.py`` before the fast path: ``html.parser`` over
+the whole document, one ``soup.find`` per meta field, and ``find_next`` for
+every FAQ candidate.
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from collections import Counter
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import corpus  # noqa: E402
+from schemagen.blog import extract_blog_schema  # noqa: E402
+from schemagen.extract import PARSER  # noqa: E402
+
+
+def legacy_extract(html):
+    soup = BeautifulSoup(html, "html.parser")
+
+    def meta(prop, attr="property"):
+        tag = soup.find("meta", attrs={attr: prop})
+        return tag["content"].strip() if tag and tag.has_attr("content") else None
+
+    extracted = {
+        "title": meta("og:title") or (soup.title.string.strip() if soup.title else None),
+        "description": meta("og:description") or meta("description", "name"),
+        "image": meta("og:image"),
+        "author": meta("author", "name"),
+        "published": meta("article:published_time"),
+        "modified": meta("article:modified_time"),
+        "keywords": meta("keywords", "name")
+    }
+    content_text = soup.get_text(separator=" ").lower()
+    word_freq = Counter(re.findall(r"[a-zA-Z]{4,}", content_text))
+    faq_items = []
+    for tag in soup.find_all(["h2", "h3", "strong", "details", "summary", "p"]):
+        text = tag.get_text().strip()
+        if "?" in text or text.lower().startswith(("q:", "question")):
+            next_tag = tag.find_next(["p", "div"])
+            faq_items.append((text, next_tag.get_text().strip() if next_tag else None))
+    return extracted, word_freq.most_common(25), faq_items
+
+
+def best_of(fn, pages, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _, html in pages:
+            fn(html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    pages = corpus.load()
+    total_mb = sum(len(html) for _, html in pages) / 1e6
+    legacy = best_of(legacy_extract, pages, args.repeat)
+    fast = best_of(lambda html: extract_blog_schema("https://example.com/post/", "Advanced Excel", html), pages, args.repeat)
+
+    print(f"corpus: {len(pages)} pages, {total_mb:.1f} MB, fast-path parser: {PARSER}")
+    print(f"{'implementation':<16}{'total s':>10}{'ms/page':>10}{'MB/s':>8}")
+    for name, seconds in (("legacy", legacy), ("fast path", fast)):
+        print(f"{name:<16}{seconds:>10.3f}{1000 * seconds / len(pages):>10.1f}{total_mb / seconds:>8.1f}")
+    print(f"speedup: {legacy / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark FAQ detection on pages with hundreds of question headings.
+
+    python benchmarks/bench_faq.py [--sizes 100 300 1000] [--repeat 3]
+
+Compares ``schemagen.faq.extract_faqs`` with the original per-tag
+``find_next`` loop. Parsing is done once per page outside the timed region so
+only the FAQ pass is measured.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from schemagen.extract import parse_html  # noqa: E402
+from schemagen.faq import extract_faqs  # noqa: E402
+
+
+def legacy_faqs(soup):
+    faq_items = []
+    for tag in soup.find_all(["h2", "h3", "strong", "details", "summary", "p"]):
+        text = tag.get_text().strip()
+        if "?" in text or text.lower().startswith(("q:", "question")):
+            next_tag = tag.find_next(["p", "div"])
+            faq_items.append((text, next_tag.get_text().strip() if next_tag else None))
+    return faq_items
+
+
+def make_page(headings):
+    """Question headings, question-like paragraphs and accordions, like our long FAQ posts."""
+    parts = ["<html><head><title>FAQ</title></head><body><article>"]
+    for i in range(headings):
+        parts.append(f"<h2>What is topic {i}?</h2>")
+        if i % 2:
+            parts.append(f"<p><strong>Q: Why does step {i} matter?</strong></p><p>Is it really needed for {i}?</p>")
+        if i % 5 == 0:
+            parts.append(f"<details><summary>How do I try {i}?</summary><p>Open the workbook.</p></details>")
+        parts.append(f"<div class=\"answer\"><p>Topic {i} is explained with an example.</p></div>")
+    parts.append("</article></body></html>")
+    return "".join(parts)
+
+
+def best_of(fn, soup, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(soup)
+        best = min(best, time.perf_counter() - start)
+    return best, len(result)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 300, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'headings':>9}{'legacy ms':>12}{'pairs':>7}{'new ms':>10}{'pairs':>7}{'speedup':>9}")
+    for size in args.sizes:
+        soup = parse_html(make_page(size))
+        legacy, legacy_pairs = best_of(legacy_faqs, soup, args.repeat)
+        new, new_pairs = best_of(lambda s: extract_faqs(s, limit=10 ** 6), soup, args.repeat)
+        print(f"{size:>9}{legacy * 1000:>12.1f}{legacy_pairs:>7}{new * 1000:>10.1f}{new_pairs:>7}{legacy / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Benchmark ingestion: HTML scraping from a sitemap vs. the WordPress REST API, cold and re-run.
+
+    python benchmarks/bench_ingest.py [--posts 300] [--latency 0.05] [--missing 0.05]
+
+A stub server plays a WordPress site: every post as a full HTML page, a
+gzipped post sitemap (with ``<lastmod>``) behind a sitemap index, and
+a ``/wp-json/wp/v2/posts`` endpoint serving the same posts. A
+``--missing`` share of posts has no featured image in the API, so those
+fall back to fetching the page. Each source is refreshed into its own
+output directory twice: the cold run generates everything, the re-run
+should skip everything from ``<lastmod>`` / ``modified_gmt`` alone.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import corpus  # noqa: E402
+from schemagen.crawl import CHANGED, FAILED, SKIPPED, UNCHANGED, iter_sitemap, refresh, refresh_posts  # noqa: E402
+from schemagen.extract import collect_meta, parse_html  # noqa: E402
+from schemagen.keywords import CorpusStats  # noqa: E402
+from schemagen.schedule import Scheduler  # noqa: E402
+from stub_server import serve  # noqa: E402
+
+API_PATH = "/wp-json/wp/v2/posts"
+JSON = "application/json; charset=UTF-8"
+
+
+def _post(html):
+    soup = parse_html(html)
+    metas = collect_meta(soup)
+    content = soup.select_one(".entry-content")
+    title = metas[("property", "og:title")]
+    return {
+        "title": {"rendered": title},
+        "excerpt": {"rendered": f"<p>{metas[('name', 'description')]} [&hellip;]</p>"},
+        "content": {"rendered": content.decode_contents()},
+        "date_gmt": "2025-03-14T04:00:00",
+        "modified_gmt": "2025-06-02T05:30:00",
+        "yoast_head_json": {"og_title": title, "og_description": metas[("property", "og:description")],
+                            "author": "Siddharth Parakh"},
+        "_embedded": {"author": [{"name": "Siddharth Parakh"}],
+                      "wp:featuredmedia": [{"source_url": metas[("property", "og:image")]}],
+                      "wp:term": [[{"taxonomy": "category", "name": "Advanced Excel"}],
+                                  [{"taxonomy": "post_tag", "name": "Excel"}, {"taxonomy": "post_tag", "name": "Finance"}]]},
+    }
+
+
+def build_site(n, missing, base, seed=2025):
+    """``(pages, posts)``: the HTML pages and sitemaps by path, and the posts the API serves."""
+    rng = random.Random(seed)
+    source = corpus.load()
+    pages, posts = {}, []
+    templates = {}
+    for i in range(n):
+        name, html = source[i % len(source)]
+        pages[f"/post-{i:04d}/"] = html.encode("utf-8")
+        if name not in templates:
+            templates[name] = _post(html)
+        post = json.loads(json.dumps(templates[name]))
+        post.update(id=i + 1, link=f"{base}/post-{i:04d}/")
+        if rng.random() < missing:
+            del post["_embedded"]["wp:featuredmedia"]
+        posts.append(post)
+    urls = "".join(f"<url><loc>{p['link']}</loc><lastmod>{p['modified_gmt']}+00:00</lastmod></url>" for p in posts)
+    sitemap = f'<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+    pages["/post-sitemap.xml.gz"] = ("application/x-gzip", gzip.compress(sitemap.encode("utf-8")))
+    pages["/sitemap_index.xml"] = ("application/xml", (
+        '<?xml version="1.0"?><sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        f"<sitemap><loc>{base}/post-sitemap.xml.gz</loc></sitemap></sitemapindex>").encode("utf-8"))
+    return pages, posts
+
+
+class WordPressStub(dict):
+    """Pages by path, plus ``/wp-json/wp/v2/posts`` answering ``page``, ``per_page``, ``include`` and ``_fields``."""
+
+    def __init__(self, pages, posts):
+        super().__init__(pages)
+        self.posts = posts
+
+    def get(self, path, default=None):
+        if not path.startswith(API_PATH + "?"):
+            return super().get(path, default)
+        query = {key: values[0] for key, values in parse_qs(urlsplit(path).query).items()}
+        posts = self.posts
+        if "include" in query:
+            ids = {int(i) for i in query["include"].split(",")}
+            posts = [post for post in posts if post["id"] in ids]
+        per_page, number = int(query.get("per_page", 10)), int(query.get("page", 1))
+        posts = posts[(number - 1) * per_page:number * per_page]
+        if "_fields" in query:
+            fields = query["_fields"].split(",")
+            posts = [{key: post[key] for key in fields if key in post} for post in posts]
+        return JSON, json.dumps(posts).encode("utf-8")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per response")
+    parser.add_argument("--missing", type=float, default=0.05, help="share of posts without a featured image")
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    site = WordPressStub({}, [])
+    server = serve(site, latency=args.latency)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    pages, site.posts = build_site(args.posts, args.missing, base)
+    site.update(pages)
+    print(f"{args.posts} posts, {args.latency * 1000:.0f} ms latency, {args.missing:.0%} missing a field")
+    print(f"{'source':<10}{'run':<8}{'requests':>9}{'MB':>8}{'seconds':>9}{'changed':>9}{'skipped':>9}{'failed':>8}")
+    try:
+        for source in ("sitemap", "rest-api"):
+            out_dir = tempfile.mkdtemp(prefix=f"bench-ingest-{source}-")
+            for run in ("cold", "re-run"):
+                scheduler = Scheduler(rate=1e6, burst=args.posts, per_host=args.threads, respect_robots=False)
+                requests_before, bytes_before = server.requests, server.bytes_sent
+                counts = dict.fromkeys([SKIPPED, CHANGED, UNCHANGED, FAILED], 0)
+                start = time.perf_counter()
+                if source == "sitemap":
+                    entries = list(iter_sitemap(f"{base}/sitemap_index.xml", scheduler=scheduler))
+                    results = refresh([e.url for e in entries], "Advanced Excel", out_dir, workers=args.threads,
+                                      stats=CorpusStats(), processes=0, scheduler=scheduler,
+                                      lastmods={e.url: e.lastmod for e in entries})
+                else:
+                    results = refresh_posts(base, "Advanced Excel", out_dir, workers=args.threads,
+                                            stats=CorpusStats(), processes=0, scheduler=scheduler)
+                for result in results:
+                    counts[result.status] += 1
+                elapsed = time.perf_counter() - start
+                print(f"{source:<10}{run:<8}{server.requests - requests_before:>9}"
+                      f"{(server.bytes_sent - bytes_before) / 1e6:>8.1f}{elapsed:>9.2f}"
+                      f"{counts[CHANGED] + counts[UNCHANGED]:>9}{counts[SKIPPED]:>9}{counts[FAILED]:>8}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark JSON-LD serialisation: stdlib indent=2 vs. compact vs. orjson.
+
+    python benchmarks/bench_output.py [--docs 20000] [--repeat 3]
+
+Schemas are built once from the fixture corpus and cycled to ``--docs``
+documents, each serialised with ``schemagen.output.dumps`` and written to
+``os.devnull`` so the numbers measure serialisation rather than disk or
+deflate. Throughput is output bytes per second; the last line runs the
+same documents through ``JsonlSink`` as the CLI does.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import corpus  # noqa: E402
+from schemagen.blog import extract_blog_schema  # noqa: E402
+from schemagen.output import JsonlSink, dumps, orjson  # noqa: E402
+
+VARIANTS = (
+    ("json indent=2", False, "json"),
+    ("json compact", True, "json"),
+    ("orjson indent=2", False, "orjson"),
+    ("orjson compact", True, "orjson"),
+)
+
+
+def best_of(write, schemas, docs, repeat):
+    best, size = float("inf"), 0
+    for _ in range(repeat):
+        with open(os.devnull, "wb") as sink:
+            start = time.perf_counter()
+            size = 0
+            for i in range(docs):
+                data = write(schemas[i % len(schemas)])
+                sink.write(data)
+                size += len(data)
+            best = min(best, time.perf_counter() - start)
+    return best, size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    schemas = [extract_blog_schema(f"https://example.com/{name}", "Advanced Excel", html)[0]
+               for name, html in corpus.load()]
+    print(f"{args.docs} documents cycled from {len(schemas)} corpus schemas")
+    print(f"{'serialiser':<18}{'MB out':>9}{'seconds':>9}{'MB/s':>8}{'docs/s':>10}")
+    baseline = None
+    for name, compact, backend in VARIANTS:
+        if backend == "orjson" and orjson is None:
+            print(f"{name:<18}  skipped (pip install orjson)")
+            continue
+        seconds, size = best_of(lambda schema: dumps(schema, compact, backend), schemas, args.docs, args.repeat)
+        baseline = baseline or seconds
+        print(f"{name:<18}{size / 1e6:>9.1f}{seconds:>9.2f}{size / 1e6 / seconds:>8.1f}{args.docs / seconds:>10.0f}"
+              f"  ({baseline / seconds:.1f}x)")
+
+    # End to end through the JSONL sink, as the CLI writes it
+    start = time.perf_counter()
+    with JsonlSink(os.devnull) as sink:
+        for i in range(args.docs):
+            sink.write(None, schemas[i % len(schemas)])
+    seconds = time.perf_counter() - start
+    print(f"{'JsonlSink (auto)':<18}{sink.bytes / 1e6:>9.1f}{seconds:>9.2f}{sink.bytes / 1e6 / seconds:>8.1f}"
+          f"{args.docs / seconds:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark the ASGI service: requests/second for cold and cached blog URLs.
+
+    pip install -r requirements-service.txt
+    python benchmarks/bench_service.py [--urls 24] [--requests 2000] [--concurrency 64]
+
+A local stub HTTP server stands in for the blog (serving the fixture
+corpus) and the service runs under uvicorn in a separate process, so the
+load generator does not share its GIL. The cold pass requests every URL
+once (fetch + parse); the cached pass then sends ``--requests`` requests
+spread over the same URLs from ``--concurrency`` keep-alive connections.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import corpus  # noqa: E402
+from stub_server import serve  # noqa: E402
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _post(reader, writer, port, body):
+    """One keep-alive HTTP/1.1 POST; a bare client so the load generator stays cheap."""
+    writer.write(b"POST /schema/blog HTTP/1.1\r\nHost: 127.0.0.1:%d\r\nContent-Type: application/json\r\n"
+                 b"Content-Length: %d\r\n\r\n%s" % (port, len(body), body))
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def hammer(port, urls, total, concurrency):
+    bodies = [json.dumps({"url": url, "category": "Excel"}).encode("utf-8") for url in urls]
+    jobs = [bodies[i % len(bodies)] for i in range(total)][::-1]
+    latencies = []
+    errors = 0
+
+    async def client_loop():
+        nonlocal errors
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            while jobs:
+                body = jobs.pop()
+                start = time.perf_counter()
+                status = await _post(reader, writer, port, body)
+                latencies.append(time.perf_counter() - start)
+                errors += status != 200
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return elapsed, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)], errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--urls", type=int, default=24)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    pages = {f"/{name}": html.encode("utf-8") for name, html in corpus.load()}
+    blog = serve(pages)
+    paths = sorted(pages)
+    urls = [f"http://127.0.0.1:{blog.server_address[1]}{paths[i % len(paths)]}?n={i}" for i in range(args.urls)]
+
+    port = free_port()
+    env = dict(os.environ, SCHEMAGEN_CACHE_DIR=tempfile.mkdtemp(prefix="schemagen-bench-"),
+               SCHEMAGEN_ALLOW_PRIVATE_URLS="1")  # the stub blog is on 127.0.0.1
+    server = subprocess.Popen([sys.executable, "-m", "uvicorn", "schemagen.service:app", "--port", str(port),
+                               "--log-level", "warning"], cwd=ROOT, env=env)
+    while True:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/healthz")
+            break
+        except OSError:
+            time.sleep(0.1)
+
+    print(f"{'pass':>8}{'requests':>10}{'seconds':>9}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'errors':>8}")
+    try:
+        for name, total, concurrency in (("cold", len(urls), min(args.concurrency, len(urls))),
+                                         ("cached", args.requests, args.concurrency)):
+            elapsed, p50, p99, errors = asyncio.run(hammer(port, urls, total, concurrency))
+            print(f"{name:>8}{total:>10}{elapsed:>9.2f}{total / elapsed:>9.0f}{p50 * 1000:>9.1f}{p99 * 1000:>9.1f}{errors:>8}")
+    finally:
+        server.terminate()
+        server.wait()
+        blog.shutdown()
+
+
+if __name__ == "__main__":
+    main()
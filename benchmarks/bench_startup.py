@@ -0,0 +1,129 @@
+"""Cold-start budget: import time, first-render time and memory of each app and the CLI, from ``python -X importtime``.
+
+    python benchmarks/bench_startup.py             # report
+    python benchmarks/bench_startup.py --check     # exit 1 if an entry point is over budget
+    python benchmarks/bench_startup.py --check --scale 2   # on a slower machine
+
+Each entry point runs in a fresh interpreter under ``-X importtime``: an
+app script is executed the way Streamlit first renders it (in bare mode,
+no button clicked), the CLI is imported. Reported per entry point:
+
+* ``import ms`` — the cumulative time of the modules it imported (sum of
+  the top-level ``-X importtime`` entries), interpreter start-up excluded;
+* ``render ms`` — wall time of running the script or import;
+* ``RSS MB`` — peak resident memory above an interpreter that runs nothing.
+
+``--check`` fails when ``import ms`` exceeds ``BUDGETS`` (times ``--scale``)
+or when a module in ``FORBIDDEN`` was loaded: the form apps must render
+without the HTML stack, the blog app without it or pandas until a run
+starts, and the CLI without Streamlit. The forbidden modules are the part
+that does not depend on the machine; the times are best of ``--repeat``.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HTML_STACK = ("requests", "bs4", "lxml", "numpy")
+# entry point -> budget for "import ms" on a typical 2-vCPU container
+BUDGETS = {
+    "GenerateSchema.py": 450,
+    "GenerateSchemaFAQ.py": 1000,
+    "GenerateSchemaBlog.py": 1000,
+    "GenerateEduSchema_Pro_Max.py": 1150,  # ~100 ms of it is Streamlit's emoji table, checking page_icon
+    "blog_auto_schema_generator.py": 400,
+    "schemagen.cli": 60,
+}
+# Modules that must not be loaded by the first render / import
+FORBIDDEN = {
+    "GenerateSchema.py": HTML_STACK + ("pandas",),
+    "GenerateSchemaFAQ.py": ("requests", "bs4", "lxml"),  # its tables need pandas
+    "GenerateSchemaBlog.py": ("requests", "bs4", "lxml"),
+    "GenerateEduSchema_Pro_Max.py": ("requests", "bs4", "lxml"),
+    "blog_auto_schema_generator.py": HTML_STACK + ("pandas",),
+    "schemagen.cli": HTML_STACK + ("streamlit", "pandas"),
+}
+
+RUNNER = """
+import json, os, resource, sys, time
+sys.path.insert(0, {root!r})
+os.chdir({root!r})
+start = time.perf_counter()
+target = {target!r}
+if target.endswith(".py"):
+    import runpy
+    runpy.run_path(target, run_name="__main__")
+elif target:
+    __import__(target)
+seconds = time.perf_counter() - start
+print("STARTUP " + json.dumps({{"seconds": seconds, "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                                "modules": sorted(sys.modules)}}))
+"""
+
+
+def run(target):
+    """``(imports, result)``: top-level ``-X importtime`` entries ``{module: cumulative µs}`` and the runner's report."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", RUNNER.format(root=ROOT, target=target)],
+                          capture_output=True, text=True, env=env, cwd=ROOT)
+    report = next((line for line in proc.stdout.splitlines() if line.startswith("STARTUP ")), None)
+    if report is None:
+        raise RuntimeError(f"{target or 'baseline'} failed:\n{proc.stderr[-2000:]}")
+    imports = {}
+    for line in proc.stderr.splitlines():  # "import time: self | cumulative | name", nested names indented
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if not name.startswith("  "):
+                imports[name.strip()] = int(cumulative)
+    return imports, json.loads(report[len("STARTUP "):])
+
+
+def measure(target, baseline, repeat):
+    best = None
+    for _ in range(repeat):
+        imports, result = run(target)
+        import_ms = sum(us for name, us in imports.items() if name not in baseline["imports"]) / 1000
+        row = {
+            "import_ms": import_ms,
+            "render_ms": 1000 * result["seconds"],
+            "rss_mb": (result["rss_kb"] - baseline["rss_kb"]) / 1024,
+            "modules": set(result["modules"]),
+        }
+        if best is None or row["import_ms"] < best["import_ms"]:
+            best = row
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="exit 1 if an entry point is over budget")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply the time budgets (slower machines)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("targets", nargs="*", default=list(BUDGETS), help="entry points (default: all)")
+    args = parser.parse_args(argv)
+
+    imports, result = run("")
+    baseline = {"imports": set(imports), "rss_kb": result["rss_kb"]}
+    failures = []
+    print(f"{'entry point':<32}{'import ms':>10}{'budget':>8}{'render ms':>10}{'RSS MB':>8}  forbidden loaded")
+    for target in args.targets:
+        row = measure(target, baseline, args.repeat)
+        budget = BUDGETS.get(target, float("inf")) * args.scale
+        loaded = sorted(name for name in FORBIDDEN.get(target, ()) if name in row["modules"])
+        print(f"{target:<32}{row['import_ms']:>10.0f}{budget:>8.0f}{row['render_ms']:>10.0f}{row['rss_mb']:>8.1f}"
+              f"  {', '.join(loaded) or '-'}")
+        if row["import_ms"] > budget:
+            failures.append(f"{target}: imports take {row['import_ms']:.0f} ms, budget {budget:.0f} ms")
+        if loaded:
+            failures.append(f"{target}: loads {', '.join(loaded)} before it is needed")
+    for failure in failures:
+        print(f"OVER BUDGET {failure}", file=sys.stderr)
+    return 1 if args.check and failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
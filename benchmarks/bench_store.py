@@ -0,0 +1,106 @@
+"""Benchmark the project store: saving course forms, indexed lookup, full-text search and regenerating from rows.
+
+    python benchmarks/bench_store.py [--courses 500] [--lookups 2000]
+
+Courses are Pro Max form values for one institute and a handful of
+instructors, each with a distinct code, URL, description and a few FAQs.
+Lookups by code and URL go through the indexes; "scan" is the same lookup
+over the decoded ``fields`` of every row, i.e. what a store without
+indexed columns would have to do. Search runs FTS5 prefix queries, and the
+``LIKE`` fallback, over the same records: FTS5 ranks every match (BM25),
+``LIKE`` returns the first ones it finds in table order, so on queries
+matching most rows it can be the faster of the two.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from schemagen.cli import generate  # noqa: E402
+from schemagen.store import ProjectStore  # noqa: E402
+
+SUBJECTS = ["Excel", "Power BI", "Tally", "Python", "Photoshop", "AutoCAD", "Web Design", "Accounting", "SQL", "Word"]
+LEVELS = ["Basics", "Advanced", "Professional", "Dashboards", "Automation"]
+WORDS = ("formulas pivot tables charts macros reports dashboards ledgers vouchers scripts layers drawings "
+         "queries joins styles templates shortcuts").split()
+
+
+def course_forms(n, seed=2025):
+    rng = random.Random(seed)
+    for i in range(n):
+        subject = SUBJECTS[i % len(SUBJECTS)]
+        name = f"{subject} {LEVELS[i // len(SUBJECTS) % len(LEVELS)]} {i}"
+        yield {
+            "inst_id": "https://futurevisioncomputers.com/#organization", "inst_name": "Future Vision Computer Institute",
+            "inst_url": "https://futurevisioncomputers.com/", "inst_phone": "+91 98765 43210",
+            "course_name": name, "course_code": f"FV-{i:04d}",
+            "course_url": f"https://futurevisioncomputers.com/courses/fv-{i:04d}/",
+            "course_desc": f"{name}: " + " ".join(rng.choices(WORDS, k=30)),
+            "topics": ", ".join(rng.sample(WORDS, 4)), "keywords": subject,
+            "instructor_name": f"Instructor {i % 7}", "instructor_desc": "Certified trainer.",
+            "faqs": [(f"What does {name} cover?", " ".join(rng.choices(WORDS, k=12))) for _ in range(3)],
+        }
+
+
+def timed(fn, n):
+    start = time.perf_counter()
+    for i in range(n):
+        fn(i)
+    return (time.perf_counter() - start) / n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--courses", type=int, default=500)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    forms = list(course_forms(args.courses))
+    store = ProjectStore(os.path.join(tempfile.mkdtemp(prefix="bench-store-"), "projects.sqlite3"))
+    rng = random.Random(7)
+    print(f"{args.courses} courses")
+    print(f"{'operation':<28}{'per op ms':>10}{'ops/s':>10}")
+
+    def row(name, seconds):
+        print(f"{name:<28}{1000 * seconds:>10.3f}{1 / seconds:>10.0f}")
+
+    row("save (new)", timed(lambda i: store.save_course(forms[i]), len(forms)))
+    row("save (update)", timed(lambda i: store.save_course(forms[rng.randrange(len(forms))]), len(forms)))
+
+    codes = [forms[rng.randrange(len(forms))]["course_code"] for _ in range(args.lookups)]
+    urls = [forms[rng.randrange(len(forms))]["course_url"] for _ in range(args.lookups)]
+    row("find by code (index)", timed(lambda i: store.find_course(code=codes[i]), args.lookups))
+    row("find by URL (index)", timed(lambda i: store.find_course(url=urls[i]), args.lookups))
+
+    def scan(i):
+        for course_id, fields in store._query("SELECT id, fields FROM courses"):
+            if json.loads(fields).get("course_code") == codes[i]:
+                return course_id
+
+    row("find by code (scan)", timed(scan, min(args.lookups, 100)))
+    row("course fields", timed(lambda i: store.course_fields(i % len(forms) + 1), args.lookups))
+
+    # What an editor types: part of a course name, a subject, or two words of a description
+    queries = ([f"{rng.choice(SUBJECTS)} {rng.choice(LEVELS)}".lower() for _ in range(100)]
+               + [subject.lower()[:4] for subject in SUBJECTS] * 10 + [" ".join(rng.sample(WORDS, 2)) for _ in range(100)])
+    hits = sum(len(store.search(q)) for q in queries)
+    row(f"search FTS5 ({hits / len(queries):.0f} hits)", timed(lambda i: store.search(queries[i]), len(queries)))
+    store.full_text = False
+    row("search LIKE", timed(lambda i: store.search(queries[i]), len(queries)))
+
+    start = time.perf_counter()
+    documents = [generate("full-course", fields) for fields in store.rows("full-course")]
+    seconds = time.perf_counter() - start
+    print(f"regenerated {len(documents)} courses from the store in {seconds:.2f}s "
+          f"({len(documents) / seconds:.0f}/s, rows read and generated)")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark taxonomy matching: ms/page as the vocabulary grows, per-term scans vs. the compiled matcher.
+
+    python benchmarks/bench_taxonomy.py [--pages 4] [--repeat 3]
+
+The text is the main content of the first ``--pages`` fixture pages. Vocabularies are the
+five audience words the extractor used to check, the shipped
+``taxonomy.json``, and that file padded with synthetic course names to
+about 2,000 terms. "substring scan" is the previous ``term in text`` per
+term (no word boundaries, no counts); "regex per term" is a word-bounded
+``findall`` per term, which gives the same counts as the matcher. Slow
+methods are timed once rather than ``--repeat`` times.
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import corpus  # noqa: E402
+from schemagen.content import main_content, main_text  # noqa: E402
+from schemagen.extract import parse_html  # noqa: E402
+from schemagen.taxonomy import TermMatcher, load_taxonomy  # noqa: E402
+
+LARGE = 2000
+
+
+def vocabularies():
+    shipped = dict(load_taxonomy().matcher.terms)
+    large = dict(shipped)
+    for i in range(LARGE - len(shipped)):
+        large[f"{corpus.WORDS[i % len(corpus.WORDS)]} level {i} course"] = [("courses", f"Course {i}")]
+    return {
+        "5 audience words": {t: [("audience", t.title())] for t in
+                             ("students", "professionals", "analysts", "learners", "developers")},
+        f"taxonomy.json ({len(shipped)})": shipped,
+        f"padded ({len(large)})": large,
+    }
+
+
+def substring_scan(terms):
+    return lambda text: [term for term in terms if term in text]
+
+
+def regex_per_term(terms):
+    patterns = [(term, re.compile(r"(?<!\w)" + re.escape(term) + r"(?!\w)")) for term in terms]
+    return lambda text: {term: len(p.findall(text)) for term, p in patterns}
+
+
+def compiled_matcher(terms):
+    matcher = TermMatcher(terms)
+    return matcher.count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    texts = []
+    for _, html in corpus.load()[:args.pages]:
+        soup = parse_html(html)
+        texts.append(main_text(main_content(soup)).lower())
+    print(f"corpus: {len(texts)} pages, {sum(map(len, texts)) / len(texts) / 1024:.1f} KB text/page")
+    print(f"{'vocabulary':<22}{'method':<18}{'build ms':>9}{'ms/page':>9}")
+    for vocab_name, terms in vocabularies().items():
+        for method, make in (("substring scan", substring_scan), ("regex per term", regex_per_term),
+                             ("compiled matcher", compiled_matcher)):
+            start = time.perf_counter()
+            fn = make(terms)
+            build = time.perf_counter() - start
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                for text in texts:
+                    fn(text)
+                best = min(best, time.perf_counter() - start)
+                if best > 5:
+                    break
+            print(f"{vocab_name:<22}{method:<18}{1000 * build:>9.1f}{1000 * best / len(texts):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
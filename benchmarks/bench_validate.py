@@ -0,0 +1,57 @@
+"""Benchmark the rich-result validator: documents/second by schema kind.
+
+    python benchmarks/bench_validate.py [--docs 20000]
+
+Blog graphs come from the fixture corpus; course and article documents from
+the CLI generators with representative form values.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import corpus  # noqa: E402
+from schemagen.blog import extract_blog_schema  # noqa: E402
+from schemagen.cli import generate  # noqa: E402
+from schemagen.validate import validate_all  # noqa: E402
+
+COURSE = {
+    "inst_name": "Future Vision Computer Institute", "inst_url": "https://futurevisioncomputers.com/",
+    "inst_city": "Surat", "inst_street": "Citylight", "course_name": "Advanced Excel",
+    "course_desc": "Formulas, pivots and dashboards.", "course_duration": "P3M", "course_fee": "₹5000",
+    "inst_name_instructor": "Siddharth Parakh", "topics": "Formulas, Pivot Tables",
+}
+ARTICLE = {
+    "headline": "Master Excel Formulas", "description": "Essential formulas.",
+    "blog_url": "https://futurevisioncomputers.com/blog/excel", "author_name": "Siddharth",
+    "pub_name": "Future Vision Computer Institute", "faqs": [("What is XLOOKUP?", "A lookup function.")],
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    kinds = {
+        "blog graph": [extract_blog_schema(f"https://example.com/{name}", "Advanced Excel", html)[0]
+                       for name, html in corpus.load()],
+        "course": [generate("course", COURSE)],
+        "full-course": [generate("full-course", COURSE)],
+        "article": [generate("article", ARTICLE)],
+    }
+    print(f"{'kind':<12}{'docs':>8}{'seconds':>9}{'docs/s':>10}{'errors':>8}{'warnings':>10}")
+    for name, docs in kinds.items():
+        batch = [docs[i % len(docs)] for i in range(args.docs)]
+        start = time.perf_counter()
+        report = validate_all(batch)
+        seconds = time.perf_counter() - start
+        print(f"{name:<12}{args.docs:>8}{seconds:>9.2f}{args.docs / seconds:>10.0f}"
+              f"{report.errors // args.docs:>8}{report.warnings // args.docs:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Deterministic corpus of WordPress-style blog pages for offline benchmarks.
+
+Pages mimic the structure of our live posts — heavy theme ``<head>``, mega
+menu, sidebar widgets, inline scripts, footer — around an ``<article>`` with
+headings, question headings and ``<details>`` FAQs. They are generated from a
+fixed seed so every run (and every machine) benchmarks the same bytes.
+
+    python benchmarks/corpus.py            # writes benchmarks/corpus/*.html
+
+``load_tiers`` adds pages of fixed small / medium / large sizes (``TIERS``)
+for benchmarks that report per-size latency.
+"""
+
+import os
+import random
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+TIERS_DIR = os.path.join(CORPUS_DIR, "tiers")
+TIERS = {"small": 100, "medium": 400, "large": 1500}  # target page size in KB
+
+WORDS = (
+    "excel formula pivot table dashboard analytics business finance power query data model chart "
+    "students professionals learners analysts developers lookup function worksheet report python "
+    "course training institute surat certificate practical example workbook macro automation sales "
+    "the and with that this from your into about when which where while using learn step guide"
+).split()
+
+
+def _sentence(rng, n=14):
+    words = [rng.choice(WORDS) for _ in range(n)]
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng, sentences=5):
+    return " ".join(_sentence(rng) for _ in range(sentences))
+
+
+def make_page(rng, index, target_kb):
+    title = f"{_sentence(rng, 6)[:-1]} #{index}"
+    head = [
+        "<!DOCTYPE html><html lang=\"en-US\"><head><meta charset=\"UTF-8\">",
+        f"<title>{title} - Future Vision Computers</title>",
+        f"<meta name=\"description\" content=\"{_sentence(rng)}\">",
+        f"<meta property=\"og:title\" content=\"{title}\">",
+        f"<meta property=\"og:description\" content=\"{_sentence(rng)}\">",
+        f"<meta property=\"og:image\" content=\"https://futurevisioncomputers.com/wp-content/uploads/2025/{index:04d}.jpg\">",
+        "<meta name=\"author\" content=\"Siddharth Parakh\">",
+        "<meta property=\"article:published_time\" content=\"2025-03-14T09:30:00+05:30\">",
+        "<meta property=\"article:modified_time\" content=\"2025-06-02T11:00:00+05:30\">",
+    ]
+    for i in range(40):
+        head.append(f"<link rel=\"stylesheet\" id=\"theme-css-{i}\" href=\"https://futurevisioncomputers.com/wp-content/themes/x/{i}.css\">")
+    head.append("<style>" + " ".join(f".c{i}{{margin:{i}px;padding:{i}px}}" for i in range(800)) + "</style>")
+    head.append("<script>var wpData=" + str([{"id": i, "v": _sentence(rng, 4)} for i in range(150)]) + ";</script>")
+    head.append("</head>")
+
+    chrome = ["<body class=\"post-template-default single\"><header id=\"masthead\"><nav class=\"mega-menu\"><ul>"]
+    for i in range(250):
+        chrome.append(f"<li class=\"menu-item\"><a href=\"/course-{i}/\">{rng.choice(WORDS).title()} Course {i}</a></li>")
+    chrome.append("</ul></nav><div class=\"topbar\">Have a question? Call us now</div></header>")
+
+    article = [f"<main id=\"primary\"><article id=\"post-{index}\" class=\"post\"><h1 class=\"entry-title\">{title}</h1>",
+               "<div class=\"entry-content\">"]
+    sidebar = ["<aside id=\"secondary\" class=\"widget-area\">"]
+    for i in range(30):
+        sidebar.append(f"<section class=\"widget\"><h3>Why join course {i}?</h3><p>{_sentence(rng)}</p></section>")
+    sidebar.append("</aside>")
+    footer = ["<footer id=\"colophon\"><div class=\"footer-widgets\">"]
+    for i in range(60):
+        footer.append(f"<div class=\"col\"><strong>{rng.choice(WORDS).title()}</strong><p>{_sentence(rng)}</p></div>")
+    footer.append("</div><div class=\"cookie-banner\">We use cookies. Accept?</div></footer>")
+    footer.append("<script>" + "function f(a){return a*2};" * 300 + "</script></body></html>")
+
+    fixed = sum(len(part) for part in head + chrome + sidebar + footer)
+    body_size = 0
+    section = 0
+    while fixed + body_size < target_kb * 1024:
+        section += 1
+        block = [f"<h2>{_sentence(rng, 5)[:-1]}</h2>"]
+        block.extend(f"<p>{_paragraph(rng)}</p>" for _ in range(3))
+        if section % 3 == 0:
+            block.append(f"<h3>What is {rng.choice(WORDS)} in Excel?</h3><p>{_paragraph(rng, 2)}</p>")
+        if section % 5 == 0:
+            block.append(f"<details><summary>How do I use {rng.choice(WORDS)}?</summary><p>{_paragraph(rng, 2)}</p></details>")
+        body_size += sum(len(part) for part in block)
+        article.extend(block)
+    article.append("</div></article></main>")
+    return "".join(head + chrome + article + sidebar + footer)
+
+
+def generate(directory=CORPUS_DIR, count=24, seed=2025):
+    """Write ``count`` pages between 200 and 600 KB into ``directory``."""
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    for index in range(count):
+        target_kb = 200 + (400 * index) // max(count - 1, 1)
+        with open(os.path.join(directory, f"post-{index:03d}.html"), "w", encoding="utf-8") as f:
+            f.write(make_page(rng, index, target_kb))
+
+
+def _read(directory, prefix=""):
+    pages = []
+    for name in sorted(os.listdir(directory)):
+        if name.startswith(prefix) and name.endswith(".html"):
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                pages.append((name, f.read()))
+    return pages
+
+
+def load(directory=CORPUS_DIR):
+    """Return ``[(name, html), ...]`` for the corpus, generating it on first use."""
+    if not os.path.isdir(directory) or not any(name.endswith(".html") for name in os.listdir(directory)):
+        generate(directory)
+    return _read(directory)
+
+
+def load_tiers(directory=TIERS_DIR, per_tier=4, seed=2026):
+    """Return ``{tier: [(name, html), ...]}`` with ``per_tier`` pages of each ``TIERS`` size, generated on first use."""
+    os.makedirs(directory, exist_ok=True)
+    tiers = {}
+    for tier, target_kb in TIERS.items():
+        for index in range(per_tier):
+            path = os.path.join(directory, f"{tier}-{index:03d}.html")
+            if not os.path.exists(path):
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(make_page(random.Random(f"{seed}-{tier}-{index}"), index, target_kb))
+        tiers[tier] = _read(directory, f"{tier}-")[:per_tier]
+    return tiers
+
+
+if __name__ == "__main__":
+    generate()
+    print(f"Corpus written to {CORPUS_DIR}")
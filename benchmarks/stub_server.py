@@ -0,0 +1,70 @@
+"""Local stub HTTP server for offline benchmarks: serves fixture pages with configurable latency.
+
+    server = serve({"/post-000.html": html_bytes}, latency=0.05, jitter=0.01)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    ...
+    server.shutdown()
+
+Each response is held back ``latency`` seconds (plus up to ``jitter``,
+from a seeded generator so runs are comparable) before the headers go out,
+and the body is then written at ``bandwidth`` bytes/second when given, so
+a crawl sees a slow origin without any network. A page is served as HTML
+unless given as ``(content_type, bytes)``. A path with its query string is
+looked up first, then without it, so API pages can differ by query while a
+benchmark can request the same HTML page under many distinct URLs.
+``/robots.txt`` is a 404, like most blogs.
+"""
+
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CHUNK = 64 * 1024
+
+
+def serve(pages, latency=0.0, jitter=0.0, bandwidth=None, seed=2025):
+    """Serve ``pages`` (``{path: bytes or (content_type, bytes)}``) on a free local port in a daemon thread.
+
+    Returns the server; its ``requests`` and ``bytes_sent`` count what it served.
+    """
+    rng = random.Random(seed)
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like a real origin behind a CDN
+
+        def do_GET(self):
+            body = pages.get(self.path) or pages.get(self.path.split("?")[0])
+            content_type = "text/html; charset=utf-8"
+            if isinstance(body, tuple):
+                content_type, body = body
+            if latency or jitter:
+                with lock:
+                    delay = latency + rng.random() * jitter
+                time.sleep(delay)
+            if body is None:
+                self.send_error(404)
+                return
+            with lock:
+                server.requests += 1
+                server.bytes_sent += len(body)
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if not bandwidth:
+                self.wfile.write(body)
+                return
+            for start in range(0, len(body), CHUNK):
+                self.wfile.write(body[start:start + CHUNK])
+                time.sleep(min(CHUNK, len(body) - start) / bandwidth)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.requests = server.bytes_sent = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,301 @@
+"""Reproducible benchmark suite: latency, throughput, per-stage time and peak memory, tracked over time.
+
+    python benchmarks/suite.py                      # run everything, save to the history, compare
+    python benchmarks/suite.py --quick              # fewer pages and rounds, for a smoke check
+    python benchmarks/suite.py --only extract crawl # benchmarks whose name contains a pattern
+    python benchmarks/suite.py --fail-on-regression # exit 1 if a metric is worse than the last run
+
+Runs fully offline. The blog pages come from the fixture corpus
+(``corpus.load_tiers``: small / medium / large pages, generated from a fixed
+seed on first use), and the end-to-end crawl fetches them from the local
+stub server (``stub_server.serve``) with ``--latency`` seconds of simulated
+origin latency. Benchmarks:
+
+* ``extract/<tier>`` — ``analyze_blog_html`` + ``build_blog_schema`` per
+  page, with the per-stage breakdown from ``schemagen.timing``;
+* ``crawl/latency=<s>`` — ``schemagen.crawl.crawl`` through the stub server,
+  threads only, end to end;
+* ``faq/extract`` and ``faq/build`` — FAQ detection on a page with hundreds
+  of question headings, and FAQPage building from 50 pairs;
+* ``course/<kind>`` — the course generators used by the CLI and the forms.
+
+Each benchmark runs one warm-up round and ``--repeat`` timed rounds. It
+reports throughput from the best round, p50 / p95 / max latency over all
+timed rounds and, from one extra round under ``tracemalloc``, peak Python
+memory. Results are appended to ``--history`` (JSON lines, one record per
+run with commit, Python and machine) and compared with the previous record
+from the same machine and settings: throughput down or latency / memory up
+by more than ``--threshold`` is reported as a regression.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import corpus  # noqa: E402
+from schemagen.blog import analyze_blog_html, build_blog_schema  # noqa: E402
+from schemagen.builders import build_faq_page  # noqa: E402
+from schemagen.cli import generate  # noqa: E402
+from schemagen.crawl import crawl  # noqa: E402
+from schemagen.extract import parse_html  # noqa: E402
+from schemagen.faq import extract_faqs  # noqa: E402
+from schemagen.keywords import CorpusStats  # noqa: E402
+from schemagen.schedule import Scheduler  # noqa: E402
+from schemagen.timing import Timings  # noqa: E402
+from stub_server import serve  # noqa: E402
+
+DEFAULT_HISTORY = os.path.join(ROOT, "benchmarks", "results", "history.jsonl")
+URL = "https://futurevisioncomputers.com/blog/benchmark-post/"
+# metric -> True when higher is better; only these are compared between runs
+TRACKED = {"per_s": True, "p50_ms": False, "p95_ms": False, "peak_mb": False}
+
+COURSE_ROW = {
+    "inst_name": "Future Vision Computer Institute", "inst_url": "https://futurevisioncomputers.com/",
+    "inst_city": "Surat", "inst_street": "Citylight", "course_name": "Advanced Excel",
+    "course_desc": "Formulas, pivots and dashboards.", "course_duration": "P3M", "course_fee": "5000",
+    "inst_name_instructor": "Siddharth Parakh", "topics": "Formulas, Pivot Tables, Dashboards",
+}
+BRANCH_ROW = {
+    "course_name": "Advanced Excel", "course_desc": "Formulas, pivots and dashboards.", "course_fee": "5000",
+    "provider_name": "Future Vision Computer Institute", "provider_url": "https://futurevisioncomputers.com/",
+    **{f"branch_{i}_{field}": f"{field.title()} {i}" for i in range(1, 6) for field in ("street", "city")},
+    **{f"{part}_{i}": f"{part.title()} {i}?" for i in range(1, 9) for part in ("question", "answer")},
+}
+
+
+class Bench:
+    """One benchmark: ``run(item)`` is timed for every item of ``items``.
+
+    ``run`` may return a ``Timings`` (or its dict) to contribute to the
+    per-stage breakdown. With ``batch`` set, ``run(items)`` processes the whole
+    list at once and returns ``[(seconds, timings), ...]`` per item, for
+    concurrent workloads whose per-item latency is measured inside.
+    """
+
+    def __init__(self, name, items, run, unit="items", size=None, batch=False):
+        self.name = name
+        self.items = items
+        self.run = run
+        self.unit = unit
+        self.size = size  # bytes per item, for MB/s
+        self.batch = batch
+
+    def round(self):
+        """Time one pass over the items: ``(wall seconds, [(latency, timings), ...])``."""
+        start = time.perf_counter()
+        if self.batch:
+            samples = self.run(self.items)
+        else:
+            samples = []
+            for item in self.items:
+                item_start = time.perf_counter()
+                out = self.run(item)
+                samples.append((time.perf_counter() - item_start, out))
+        return time.perf_counter() - start, samples
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def measure(bench, repeat):
+    bench.round()  # warm-up: imports, lazily built tables, CPU caches
+    walls, latencies = [], []
+    stages = Timings()
+    for _ in range(repeat):
+        wall, samples = bench.round()
+        walls.append(wall)
+        for seconds, timings in samples:
+            latencies.append(seconds)
+            if isinstance(timings, Timings):
+                stages.update(timings.as_dict())
+            elif isinstance(timings, dict):
+                stages.update(timings)
+
+    tracemalloc.start()
+    try:
+        bench.round()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    best = min(walls)
+    n = len(bench.items)
+    result = {
+        "unit": bench.unit,
+        "items": n,
+        "per_s": n / best,
+        "p50_ms": 1000 * statistics.median(latencies),
+        "p95_ms": 1000 * _percentile(latencies, 0.95),
+        "max_ms": 1000 * max(latencies),
+        "peak_mb": peak / 1e6,
+    }
+    if bench.size:
+        result["mb_s"] = n * bench.size / 1e6 / best
+    if stages.stages:
+        result["stages_ms"] = {name: 1000 * seconds / (n * repeat) for name, seconds in stages.as_dict()["stages"].items()}
+    return result
+
+
+# --- Benchmarks ---
+def _extract(html):
+    facts = analyze_blog_html(html, URL)
+    timings = Timings(facts["timings"])
+    build_blog_schema(URL, "Advanced Excel", facts, CorpusStats(), timings=timings)
+    return timings
+
+
+def _crawl(base, threads):
+    def run(paths):
+        urls = [f"{base}{path}?n={i}" for i, path in enumerate(paths)]
+        scheduler = Scheduler(rate=1e6, burst=len(urls), per_host=threads, respect_robots=False)
+        results = list(crawl(urls, "Advanced Excel", workers=threads, stats=CorpusStats(), scheduler=scheduler))
+        failed = [r for r in results if not r.ok]
+        if failed:
+            raise RuntimeError(f"{len(failed)} crawl failures, e.g. {failed[0].url}: {failed[0].error}")
+        return [(r.elapsed, r.timings) for r in results]
+    return run
+
+
+def faq_page(questions):
+    sections = "".join(f"<h3>What is topic {i} about?</h3><p>Answer {i} explains the topic in detail.</p>"
+                       f"<p>{'More background text. ' * 20}</p>" for i in range(questions))
+    return f"<html><head><title>FAQ</title></head><body><article>{sections}</article></body></html>"
+
+
+def benchmarks(args):
+    tiers = corpus.load_tiers(per_tier=args.pages)
+    yield from (Bench(f"extract/{tier}", [html for _, html in pages], _extract, "pages",
+                      size=sum(len(html.encode("utf-8")) for _, html in pages) / len(pages))
+                for tier, pages in tiers.items())
+
+    pages = {f"/{tier}/{name}": html.encode("utf-8") for tier, items in tiers.items() for name, html in items}
+    server = serve(pages, latency=args.latency, jitter=args.latency / 2)
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        paths = sorted(pages) * max(1, args.crawl_pages // len(pages))
+        yield Bench(f"crawl/latency={args.latency:g}", paths, _crawl(base, args.threads), "pages",
+                    size=sum(map(len, pages.values())) / len(pages), batch=True)
+    finally:
+        server.shutdown()
+
+    soup = parse_html(faq_page(300))
+    yield Bench("faq/extract", [soup] * 5, lambda s: extract_faqs(s, limit=1000), "pages")
+    pairs = [(f"What is topic {i}?", f"Topic {i} is explained here.") for i in range(50)]
+    yield Bench("faq/build", [pairs] * 200, build_faq_page, "pages")
+
+    for kind, row in (("course", COURSE_ROW), ("full-course", COURSE_ROW), ("course-branches", BRANCH_ROW)):
+        yield Bench(f"course/{kind}", [row] * 500, lambda r, kind=kind: generate(kind, r), "rows")
+
+
+# --- History ---
+def machine_id():
+    return f"{platform.node()}/{platform.machine()}/{os.cpu_count()}cpu/py{platform.python_version()}"
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True,
+                             timeout=10)
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT,
+                               capture_output=True, text=True, timeout=30).stdout.strip()
+        return out.stdout.strip() + ("+dirty" if dirty else "") if out.returncode == 0 else None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def config(args):
+    """The settings that change what is measured; only runs with equal settings are compared."""
+    return {key: getattr(args, key) for key in ("repeat", "pages", "crawl_pages", "threads", "latency")}
+
+
+def previous_record(path, machine, settings):
+    """The last record in the history from ``machine`` with the same ``settings``."""
+    if not os.path.exists(path):
+        return None
+    last = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            if record.get("machine") == machine and record.get("config") == settings:
+                last = record
+    return last
+
+
+def regressions(current, previous, threshold):
+    """``(benchmark, metric, before, after, change)`` for every tracked metric worse by more than ``threshold``."""
+    found = []
+    for name, result in current.items():
+        before = previous.get(name)
+        if not before:
+            continue
+        for metric, higher_is_better in TRACKED.items():
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = new / old - 1
+            if (-change if higher_is_better else change) > threshold:
+                found.append((name, metric, old, new, change))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", help="run benchmarks whose name contains any of these")
+    parser.add_argument("--repeat", type=int, default=3, help="timed rounds per benchmark")
+    parser.add_argument("--pages", type=int, default=4, help="pages per size tier")
+    parser.add_argument("--crawl-pages", type=int, default=48, help="URLs per crawl round")
+    parser.add_argument("--threads", type=int, default=8, help="crawl download threads")
+    parser.add_argument("--latency", type=float, default=0.05, help="stub server latency per request (seconds)")
+    parser.add_argument("--quick", action="store_true", help="--repeat 1 --pages 2 --crawl-pages 12")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON lines file results are appended to")
+    parser.add_argument("--no-save", action="store_true", help="compare with the history but do not append")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change reported as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit 1 if any regression is found")
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.repeat, args.pages, args.crawl_pages = 1, 2, 12
+
+    results = {}
+    print(f"{'benchmark':<24}{'items':>6}{'per s':>9}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}{'MB/s':>7}{'peak MB':>9}")
+    for bench in benchmarks(args):
+        if args.only and not any(pattern in bench.name for pattern in args.only):
+            continue
+        result = results[bench.name] = measure(bench, args.repeat)
+        print(f"{bench.name:<24}{result['items']:>6}{result['per_s']:>9.1f}{result['p50_ms']:>9.2f}"
+              f"{result['p95_ms']:>9.2f}{result['max_ms']:>9.2f}{result.get('mb_s', 0):>7.1f}{result['peak_mb']:>9.1f}")
+        if "stages_ms" in result:
+            print(" " * 4 + "  ".join(f"{name} {ms:.1f}" for name, ms in result["stages_ms"].items()))
+
+    machine = machine_id()
+    previous = previous_record(args.history, machine, config(args))
+    found = []
+    if previous is not None:
+        found = regressions(results, previous["results"], args.threshold)
+        print(f"\ncompared with {previous.get('commit') or 'unknown commit'} from {previous['time']}: "
+              f"{len(found)} regression(s) over {args.threshold:.0%}")
+        for name, metric, old, new, change in found:
+            print(f"  {name} {metric}: {old:.2f} -> {new:.2f} ({change:+.0%})")
+    if not args.no_save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+        record = {"time": datetime.now(timezone.utc).isoformat(timespec="seconds"), "commit": git_commit(),
+                  "machine": machine, "config": config(args), "results": results}
+        with open(args.history, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        print(f"results appended to {os.path.relpath(args.history)}")
+    return 1 if found and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
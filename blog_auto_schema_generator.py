@@ -1,178 +1,180 @@
-import streamlit as st
-import json
-from datetime import datetime
-from urllib.parse import urlparse
-import requests
-from bs4 import BeautifulSoup
-import re
-from collections import Counter
-
-st.set_page_config(page_title="Smart Auto Blog Schema Generator v5 — Future Vision", layout="centered")
-st.title("🧠 Smart Auto Blog Schema Generator v5 — Future Vision Computers")
-st.markdown("Enter your blog URL and category. The app auto-generates a full SEO + AEO JSON-LD schema (BlogPosting + FAQ + Organization) — dynamically adapting `keywords`, `about`, and `FAQ` based on your category, title, and description.")
-
-# --- Inputs ---
-blog_url = st.text_input("Enter Blog URL", "https://futurevisioncomputers.com/fourth-word-in-excel-advanced-excel-for-finance-business-analytics/")
-category = st.text_input("Enter Blog Category (e.g. Advanced Excel, Python, Data Analytics, Power BI, Finance)", "Advanced Excel")
-
-if st.button("Generate Full Schema"):
-    if not blog_url.strip():
-        st.error("Please enter a valid blog URL.")
-        st.stop()
-
-    try:
-        response = requests.get(blog_url, timeout=10, headers={'User-Agent':'Mozilla/5.0'})
-        soup = BeautifulSoup(response.text, "html.parser")
-    except Exception as e:
-        st.error(f"Error fetching blog data: {e}")
-        st.stop()
-
-    # --- Extract metadata ---
-    def meta(prop, attr="property"):
-        tag = soup.find("meta", attrs={attr: prop})
-        return tag["content"].strip() if tag and tag.has_attr("content") else None
-
-    extracted = {
-        "title": meta("og:title") or (soup.title.string.strip() if soup.title else None),
-        "description": meta("og:description") or meta("description", "name"),
-        "image": meta("og:image"),
-        "author": meta("author", "name"),
-        "published": meta("article:published_time"),
-        "modified": meta("article:modified_time"),
-        "keywords": meta("keywords", "name")
-    }
-
-    # --- Defaults ---
-    defaults = {
-        "title": "Untitled Blog Post",
-        "description": "Educational blog post from Future Vision Computers.",
-        "image": "https://futurevisioncomputers.com/wp-content/uploads/2025/10/default.jpg",
-        "author": "Siddharth Parakh",
-        "published": datetime.now().isoformat(),
-        "modified": datetime.now().isoformat(),
-        "keywords": category + ", Education, Training"
-    }
-
-    checklist = {}
-    for key in defaults:
-        if extracted.get(key):
-            checklist[key] = f"✅ {key.title()} — Extracted from site"
-        else:
-            extracted[key] = defaults[key]
-            checklist[key] = f"⚠️ {key.title()} — Default used (not found on page)"
-
-    # --- Analyze Content ---
-    content_text = soup.get_text(separator=" ").lower()
-    words = re.findall(r"[a-zA-Z]{4,}", content_text)
-    word_freq = Counter(words)
-    common_terms = [w for w, c in word_freq.most_common(25)]
-
-    # --- Enriched Keywords ---
-    base_keywords = [k.strip().title() for k in (extracted["keywords"].split(",") if extracted["keywords"] else [])]
-    derived_keywords = list(set(base_keywords + [category.title()] + [w.title() for w in common_terms[:10]]))
-    checklist["keywords"] = f"✅ Keywords — Auto-updated from content + category"
-
-    # --- Dynamic About Section ---
-    about_items = [{"@type": "Thing", "name": category.title()}]
-    for kw in derived_keywords[:6]:
-        if kw.lower() not in [a["name"].lower() for a in about_items]:
-            about_items.append({"@type": "Thing", "name": kw})
-    checklist["about"] = f"✅ About — {', '.join([a['name'] for a in about_items])}"
-
-    # --- Audience Detection ---
-    audience_terms = ["students", "professionals", "analysts", "learners", "developers"]
-    detected_audience = [a.title() for a in audience_terms if a in content_text]
-    if not detected_audience:
-        detected_audience = ["Students", "Professionals"]
-    checklist["audience"] = f"✅ Audience — {', '.join(detected_audience)}"
-
-    # --- Smart FAQ Generation ---
-    faq_items = []
-    faq_tags = soup.find_all(["h2", "h3", "strong", "details", "summary", "p"])
-    for tag in faq_tags:
-        text = tag.get_text().strip()
-        if "?" in text or text.lower().startswith(("q:", "question")):
-            next_tag = tag.find_next(["p", "div"])
-            answer = next_tag.get_text().strip() if next_tag else "Answer not found."
-            faq_items.append({"@type": "Question", "name": text, "acceptedAnswer": {"@type": "Answer", "text": answer}})
-
-    if not faq_items:
-        faq_items = [
-            {"@type": "Question", "name": f"What is {category}?", "acceptedAnswer": {"@type": "Answer", "text": f"This blog explains {category} concepts with practical examples."}},
-            {"@type": "Question", "name": f"Who should learn {category}?", "acceptedAnswer": {"@type": "Answer", "text": f"{category} is ideal for students and professionals in analytics, business, or technology."}},
-            {"@type": "Question", "name": f"How does this blog help in {category}?", "acceptedAnswer": {"@type": "Answer", "text": f"This blog provides step-by-step {category} tutorials and use cases for real-world applications."}}
-        ]
-        checklist["faq"] = "✅ FAQ — Auto-created based on category and title"
-    else:
-        checklist["faq"] = f"✅ FAQ — {len(faq_items)} detected from page"
-
-    # --- Build Schema ---
-    parsed = urlparse(blog_url)
-    base_url = f"{parsed.scheme}://{parsed.netloc}"
-
-    schema = {
-        "@context": "https://schema.org",
-        "@graph": [
-            {
-                "@type": "BlogPosting",
-                "@id": blog_url,
-                "headline": extracted["title"],
-                "description": extracted["description"],
-                "image": {"@type": "ImageObject", "url": extracted["image"], "width": 1200, "height": 630},
-                "author": {"@type": "Person", "name": extracted["author"], "url": base_url},
-                "publisher": {
-                    "@type": "Organization",
-                    "@id": "#FutureVision",
-                    "name": "Future Vision Computer Institute",
-                    "url": "https://futurevisioncomputers.com/",
-                    "logo": {"@type": "ImageObject", "url": "https://futurevisioncomputers.com/wp-content/uploads/2024/07/fv-logo-final-current.png", "width": 600, "height": 60}
-                },
-                "datePublished": extracted["published"],
-                "dateModified": extracted["modified"],
-                "isAccessibleForFree": True,
-                "inLanguage": "en-IN",
-                "isFamilyFriendly": True,
-                "genre": category + " Blog",
-                "keywords": derived_keywords,
-                "audience": {"@type": "EducationalAudience", "educationalRole": "learner", "audienceType": ", ".join(detected_audience)},
-                "about": about_items,
-                "potentialAction": {"@type": "ReadAction", "target": blog_url},
-                "mainEntityOfPage": {"@type": "WebPage", "@id": blog_url}
-            },
-            {
-                "@type": "FAQPage",
-                "@id": blog_url + "#faq",
-                "mainEntity": faq_items
-            },
-            {
-                "@type": "Organization",
-                "@id": "#FutureVision",
-                "name": "Future Vision Computer Institute",
-                "url": "https://futurevisioncomputers.com/",
-                "logo": "https://futurevisioncomputers.com/wp-content/uploads/2024/07/fv-logo-final-current.png",
-                "image": "https://futurevisioncomputers.com/wp-content/uploads/2025/10/future-vision-campus.jpg",
-                "description": "Future Vision Computers in Surat publishes educational blogs and tutorials on Advanced Excel, Power BI, Python, and Data Science.",
-                "sameAs": [
-                    "https://facebook.com/fvcomputers",
-                    "https://linkedin.com/company/fvcomputers",
-                    "https://instagram.com/fvcomputers"
-                ],
-                "address": {"@type": "PostalAddress", "streetAddress": "Citylight, Vesu, Pal Area", "addressLocality": "Surat", "addressRegion": "Gujarat", "postalCode": "395007", "addressCountry": "IN"},
-                "telephone": "+91-9825771678",
-                "location": {"@type": "Place", "geo": {"@type": "GeoCoordinates", "latitude": "21.1702", "longitude": "72.8311"}}
-            }
-        ]
-    }
-
-    # --- Output ---
-    st.subheader("✅ Generated JSON-LD Schema")
-    json_text = json.dumps(schema, indent=2, ensure_ascii=False)
-    st.code(json_text, language="json")
-    st.download_button("📥 Download JSON-LD File", json_text, file_name="blog_schema.json", mime="application/json")
-
-    st.subheader("🧾 Field Update Checklist")
-    for k, v in checklist.items():
-        if "✅" in v:
-            st.success(v)
-        else:
-            st.warning(v)
+import streamlit as st
+import os
+import tempfile
+import time
+
+from app_cache import blog_schema, profile_blog_schema, show_timings, show_validation
+
+st.set_page_config(page_title="Smart Auto Blog Schema Generator v5 — Future Vision", layout="centered")
+st.title("🧠 Smart Auto Blog Schema Generator v5 — Future Vision Computers")
+st.markdown("Enter your blog URL and category. The app auto-generates a full SEO + AEO JSON-LD schema (BlogPosting + FAQ + Organization) — dynamically adapting `keywords`, `about`, and `FAQ` based on your category, title, and description.")
+
+mode = st.radio("Mode", ["Single URL", "Bulk (sitemap / URL list)"], horizontal=True)
+
+# --- Inputs ---
+category = st.text_input("Enter Blog Category (e.g. Advanced Excel, Python, Data Analytics, Power BI, Finance)", "Advanced Excel")
+
+if mode == "Single URL":
+    blog_url = st.text_input("Enter Blog URL", "https://futurevisioncomputers.com/fourth-word-in-excel-advanced-excel-for-finance-business-analytics/")
+    profile = st.checkbox("Profile this run (cProfile, bypasses the app cache)", value=False)
+
+    if st.button("Generate Full Schema"):
+        if not blog_url.strip():
+            st.error("Please enter a valid blog URL.")
+            st.stop()
+
+        try:
+            if profile:
+                schema, checklist, from_cache, json_text, timings, profile_text = profile_blog_schema(blog_url, category)
+            else:
+                schema, checklist, from_cache, json_text, timings = blog_schema(blog_url, category)
+                profile_text = None
+        except Exception as e:
+            st.error(f"Error fetching blog data: {e}")
+            st.stop()
+
+        if from_cache:
+            st.caption("♻️ Page unchanged since last fetch — cached schema reused.")
+
+        # --- Output ---
+        st.subheader("✅ Generated JSON-LD Schema")
+        st.code(json_text, language="json")
+        show_validation(schema)
+        st.download_button("📥 Download JSON-LD File", json_text, file_name="blog_schema.json", mime="application/json")
+
+        st.subheader("🧾 Field Update Checklist")
+        for k, v in checklist.items():
+            if "✅" in v:
+                st.success(v)
+            else:
+                st.warning(v)
+
+        show_timings(timings, profile_text, expanded=profile)
+
+else:
+    source = st.radio("URL Source", ["Sitemap URL", "WordPress REST API", "Paste URLs", "Upload URL list"], horizontal=True)
+    sitemap_url, site_url, pasted, uploaded = "", "", "", None
+    if source == "Sitemap URL":
+        sitemap_url = st.text_input("Sitemap URL (sitemap index and .xml.gz supported)", "https://futurevisioncomputers.com/post-sitemap.xml")
+    elif source == "WordPress REST API":
+        site_url = st.text_input("WordPress Site URL", "https://futurevisioncomputers.com")
+        st.caption("Posts are read 100 at a time from `/wp-json/wp/v2/posts`; a page is only fetched when the API lacks one of its fields.")
+    elif source == "Paste URLs":
+        pasted = st.text_area("Blog URLs (one per line)", height=200)
+    else:
+        uploaded = st.file_uploader("URL list (.txt, one per line) or sitemap (.xml, .xml.gz)", type=["txt", "xml", "gz"])
+
+    col1, col2, col3, col4 = st.columns(4)
+    workers = col1.number_input("Concurrent Workers", min_value=1, max_value=64, value=8)
+    per_host = col2.number_input("Max Requests per Host", min_value=1, max_value=16, value=4)
+    rate = col3.number_input("Requests/sec per Host", min_value=0.1, max_value=50.0, value=4.0, step=0.5)
+    processes = col4.number_input("Parse Processes (0 = threads only)", min_value=0, max_value=os.cpu_count() or 1, value=0)
+    compact = st.checkbox("Compact JSON in ZIP (no indentation)", value=False)
+
+    if st.button("Generate Bulk Schema"):
+        # The crawl stack (requests, lxml, numpy...) is loaded when a bulk run starts, not on every render
+        from schemagen.crawl import crawl, crawl_posts, expand_sitemap, output_filename, parse_sitemap, parse_url_list
+        from schemagen.fetch import default_cache
+        from schemagen.graph import SiteGraph
+        from schemagen.keywords import default_stats
+        from schemagen.output import JsonlSink, ZipSink, dumps
+        from schemagen.schedule import Scheduler
+        from schemagen.site import load_site
+        from schemagen.timing import StageStats, Timings
+        from schemagen.validate import Report, validate
+        from schemagen.wordpress import iter_posts
+
+        scheduler = Scheduler(rate=float(rate), per_host=int(per_host))
+        posts = None
+        try:
+            if source == "Sitemap URL":
+                urls = expand_sitemap(sitemap_url.strip(), scheduler=scheduler)
+            elif source == "WordPress REST API":
+                posts = list(iter_posts(site_url.strip(), scheduler=scheduler))
+                urls = [post["link"] for post in posts]
+            elif source == "Paste URLs":
+                urls = parse_url_list(pasted)
+            elif uploaded is not None and uploaded.name.endswith((".xml", ".gz")):
+                pages, children = parse_sitemap(uploaded.getvalue())
+                for child in children:
+                    pages += expand_sitemap(child, scheduler=scheduler)
+                urls = parse_url_list("\n".join(pages))
+            else:
+                urls = parse_url_list(uploaded.getvalue().decode("utf-8")) if uploaded else []
+        except Exception as e:
+            st.error(f"Error reading URL source: {e}")
+            st.stop()
+
+        if not urls:
+            st.error("No URLs found.")
+            st.stop()
+
+        st.info(f"Found {len(urls)} URLs — generating with {workers} workers.")
+        progress = st.progress(0.0)
+        stats = st.empty()
+        log = st.container(height=300)
+
+        # Stream each schema to disk as it arrives instead of building the exports in memory
+        out_dir = st.session_state.setdefault("bulk_dir", tempfile.mkdtemp(prefix="schemagen-bulk-"))
+        jsonl_path = os.path.join(out_dir, "blog_schemas.jsonl")
+        zip_path = os.path.join(out_dir, "blog_schemas.zip")
+        graph_path = os.path.join(out_dir, "site_graph.jsonld")
+        graph = SiteGraph(load_site().get("url"))  # publisher and authors once, every post referencing them
+        st.session_state.pop("bulk_exports", None)
+        report = Report()
+        timings = StageStats()
+        ok = failed = cached = 0
+        start = time.perf_counter()
+        with JsonlSink(jsonl_path) as jsonl, ZipSink(zip_path, compact=compact) as zf:
+            if posts is not None:
+                results = crawl_posts(posts, category, workers=int(workers), cache=default_cache(), stats=default_stats(),
+                                      processes=int(processes), scheduler=scheduler)
+            else:
+                results = crawl(urls, category, workers=int(workers), cache=default_cache(), stats=default_stats(),
+                                processes=int(processes), scheduler=scheduler)
+            for i, result in enumerate(results, 1):
+                if result.ok:
+                    ok += 1
+                    cached += result.cached
+                    page_timings = Timings(result.timings)
+                    with page_timings.stage("serialize"):
+                        jsonl.write(result.url, {"url": result.url, "schema": result.schema})
+                        zf.write(output_filename(result.url), result.schema)
+                        graph.add(result.url, result.schema)
+                    with page_timings.stage("validate"):
+                        report.add(validate(result.schema), result.url)
+                    timings.add(page_timings)
+                    log.write(f"{'♻️' if result.cached else '✅'} {result.url} ({result.elapsed:.2f}s)")
+                else:
+                    failed += 1
+                    log.write(f"❌ {result.url} — {result.error}")
+                elapsed = time.perf_counter() - start
+                progress.progress(i / len(urls))
+                hosts = scheduler.metrics().values()
+                queued = sum(h["queued"] for h in hosts)
+                retries = sum(h["retries"] for h in hosts)
+                wait = max((h["wait_avg"] for h in hosts), default=0.0)
+                stats.markdown(f"**{i}/{len(urls)}** done · ✅ {ok} (♻️ {cached} cached) · ❌ {failed} · {i / elapsed:.1f} pages/s · {elapsed:.1f}s elapsed  \n"
+                               f"⏳ {queued} queued · avg wait {wait:.2f}s · 🔁 {retries} retries · 🩺 {report.with_errors} with schema errors")
+
+        with open(graph_path, "wb") as f:
+            f.write(dumps(graph.document(), compact=compact))
+        default_stats().save()
+        st.session_state["bulk_exports"] = (jsonl_path, zip_path, graph_path)
+        st.session_state["bulk_report"] = report.format()
+        st.session_state["bulk_timings"] = timings
+
+    if "bulk_exports" in st.session_state:
+        st.subheader("🩺 Rich-Result Validation")
+        st.code(st.session_state["bulk_report"], language="text")
+        show_timings(st.session_state["bulk_timings"])
+        st.subheader("📥 Download Results")
+        jsonl_path, zip_path, graph_path = st.session_state["bulk_exports"]
+        col1, col2, col3 = st.columns(3)
+        with open(jsonl_path, "rb") as f:
+            col1.download_button("Download JSONL", f, file_name="blog_schemas.jsonl", mime="application/jsonl")
+        with open(zip_path, "rb") as f:
+            col2.download_button("Download ZIP", f, file_name="blog_schemas.zip", mime="application/zip")
+        with open(graph_path, "rb") as f:
+            col3.download_button("Download site @graph", f, file_name="site_graph.jsonld", mime="application/ld+json",
+                                 help="Every post in one @graph, with the publisher and authors stored once")
@@ -0,0 +1,5 @@
+"""UI-free helpers shared by the Future Vision schema generator apps.
+
+Nothing in this package imports Streamlit, so it can be used from batch
+jobs and worker threads as well as from the apps themselves.
+"""
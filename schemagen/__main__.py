@@ -0,0 +1,5 @@
+import sys
+
+from schemagen.cli import main
+
+sys.exit(main())
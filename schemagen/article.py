@@ -0,0 +1,99 @@
+"""Hand-entered BlogPosting schema, one function per blog form.
+
+``schemagen.blog`` covers blog posts whose fields are extracted from the live
+page; the functions here take the values an editor typed into a form.
+"""
+
+from schemagen.builders import (
+    Audience,
+    BlogPosting,
+    Course,
+    ImageObject,
+    Organization,
+    Person,
+    VideoObject,
+    WebPage,
+    build_blog_posting,
+    build_faq_page,
+    split_list,
+)
+from schemagen.course import faq_questions
+
+
+def education_article_schema(*, headline, description="", blog_url="", image_url="", date_published=None,
+                             date_modified=None, author_name="", author_sameas="", author_knows="",
+                             pub_name="", pub_logo="", pub_social="", keywords="", about_tags="",
+                             word_count=None, license_url="", citations="", free_access=True,
+                             video_url="", video_embed="", video_duration="", faqs=()):
+    """BlogPosting and FAQPage documents (``GenerateEduSchema_Pro_Max.py``, article page)."""
+    post = BlogPosting(
+        headline=headline,
+        description=description,
+        url=blog_url,
+        image=image_url,
+        date_published=date_published,
+        date_modified=date_modified,
+        is_accessible_for_free=free_access,
+        author=Person(name=author_name, same_as=split_list(author_sameas), knows_about=split_list(author_knows)),
+        publisher=Organization(name=pub_name, logo=ImageObject(url=pub_logo), same_as=split_list(pub_social)),
+        keywords=split_list(keywords),
+        about=split_list(about_tags),
+        word_count=word_count,
+        article_body=description,
+        license=license_url,
+        citation=split_list(citations),
+        educational_alignment={"@type": "AlignmentObject", "alignmentType": "educationalLevel", "targetName": "Intermediate"},
+        speakable={"@type": "SpeakableSpecification", "xpath": ["/html/head/title", "/html/body/h1"]},
+        audience=Audience(audience_type="Students and Professionals"),
+        is_part_of={"@type": "Blog", "name": "Education Blog"},
+        potential_action={"@type": "ReadAction", "target": blog_url, "name": f"Read {headline}"},
+        video=VideoObject(url=video_url, embed_url=video_embed, duration=video_duration) if video_url else None,
+    )
+    return [build_blog_posting(post), build_faq_page(faq_questions(faqs))]
+
+
+def blog_posting_schema(*, headline, description="", author_name="", author_url="", publisher_name="",
+                        publisher_logo="", blog_url="", date_published=None, date_modified=None, keywords="",
+                        article_section="", images=(), video=None, courses=(), related_links=()):
+    """BlogPosting with images, video, mentioned courses and related links (``GenerateSchemaBlog.py``).
+
+    ``images`` are ``(url, caption)`` pairs, ``courses`` ``(name, description, url)``
+    triples and ``related_links`` ``(name, url)`` pairs; entries without a URL
+    (or, for courses, a name) are skipped. ``video`` is a dict of the form's
+    video fields and is only used when it has a name and content URL.
+    """
+    image_nodes = [ImageObject(url=url, caption=caption) for url, caption in images if url]
+    course_nodes = [
+        Course(name=name, description=desc, url=url,
+               provider=Organization(name=publisher_name, same_as=blog_url))
+        for name, desc, url in courses if name and url
+    ]
+    link_urls = [url for name, url in related_links if name and url]
+    video_node = None
+    if video and video.get("name") and video.get("content_url"):
+        video_node = VideoObject(
+            name=video["name"],
+            description=video.get("description", ""),
+            thumbnail_url=video.get("thumbnail_url", ""),
+            upload_date=date_published,
+            content_url=video["content_url"],
+            embed_url=video.get("embed_url", ""),
+            duration=video.get("duration", ""),
+        )
+
+    post = BlogPosting(
+        headline=headline,
+        description=description,
+        author=Person(name=author_name, url=author_url),
+        publisher=Organization(name=publisher_name, logo=ImageObject(url=publisher_logo)),
+        date_published=date_published,
+        date_modified=date_modified,
+        main_entity_of_page=WebPage(id=blog_url),
+        article_section=article_section,
+        keywords=split_list(keywords),
+        image=image_nodes or None,
+        video=video_node,
+        mentions=course_nodes or None,
+        related_link=link_urls or None,  # Google accepts relatedLink as list of URLs
+    )
+    return build_blog_posting(post)
@@ -0,0 +1,284 @@
+"""BlogPosting + FAQPage + Organization schema extraction for a single blog page."""
+
+import time
+from datetime import datetime
+from urllib.parse import urlparse
+
+from schemagen.builders import (
+    BlogPosting,
+    EducationalAudience,
+    ImageObject,
+    Person,
+    Thing,
+    WebPage,
+    build_faq_page,
+    build_graph,
+)
+from schemagen.content import main_content, main_text
+from schemagen.extract import canonical_url, collect_meta, page_title, parse_html
+from schemagen.faq import extract_faqs
+from schemagen.fetch import fetch
+from schemagen.keywords import CorpusStats, count_terms, score_counts
+from schemagen.manifest import fingerprint
+from schemagen.site import load_site
+from schemagen.taxonomy import load_taxonomy, normalize_term
+from schemagen.timing import Timings
+
+MAX_AUDIENCE = 5
+MIN_TOPIC_MENTIONS = 2  # a topic or course named once in passing is not what the post is about
+MAX_ABOUT = 7
+TOP_KEYWORDS = 10
+MEMO_PREFIX = "blog_schema:"  # PageCache ``derived`` key, per schema version and category
+GENERATOR_VERSION = "5.5"  # bump whenever a change here alters the generated schema
+
+
+def schema_version():
+    """``GENERATOR_VERSION`` plus the site config and taxonomy versions: any changing invalidates stored schema."""
+    return f"{GENERATOR_VERSION}+{load_site().version}+{load_taxonomy().version}"
+
+
+def generate_blog_schema(blog_url, category, timeout=10, cache=None, stats=None, scheduler=None, timings=None):
+    """Fetch ``blog_url`` and build its schema, reusing cached work when possible.
+
+    When the page is unchanged since it was cached (fresh hit or ``304``) the
+    previously generated schema for the same category is returned without
+    parsing the HTML again. Pass a ``schemagen.schedule.Scheduler`` to rate-limit
+    and retry the request, and a ``schemagen.timing.Timings`` to record how long
+    each stage took. Returns ``(schema, checklist, from_cache)``.
+    """
+    timings = timings if timings is not None else Timings()
+    get = scheduler.fetch if scheduler is not None else fetch
+    with timings.stage("fetch"):
+        page = get(blog_url, timeout=timeout, cache=cache, stop_after_article=True)
+    memo = cached_blog_schema(page, category)
+    if memo is not None:
+        return memo[0], memo[1], True
+    facts = analyze_blog_html(page.text, blog_url)
+    timings.update(facts["timings"])
+    schema, checklist = build_blog_schema(blog_url, category, facts, stats, timings=timings)
+    remember_blog_schema(cache, page, category, schema, checklist)
+    return schema, checklist, False
+
+
+def cached_blog_schema(page, category):
+    """``(schema, checklist)`` memoised for an unchanged ``page``, or ``None``."""
+    if page.not_modified:
+        return page.entry.get("derived", {}).get(f"{MEMO_PREFIX}{schema_version()}:{category}")
+    return None
+
+
+def remember_blog_schema(cache, page, category, schema, checklist):
+    if cache is not None:
+        cache.remember(page.url, page.entry, f"{MEMO_PREFIX}{schema_version()}:{category}", [schema, checklist])
+
+
+def extract_blog_schema(blog_url, category, html, stats=None):
+    """Build the full JSON-LD ``@graph`` for a blog page.
+
+    Keywords are the page's top TF-IDF terms against ``stats`` (a
+    ``CorpusStats``, updated with this page); without it plain term frequency
+    is used. Returns ``(schema, checklist)`` where ``checklist`` maps each
+    field to a human readable note about whether it was extracted or
+    defaulted.
+    """
+    return build_blog_schema(blog_url, category, analyze_blog_html(html, blog_url), stats)
+
+
+def analyze_blog_html(html, url=None, taxonomy=None):
+    """Parse a blog page into the facts its schema is built from.
+
+    This is the CPU-heavy half of ``extract_blog_schema`` and touches no
+    shared state beyond the per-host content selectors, so it can run in a
+    worker process; the result is a plain picklable dict for
+    ``build_blog_schema``. Keywords, audience and FAQs are taken from the
+    article body only (``schemagen.content``); ``url`` (default: the page's
+    ``og:url`` or canonical link) names the host whose selector is learned.
+    Audience, topics and courses are matched against ``taxonomy`` (default:
+    ``load_taxonomy()``) in a single pass over the text. ``timings`` holds
+    the ``Timings.as_dict()`` of each stage, so it survives the trip back
+    from a worker process.
+    """
+    timings = Timings()
+    timings.count("html_bytes", len(html.encode("utf-8")))
+    with timings.stage("parse"):
+        soup = parse_html(html)
+    timings.count("nodes", len(soup.find_all(True)))
+    with timings.stage("meta"):
+        metas = collect_meta(soup)
+
+    # --- Extract metadata ---
+    def meta(prop, attr="property"):
+        return metas.get((attr, prop))
+
+    extracted = {
+        "title": meta("og:title") or page_title(soup),
+        "description": meta("og:description") or meta("description", "name"),
+        "image": meta("og:image"),
+        "author": meta("author", "name"),
+        "published": meta("article:published_time"),
+        "modified": meta("article:modified_time"),
+        "keywords": meta("keywords", "name")
+    }
+
+    with timings.stage("content"):
+        host = urlparse(url or meta("og:url") or canonical_url(soup) or "").netloc or None
+        content = main_content(soup, host)
+    return _analyze_content(soup, content, extracted, timings, taxonomy)
+
+
+def analyze_blog_body(body_html, extracted, taxonomy=None):
+    """``analyze_blog_html`` for a post whose metadata (``extracted``) is already known.
+
+    ``body_html`` is just the article body, e.g. ``content.rendered`` from the
+    WordPress REST API, so all of it is the main content.
+    """
+    timings = Timings()
+    timings.count("html_bytes", len(body_html.encode("utf-8")))
+    with timings.stage("parse"):
+        soup = parse_html(body_html)
+    timings.count("nodes", len(soup.find_all(True)))
+    return _analyze_content(soup, soup, dict(extracted), timings, taxonomy)
+
+
+def _analyze_content(soup, content, extracted, timings, taxonomy):
+    # --- Analyze Content ---
+    with timings.stage("text"):
+        content_text = main_text(content).lower()
+        text_hash = fingerprint(content_text)
+    timings.count("text_chars", len(content_text))
+    with timings.stage("terms"):
+        term_counts = count_terms(content_text)
+    timings.count("terms", len(term_counts))
+    with timings.stage("taxonomy"):
+        mentions = (taxonomy or load_taxonomy()).matcher.count(content_text)
+    with timings.stage("faq"):
+        faqs = extract_faqs(soup, content=content)
+    timings.count("faqs", len(faqs))
+    return {
+        "extracted": extracted,
+        "text_hash": text_hash,
+        "term_counts": term_counts,
+        "mentions": [[kind, label, n] for (kind, label), n in mentions.items()],
+        "faqs": faqs,
+        "timings": timings.as_dict(),
+    }
+
+
+def facts_fingerprint(facts):
+    """Fingerprint of everything in ``facts`` that the schema depends on (term counts follow from the text)."""
+    return fingerprint({key: value for key, value in facts.items() if key not in ("term_counts", "timings")})
+
+
+def score_keywords(pages, stats=None):
+    """Top TF-IDF terms of every ``(url, facts)`` in ``pages``, scored together in one ``score_counts`` batch.
+
+    The pages are first added to ``stats`` (a ``CorpusStats``) under their
+    URLs; without ``stats`` each page is ranked by its own term frequencies.
+    """
+    counts = [facts["term_counts"] for _, facts in pages]
+    if stats is None:
+        return score_counts(counts, CorpusStats(), top_k=TOP_KEYWORDS)
+    return score_counts(counts, stats, top_k=TOP_KEYWORDS, doc_ids=[url for url, _ in pages])
+
+
+def build_blog_schema(blog_url, category, facts, stats=None, site=None, taxonomy=None, timings=None, keywords=None):
+    """Assemble the ``@graph`` from ``analyze_blog_html`` facts. Returns ``(schema, checklist)``.
+
+    Only the page's own nodes are built here; the publisher and other
+    site-wide nodes come pre-built from ``site`` (default: ``load_site()``)
+    and the post references the publisher by ``@id``. ``keywords`` are the
+    page's terms from ``score_keywords`` when a bulk run scored them with
+    other pages; otherwise the page is scored alone. Keyword scoring and
+    assembly are recorded on ``timings`` when given.
+    """
+    timings = timings if timings is not None else Timings()
+    site = site or load_site()
+    taxonomy = taxonomy or load_taxonomy()
+    extracted = dict(facts["extracted"])
+
+    # --- Defaults ---
+    defaults = {
+        "title": "Untitled Blog Post",
+        "description": "Educational blog post from Future Vision Computers.",
+        "image": "https://futurevisioncomputers.com/wp-content/uploads/2025/10/default.jpg",
+        "author": "Siddharth Parakh",
+        "published": datetime.now().isoformat(),
+        "modified": datetime.now().isoformat(),
+        "keywords": category + ", Education, Training"
+    }
+
+    checklist = {}
+    for key in defaults:
+        if extracted.get(key):
+            checklist[key] = f"✅ {key.title()} — Extracted from site"
+        else:
+            extracted[key] = defaults[key]
+            checklist[key] = f"⚠️ {key.title()} — Default used (not found on page)"
+
+    if keywords is None:
+        with timings.stage("keywords"):
+            keywords = score_keywords([(blog_url, facts)], stats)[0]
+    build_start = time.perf_counter()
+
+    # --- Enriched Keywords ---
+    base_keywords = [k.strip().title() for k in (extracted["keywords"].split(",") if extracted["keywords"] else [])]
+    derived_keywords = list(dict.fromkeys(base_keywords + [category.title()] + [w.title() for w in keywords]))
+    checklist["keywords"] = "✅ Keywords — Auto-updated from content + category"
+
+    # --- Dynamic About Section ---
+    detected = taxonomy.rank(facts["mentions"])
+    names = [taxonomy.canonical(category) or category.title(),
+             *[label for label, n in detected.get("courses", []) + detected.get("topics", []) if n >= MIN_TOPIC_MENTIONS],
+             *derived_keywords[:6]]
+    about_items, seen = [], set()
+    for name in names:
+        key = normalize_term(name)
+        if key not in seen and len(about_items) < MAX_ABOUT:
+            seen.add(key)
+            about_items.append(Thing(name=name))
+    checklist["about"] = f"✅ About — {', '.join([a.name for a in about_items])}"
+
+    # --- Audience Detection ---
+    detected_audience = [label for label, _ in detected.get("audience", [])[:MAX_AUDIENCE]]
+    if not detected_audience:
+        detected_audience = ["Students", "Professionals"]
+    checklist["audience"] = f"✅ Audience — {', '.join(detected_audience)}"
+
+    # --- Smart FAQ Generation ---
+    faq_items = facts["faqs"]
+    if not faq_items:
+        faq_items = [
+            (f"What is {category}?", f"This blog explains {category} concepts with practical examples."),
+            (f"Who should learn {category}?", f"{category} is ideal for students and professionals in analytics, business, or technology."),
+            (f"How does this blog help in {category}?", f"This blog provides step-by-step {category} tutorials and use cases for real-world applications.")
+        ]
+        checklist["faq"] = "✅ FAQ — Auto-created based on category and title"
+    else:
+        checklist["faq"] = f"✅ FAQ — {len(faq_items)} detected from page"
+
+    # --- Build Schema ---
+    parsed = urlparse(blog_url)
+    base_url = f"{parsed.scheme}://{parsed.netloc}"
+
+    post = BlogPosting(
+        id=blog_url,
+        headline=extracted["title"],
+        description=extracted["description"],
+        image=ImageObject(url=extracted["image"], width=1200, height=630),
+        author=Person(name=extracted["author"], url=base_url),
+        publisher=site.publisher,
+        date_published=extracted["published"],
+        date_modified=extracted["modified"],
+        is_accessible_for_free=True,
+        in_language="en-IN",
+        is_family_friendly=True,
+        genre=category + " Blog",
+        keywords=derived_keywords,
+        audience=EducationalAudience(educational_role="learner", audience_type=", ".join(detected_audience)),
+        about=about_items,
+        potential_action={"@type": "ReadAction", "target": blog_url},
+        main_entity_of_page=WebPage(id=blog_url),
+    )
+    schema = build_graph(post, build_faq_page(faq_items, context=False, id=blog_url + "#faq"), *site.nodes)
+    timings.add("build", time.perf_counter() - build_start)
+    return schema, checklist
@@ -0,0 +1,313 @@
+"""Typed schema.org node builders shared by every generator app.
+
+Each node type is a slotted dataclass whose fields are the schema.org
+property names in snake_case (``street_address`` -> ``streetAddress``).
+``to_dict`` turns a node tree into a JSON-LD dict, leaving out properties
+that are ``None``; ``id`` becomes ``@id`` and ``types`` overrides ``@type``
+for multi-typed nodes. The ``build_*`` functions are the entry points the
+apps use and return ready-to-serialise dicts.
+
+Only the standard library is imported here, so schema can be generated in a
+worker process without loading Streamlit or the HTML stack.
+"""
+
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from datetime import date
+from typing import Any, ClassVar, List, Optional, Tuple, Union
+
+CONTEXT = "https://schema.org"
+
+
+def _camel(name):
+    head, *rest = name.split("_")
+    return head + "".join(word.title() for word in rest)
+
+
+@lru_cache(maxsize=None)
+def _properties(cls):
+    """``(attribute, JSON-LD key)`` of a node class's properties, worked out once per class."""
+    return tuple((field.name, _camel(field.name)) for field in fields(cls) if field.name not in ("id", "types"))
+
+
+def _value(value):
+    if isinstance(value, Node):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [_value(item) for item in value]
+    if isinstance(value, date):
+        return str(value)
+    return value
+
+
+def split_list(text):
+    """Split a comma separated form field into stripped, non-empty items."""
+    return [item.strip() for item in (text or "").split(",") if item.strip()]
+
+
+@dataclass(slots=True)
+class Node:
+    schema_type: ClassVar[str] = "Thing"
+
+    id: Optional[str] = None
+    types: Optional[List[str]] = None
+
+    def to_dict(self, context=False):
+        out = {"@context": CONTEXT} if context else {}
+        out["@type"] = self.types or self.schema_type
+        if self.id is not None:
+            out["@id"] = self.id
+        for name, key in _properties(type(self)):
+            value = getattr(self, name)
+            if value is not None:
+                out[key] = _value(value)
+        return out
+
+
+@dataclass(slots=True)
+class Thing(Node):
+    name: Optional[str] = None
+    description: Optional[str] = None
+    url: Optional[str] = None
+    image: Any = None
+    same_as: Optional[List[str]] = None
+
+
+@dataclass(slots=True)
+class PostalAddress(Node):
+    schema_type: ClassVar[str] = "PostalAddress"
+
+    street_address: Optional[str] = None
+    address_locality: Optional[str] = None
+    address_region: Optional[str] = None
+    postal_code: Optional[str] = None
+    address_country: Optional[str] = None
+
+
+@dataclass(slots=True)
+class GeoCoordinates(Node):
+    schema_type: ClassVar[str] = "GeoCoordinates"
+
+    latitude: Optional[str] = None
+    longitude: Optional[str] = None
+
+
+@dataclass(slots=True)
+class OpeningHoursSpecification(Node):
+    schema_type: ClassVar[str] = "OpeningHoursSpecification"
+
+    day_of_week: Optional[List[str]] = None
+    opens: Optional[str] = None
+    closes: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ImageObject(Node):
+    schema_type: ClassVar[str] = "ImageObject"
+
+    url: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    caption: Optional[str] = None
+
+
+@dataclass(slots=True)
+class VideoObject(Thing):
+    schema_type: ClassVar[str] = "VideoObject"
+
+    thumbnail_url: Optional[str] = None
+    upload_date: Optional[Union[str, date]] = None
+    content_url: Optional[str] = None
+    embed_url: Optional[str] = None
+    duration: Optional[str] = None
+
+
+@dataclass(slots=True)
+class WebPage(Thing):
+    schema_type: ClassVar[str] = "WebPage"
+
+
+@dataclass(slots=True)
+class Place(Thing):
+    schema_type: ClassVar[str] = "Place"
+
+    address: Optional[Union[PostalAddress, str]] = None
+    geo: Optional[GeoCoordinates] = None
+    telephone: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Organization(Thing):
+    schema_type: ClassVar[str] = "Organization"
+
+    logo: Optional[Union[ImageObject, str]] = None
+    telephone: Optional[str] = None
+    email: Optional[str] = None
+    address: Optional[Union[PostalAddress, str]] = None
+    area_served: Optional[str] = None
+    geo: Optional[GeoCoordinates] = None
+    has_map: Optional[str] = None
+    opening_hours_specification: Optional[List[OpeningHoursSpecification]] = None
+    location: Optional[Place] = None
+
+
+@dataclass(slots=True)
+class EducationalOrganization(Organization):
+    schema_type: ClassVar[str] = "EducationalOrganization"
+
+
+@dataclass(slots=True)
+class Person(Thing):
+    schema_type: ClassVar[str] = "Person"
+
+    knows_about: Optional[List[str]] = None
+    works_for: Optional[Organization] = None
+
+
+@dataclass(slots=True)
+class Audience(Node):
+    schema_type: ClassVar[str] = "Audience"
+
+    educational_role: Optional[str] = None
+    audience_type: Optional[str] = None
+
+
+@dataclass(slots=True)
+class EducationalAudience(Audience):
+    schema_type: ClassVar[str] = "EducationalAudience"
+
+
+@dataclass(slots=True)
+class Offer(Node):
+    schema_type: ClassVar[str] = "Offer"
+
+    price: Optional[Union[str, float]] = None
+    price_currency: Optional[str] = None
+    availability: Optional[str] = None
+    url: Optional[str] = None
+    valid_from: Optional[Union[str, date]] = None
+
+
+@dataclass(slots=True)
+class CourseInstance(Node):
+    schema_type: ClassVar[str] = "CourseInstance"
+
+    course_mode: Any = None
+    start_date: Optional[Union[str, date]] = None
+    end_date: Optional[Union[str, date]] = None
+    duration: Optional[str] = None
+    course_workload: Optional[str] = None
+    instructor: Optional[Person] = None
+    location: Any = None
+    offers: Optional[Offer] = None
+
+
+@dataclass(slots=True)
+class Course(Thing):
+    schema_type: ClassVar[str] = "Course"
+
+    alternate_name: Optional[str] = None
+    identifier: Optional[dict] = None
+    course_code: Optional[str] = None
+    provider: Optional[Organization] = None
+    has_course_instance: Optional[CourseInstance] = None
+    video: Optional[VideoObject] = None
+    educational_level: Optional[str] = None
+    course_prerequisites: Optional[str] = None
+    educational_credential_awarded: Optional[str] = None
+    in_language: Optional[str] = None
+    time_required: Optional[str] = None
+    teaches: Optional[List[str]] = None
+    learning_resource_type: Optional[List[str]] = None
+    learning_outcome: Optional[List[str]] = None
+    aggregate_rating: Optional[dict] = None
+    author: Optional[Person] = None
+    educational_alignment: Optional[dict] = None
+    potential_action: Optional[dict] = None
+    license: Optional[str] = None
+    citation: Optional[List[str]] = None
+    keywords: Optional[List[str]] = None
+    about: Any = None
+    interaction_statistic: Optional[dict] = None
+    audience: Optional[Audience] = None
+
+
+@dataclass(slots=True)
+class Answer(Node):
+    schema_type: ClassVar[str] = "Answer"
+
+    text: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Question(Node):
+    schema_type: ClassVar[str] = "Question"
+
+    name: Optional[str] = None
+    accepted_answer: Optional[Answer] = None
+
+
+@dataclass(slots=True)
+class FAQPage(Node):
+    schema_type: ClassVar[str] = "FAQPage"
+
+    main_entity: Optional[List[Question]] = None
+
+
+@dataclass(slots=True)
+class BlogPosting(Thing):
+    schema_type: ClassVar[str] = "BlogPosting"
+
+    headline: Optional[str] = None
+    author: Optional[Person] = None
+    publisher: Optional[Union[Organization, dict]] = None
+    date_published: Optional[Union[str, date]] = None
+    date_modified: Optional[Union[str, date]] = None
+    is_accessible_for_free: Optional[bool] = None
+    in_language: Optional[str] = None
+    is_family_friendly: Optional[bool] = None
+    genre: Optional[str] = None
+    article_section: Optional[str] = None
+    keywords: Optional[List[str]] = None
+    audience: Optional[Audience] = None
+    about: Any = None
+    word_count: Optional[int] = None
+    article_body: Optional[str] = None
+    license: Optional[str] = None
+    citation: Optional[List[str]] = None
+    educational_alignment: Optional[dict] = None
+    speakable: Optional[dict] = None
+    is_part_of: Optional[dict] = None
+    video: Optional[VideoObject] = None
+    mentions: Optional[List[Course]] = None
+    related_link: Optional[List[str]] = None
+    potential_action: Optional[dict] = None
+    main_entity_of_page: Optional[WebPage] = None
+
+
+def build_postal_address(address: PostalAddress, context=False) -> dict:
+    return address.to_dict(context)
+
+
+def build_organization(org: Organization, context=True) -> dict:
+    return org.to_dict(context)
+
+
+def build_course(course: Course, context=True) -> dict:
+    return course.to_dict(context)
+
+
+def build_blog_posting(post: BlogPosting, context=True) -> dict:
+    return post.to_dict(context)
+
+
+def build_faq_page(faqs: List[Union[Question, Tuple[str, str]]], context=True, id=None) -> dict:
+    """FAQPage from ``Question`` nodes or ``(question, answer)`` pairs."""
+    questions = [faq if isinstance(faq, Question) else Question(name=faq[0], accepted_answer=Answer(text=faq[1]))
+                 for faq in faqs]
+    return FAQPage(id=id, main_entity=questions).to_dict(context)
+
+
+def build_graph(*nodes: Union[Node, dict]) -> dict:
+    """Wrap several nodes in one ``@graph`` document."""
+    return {"@context": CONTEXT, "@graph": [node.to_dict() if isinstance(node, Node) else node for node in nodes]}
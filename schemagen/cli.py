@@ -0,0 +1,476 @@
+"""Headless batch generation: CSV / JSONL / Excel rows in, JSON-LD out.
+
+    python -m schemagen course courses.csv -o courses.jsonl
+    python -m schemagen full-course catalogue.xlsx --out-dir schema/ --name-field course_code
+    python -m schemagen blog-url posts.csv -o posts.jsonl --workers 4
+    python -m schemagen blog-site https://example.com/post-sitemap.xml --category "Power BI" --out-dir schema/
+
+Each input row holds the same fields as the matching Streamlit form (column
+names are the parameter names of the ``schemagen.course`` /
+``schemagen.article`` functions). List fields such as ``faqs`` or
+``branches`` can be given as JSON in a single cell, or spread over numbered
+columns: ``question_1`` / ``answer_1``, ``branch_1_street`` / ``branch_1_city``.
+
+The input can also be a project store saved from the apps
+(``schemagen.store``): every stored course, or every post saved with that
+kind's form, is regenerated:
+
+    python -m schemagen full-course ~/.cache/schemagen/projects.sqlite3 --out-dir schema/ --name-field slug
+
+Rows are streamed from the input, generated in chunks on a process pool
+(``schemagen.engine``) and written in input order as they complete, with
+only a bounded number of rows in flight, so memory stays flat however long
+the input is. Streamlit is never imported.
+
+``blog-site`` takes a sitemap URL, sitemap file or URL list instead of rows
+and keeps ``--out-dir`` up to date incrementally (``schemagen.crawl.refresh``):
+pages unchanged since the last run are skipped — without a request when
+their sitemap ``<lastmod>`` is unchanged — and files are only rewritten
+when their JSON-LD changed. With ``--wordpress`` the input is the site's URL
+and posts are read 100 at a time from the WordPress REST API
+(``schemagen.wordpress``), fetching a page only when the API lacks one of
+its fields; posts whose ``modified_gmt`` is unchanged are skipped.
+
+Output is streamed through ``schemagen.output``: each document is written
+as soon as it is generated, one line per row to ``-o`` or one file per row
+to ``--out-dir`` (a directory, or a ``.zip`` archive); ``--compact`` drops
+the indentation from those files. A row that cannot be parsed or
+generated is reported on stderr and counted as failed, and the run goes
+on; a file name already written in this run (two rows with the same
+``--name-field`` value) gets a ``-row-N`` suffix instead of overwriting
+it. ``--validate`` checks every document
+against Google's rich-result rules (``schemagen.validate``) and prints a
+summary; ``validate`` does the same for output written earlier:
+
+    python -m schemagen validate schema/
+
+``graph`` merges such output into one site-wide ``@graph``
+(``schemagen.graph``): organizations, people, places, courses and their
+instances are stored once under a canonical ``@id`` and referenced from
+every page. ``-o`` writes the consolidated graph, ``--out-dir`` one slice
+per page with just the entities that page uses:
+
+    python -m schemagen graph schema/ -o site-graph.jsonld
+
+``--timings`` (``blog-site``) logs each page's stage timings, byte and node
+counts as one JSON object per line on stderr, followed by a per-stage
+summary; ``--profile FILE`` runs the command under cProfile (or
+pyinstrument with ``--profiler``) and saves the result to ``FILE``. Only
+the calling process is profiled, so pair it with ``--workers 0``.
+"""
+
+import argparse
+import csv
+import importlib
+import inspect
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+from functools import lru_cache, partial
+
+from schemagen import engine
+from schemagen.manifest import MANIFEST_NAME
+from schemagen.output import BACKENDS, DirectorySink, JsonlSink, ZipSink
+from schemagen.timing import PROFILERS, StageStats, Timings, profiled
+from schemagen.validate import Report, validate
+
+KINDS = {
+    "course": ("schemagen.course", "course_schema"),
+    "course-branches": ("schemagen.course", "course_branches_schema"),
+    "full-course": ("schemagen.course", "full_course_schema"),
+    "article": ("schemagen.article", "education_article_schema"),
+    "blog-posting": ("schemagen.article", "blog_posting_schema"),
+    "blog-url": ("schemagen.blog", "generate_blog_schema"),
+}
+
+STORE_EXTENSIONS = (".sqlite3", ".sqlite", ".db")  # a schemagen.store project store
+JSON_FIELDS = frozenset(["faqs", "branches", "images", "courses", "related_links", "video"])
+_QUESTION = re.compile(r"^(question|answer)_(\d+)$")
+_BRANCH = re.compile(r"^branch_(\d+)_(\w+)$")
+_SLUG = re.compile(r"[^a-z0-9]+")
+_ROW_ERROR = "__error__"  # a row read_rows could not parse: generating it fails with this message
+
+
+@lru_cache(maxsize=None)
+def _generator(kind):
+    module, name = KINDS[kind]
+    return getattr(importlib.import_module(module), name)
+
+
+@lru_cache(maxsize=None)
+def _params(kind):
+    return inspect.signature(_generator(kind)).parameters
+
+
+def read_rows(path, kind=None):
+    """Yield input rows as dicts, streaming from CSV, JSONL, Excel (``-`` is stdin CSV) or a project store.
+
+    A line that cannot be parsed is yielded as a row that fails to
+    generate, so it is reported with its number and the rest carry on.
+
+    From a project store (``schemagen.store``) the rows are the stored
+    courses, or the posts saved for ``kind``.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in STORE_EXTENSIONS:
+        from schemagen.store import ProjectStore
+
+        if not os.path.exists(path):
+            raise SystemExit(f"No project store at {path}")
+        with ProjectStore(path) as store:
+            yield from store.rows(kind)
+    elif ext in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as e:
+                    row = {_ROW_ERROR: f"line {number}: invalid JSON ({e})"}
+                yield row if isinstance(row, dict) else {_ROW_ERROR: f"line {number}: not a JSON object"}
+    elif ext in (".xlsx", ".xlsm"):
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise SystemExit("Reading Excel files needs openpyxl: pip install openpyxl")
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = [str(h).strip() if h is not None else "" for h in next(rows, ())]
+            for values in rows:
+                yield {h: v for h, v in zip(header, values) if h and v is not None}
+        finally:
+            workbook.close()
+    else:
+        f = sys.stdin if path == "-" else open(path, encoding="utf-8-sig", newline="")
+        try:
+            reader = csv.DictReader(f)
+            while True:
+                try:
+                    row = next(reader)
+                except StopIteration:
+                    break
+                except csv.Error as e:
+                    row = {_ROW_ERROR: f"line {reader.line_num}: {e}"}
+                yield row
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+
+def row_kwargs(kind, row):
+    """Turn a raw input row into keyword arguments for the ``kind`` generator."""
+    params = _params(kind)
+    kwargs = {}
+    faqs = {}
+    branches = {}
+    for key, value in row.items():
+        if value is None or (isinstance(value, str) and not value.strip()):
+            continue
+        match = _QUESTION.match(key)
+        if match:
+            faqs.setdefault(int(match.group(2)), {})[match.group(1)] = str(value)
+            continue
+        match = _BRANCH.match(key)
+        if match:
+            branches.setdefault(int(match.group(1)), {})[match.group(2)] = str(value)
+            continue
+        if key not in params:
+            continue
+        if key in JSON_FIELDS and isinstance(value, str):
+            value = json.loads(value)
+        default = params[key].default
+        if isinstance(default, bool) and isinstance(value, str):
+            value = value.strip().lower() in ("1", "true", "yes", "y")
+        elif isinstance(default, tuple) and isinstance(value, str):
+            value = [item.strip() for item in value.split(",") if item.strip()]
+        elif key == "word_count" and isinstance(value, str):
+            value = int(value)
+        kwargs[key] = value
+    if faqs and "faqs" in params:
+        kwargs["faqs"] = [(faqs[n].get("question", ""), faqs[n].get("answer", "")) for n in sorted(faqs)]
+    if branches and "branches" in params:
+        kwargs["branches"] = [branches[n] for n in sorted(branches)]
+    missing = [name for name, p in params.items()
+               if p.default is inspect.Parameter.empty and p.kind is not p.VAR_KEYWORD and name not in kwargs]
+    if missing:
+        raise ValueError(f"missing required field(s): {', '.join(missing)}")
+    return kwargs
+
+
+def generate(kind, row):
+    """Generate the JSON-LD for one row."""
+    if _ROW_ERROR in row:
+        raise ValueError(row[_ROW_ERROR])
+    result = _generator(kind)(**row_kwargs(kind, row))
+    return result[0] if kind == "blog-url" else result
+
+
+def generate_rows(kind, rows, workers=None, chunk_size=64, ordered=True):
+    """Yield ``(number, row, schema, error)`` for every row (numbered from 1), in input order unless ``ordered`` is false.
+
+    Chunks of rows are generated on a process pool by ``schemagen.engine``;
+    ``workers=0`` generates in this process.
+    """
+    for result in engine.run(rows, partial(generate, kind), workers=workers, chunk_size=chunk_size, ordered=ordered):
+        yield result.index + 1, result.item, result.value, result.error
+
+
+def output_name(row, index, name_field):
+    value = str(row.get(name_field) or "") if name_field else ""
+    slug = _SLUG.sub("-", value.lower()).strip("-")
+    return f"{slug or f'row-{index:06d}'}.json"
+
+
+def read_entries(source, timeout=10, scheduler=None):
+    """``SitemapEntry`` per page from a sitemap URL, a local sitemap file (``.xml`` or ``.xml.gz``) or a URL list."""
+    from schemagen.crawl import SitemapEntry, iter_sitemap, parse_url_list, sitemap_entries
+
+    if source.startswith(("http://", "https://")):
+        return list(iter_sitemap(source, timeout=timeout, scheduler=scheduler))
+    with open(source, "rb") as f:
+        data = f.read()
+    if data[:2] == b"\x1f\x8b" or data.lstrip().startswith(b"<"):
+        pages, children = sitemap_entries(data)
+        for child in children:
+            pages += iter_sitemap(child.url, timeout=timeout, scheduler=scheduler)
+        unique = {}
+        for entry in pages:
+            unique.setdefault(entry.url, entry)
+        return list(unique.values())
+    return [SitemapEntry(url) for url in parse_url_list(data.decode("utf-8-sig"))]
+
+
+def read_documents(path):
+    """``(label, document)`` pairs from generated output: a JSONL file, a directory or a ZIP of JSON files.
+
+    JSONL lines of the form ``{"url": ..., "schema": ...}`` (bulk-mode exports) are unwrapped.
+    """
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".json"):
+                with open(os.path.join(path, name), encoding="utf-8") as f:
+                    yield name, json.load(f)
+    elif path.lower().endswith(".zip"):
+        with zipfile.ZipFile(path) as zf:
+            for name in zf.namelist():
+                if name.endswith(".json"):
+                    yield name, json.loads(zf.read(name))
+    else:
+        f = sys.stdin if path == "-" else open(path, encoding="utf-8")
+        try:
+            for number, line in enumerate(f, 1):
+                if line.strip():
+                    document = json.loads(line)
+                    if isinstance(document, dict) and "schema" in document and "@context" not in document:
+                        yield document.get("url") or f"line {number}", document["schema"]
+                    else:
+                        yield f"line {number}", document
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+
+def validate_output(args):
+    report = Report()
+    for label, document in read_documents(args.input):
+        report.add(validate(document), label)
+    print(report.format(), file=sys.stderr)
+    return 1 if report.with_errors else 0
+
+
+def _page_url(label, document):
+    """The page a document describes: its label when that is a URL, else its first node's ``url`` or ``@id``."""
+    if label.startswith(("http://", "https://")):
+        return label
+    nodes = document.get("@graph", [document]) if isinstance(document, dict) else document
+    for node in nodes:
+        if isinstance(node, dict) and str(node.get("url") or node.get("@id") or "").startswith(("http://", "https://")):
+            return node.get("url") or node["@id"]
+    return label
+
+
+def site_graph(args):
+    from schemagen.crawl import output_filename
+    from schemagen.graph import SiteGraph
+    from schemagen.output import dumps
+    from schemagen.site import load_site
+
+    graph = SiteGraph(args.base_url or load_site().get("url"))
+    input_bytes = 0
+    for label, document in read_documents(args.input):
+        graph.add(_page_url(label, document), document)
+        input_bytes += len(dumps(document, compact=args.compact, backend=args.backend))
+    if args.out_dir:
+        sink_type = ZipSink if args.out_dir.lower().endswith(".zip") else DirectorySink
+        with sink_type(args.out_dir, compact=args.compact, backend=args.backend) as sink:
+            for page_url in graph.pages:
+                sink.write(output_filename(page_url), graph.page(page_url))
+        output_bytes = sink.bytes
+    else:
+        data = dumps(graph.document(), compact=args.compact, backend=args.backend) + b"\n"
+        if args.output == "-":
+            sys.stdout.buffer.write(data)
+        else:
+            with open(args.output, "wb") as f:
+                f.write(data)
+        output_bytes = len(data)
+    conflicts = sum(graph.conflicts.values())
+    print(f"{len(graph.pages)} pages: {graph.seen} entities -> {len(graph.entities)} after de-duplication, "
+          f"{input_bytes:,} -> {output_bytes:,} bytes, {conflicts} conflicting values", file=sys.stderr)
+    for (entity_id, prop), n in graph.conflicts.most_common(10):
+        print(f"  {entity_id} {prop}: {n} differing value(s) ignored", file=sys.stderr)
+    return 0
+
+
+def refresh_site(args):
+    from schemagen.crawl import CHANGED, FAILED, SKIPPED, UNCHANGED, refresh, refresh_posts
+    from schemagen.fetch import PageCache
+    from schemagen.keywords import default_stats
+    from schemagen.manifest import Manifest
+    from schemagen.schedule import Scheduler
+
+    if not (args.out_dir and args.category):
+        raise SystemExit("blog-site needs --out-dir and --category")
+    scheduler = Scheduler(rate=args.rate, per_host=args.per_host)
+    # max_age=0: always revalidate, so edits made minutes ago are picked up (unchanged pages cost a 304)
+    counts = dict.fromkeys([SKIPPED, CHANGED, UNCHANGED, FAILED], 0)
+    report = Report() if args.validate else None
+    timings = StageStats() if args.timings else None
+    start = time.perf_counter()
+    manifest = Manifest(args.manifest) if args.manifest else None
+    try:
+        options = dict(workers=args.threads, cache=PageCache(max_age=0), stats=default_stats(),
+                       processes=args.workers, scheduler=scheduler, compact=args.compact)
+        if args.wordpress:
+            results = refresh_posts(args.input, args.category, args.out_dir, manifest, **options)
+        else:
+            entries = read_entries(args.input, scheduler=scheduler)
+            results = refresh([entry.url for entry in entries], args.category, args.out_dir, manifest,
+                              lastmods={entry.url: entry.lastmod for entry in entries if entry.lastmod}, **options)
+        for result in results:
+            counts[result.status] += 1
+            if result.error:
+                print(f"{result.url}: {result.error}", file=sys.stderr)
+            elif report is not None and result.schema is not None:
+                report.add(validate(result.schema), result.url)
+            if timings is not None and result.timings:
+                timings.add(result.timings)
+                print(Timings(result.timings).to_json(url=result.url, status=result.status), file=sys.stderr)
+    finally:
+        if manifest is not None:
+            manifest.close()
+        default_stats().save()
+    elapsed = time.perf_counter() - start
+    print(f"{sum(counts.values())} pages: {counts[CHANGED]} changed, {counts[UNCHANGED]} regenerated unchanged, "
+          f"{counts[SKIPPED]} skipped, {counts[FAILED]} failed in {elapsed:.1f}s", file=sys.stderr)
+    for host, m in scheduler.metrics().items():
+        print(f"{host}: {m['requests']} requests at {m['rate']:g}/s, {m['retries']} retries ({m['throttled']} throttled), "
+              f"wait avg {m['wait_avg']:.2f}s max {m['wait_max']:.2f}s", file=sys.stderr)
+    if timings is not None:
+        print(timings.format(), file=sys.stderr)
+    if report is not None:
+        print(report.format(), file=sys.stderr)
+    return 1 if counts[FAILED] or (report is not None and report.with_errors) else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m schemagen", description="Generate JSON-LD schema in batch.")
+    parser.add_argument("kind", choices=sorted([*KINDS, "blog-site", "validate", "graph"]),
+                        help="which form's schema to generate, 'validate' to check existing output or 'graph' "
+                             "to merge it into a site-wide @graph")
+    parser.add_argument("input", help="CSV, JSONL (.jsonl) or Excel (.xlsx) file, or a project store (.sqlite3); "
+                                      "'-' reads CSV from stdin. "
+                                      "For blog-site: sitemap URL or file (optionally gzipped), a URL list, "
+                                      "or with --wordpress the site URL. "
+                                      "For validate and graph: JSONL output, or a directory / .zip of JSON files")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("-o", "--output", default="-", help="JSONL output file (default: stdout)")
+    output.add_argument("--out-dir", help="write one JSON file per row into this directory, or into a .zip archive")
+    parser.add_argument("--name-field", help="row field used to name per-row files (default: row number)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count, 0: none)")
+    parser.add_argument("--chunk-size", type=int, default=64, help="rows per worker task")
+    parser.add_argument("--compact", action="store_true", help="no indentation in --out-dir files")
+    parser.add_argument("--backend", choices=BACKENDS, default="auto", help="JSON serialiser (auto: orjson if installed)")
+    parser.add_argument("--unordered", action="store_true", help="write rows as they finish instead of in input order")
+    parser.add_argument("--validate", action="store_true",
+                        help="check every document against rich-result rules and print a summary (exit 1 on errors)")
+    site = parser.add_argument_group("blog-site")
+    site.add_argument("--category", help="blog category used for keywords and FAQs")
+    site.add_argument("--manifest", help=f"incremental manifest (default: OUT_DIR/{MANIFEST_NAME})")
+    site.add_argument("--threads", type=int, default=8, help="download threads")
+    site.add_argument("--per-host", type=int, default=4, help="max concurrent requests per host")
+    site.add_argument("--rate", type=float, default=4.0, help="max requests per second per host (robots.txt Crawl-delay may lower it)")
+    site.add_argument("--wordpress", action="store_true",
+                      help="INPUT is a WordPress site: read posts from its REST API, fetching pages only for missing fields")
+    site.add_argument("--timings", action="store_true",
+                      help="log per-page stage timings as JSON lines on stderr, then a per-stage summary")
+    graph = parser.add_argument_group("graph")
+    graph.add_argument("--base-url", help="site URL that relative @ids and new entity @ids are based on "
+                                          "(default: the site config organization's url)")
+    parser.add_argument("--profile", metavar="FILE", help="profile the run and save it to FILE (pstats dump, or "
+                                                          "pyinstrument text / .html); use with --workers 0")
+    parser.add_argument("--profiler", choices=PROFILERS, default="cprofile", help="profiler for --profile")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        with profiled(args.profiler, args.profile):
+            status = run(args)
+        print(f"profile written to {args.profile}", file=sys.stderr)
+        return status
+    return run(args)
+
+
+def run(args):
+    if args.kind == "blog-site":
+        return refresh_site(args)
+    if args.kind == "validate":
+        return validate_output(args)
+    if args.kind == "graph":
+        return site_graph(args)
+
+    if args.out_dir:
+        sink_type = ZipSink if args.out_dir.lower().endswith(".zip") else DirectorySink
+        sink = sink_type(args.out_dir, compact=args.compact, backend=args.backend)
+    else:
+        target = sys.stdout.buffer if args.output == "-" else args.output
+        sink = JsonlSink(target, backend=args.backend)
+
+    report = Report() if args.validate else None
+    ok = failed = renamed = 0
+    names = {}  # output name -> number of the row written under it (--out-dir)
+    start = time.perf_counter()
+    try:
+        results = generate_rows(args.kind, read_rows(args.input, args.kind), args.workers, args.chunk_size, not args.unordered)
+        for index, row, schema, error in results:
+            name = output_name(row, index, args.name_field)
+            if not error and args.out_dir and name in names:  # JSONL output has no names to collide
+                unique = f"{name[:-len('.json')]}-row-{index:06d}.json"
+                print(f"row {index}: {name} was already written for row {names[name]}, writing {unique}", file=sys.stderr)
+                name = unique
+                renamed += 1
+            if not error:
+                try:
+                    sink.write(name, schema)
+                except (TypeError, ValueError) as e:  # not serialisable as JSON
+                    error = f"{type(e).__name__}: {e}"
+            if error:
+                failed += 1
+                print(f"row {index}: {error}", file=sys.stderr)
+                continue
+            names[name] = index
+            ok += 1
+            if report is not None:
+                report.add(validate(schema), f"row {index}")
+    finally:
+        sink.close()
+    elapsed = time.perf_counter() - start
+    print(f"{ok} generated, {failed} failed{f', {renamed} renamed (duplicate names)' if renamed else ''} "
+          f"in {elapsed:.1f}s", file=sys.stderr)
+    if report is not None:
+        print(report.format(), file=sys.stderr)
+    return 1 if failed or (report is not None and report.with_errors) else 0
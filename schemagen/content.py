@@ -0,0 +1,226 @@
+"""Main-content extraction: find the article body and read its text without the site chrome.
+
+Keyword, audience and FAQ analysis should only see what the post says,
+not the menus, sidebar widgets, footer, cookie banner or inline scripts
+that every page of a site repeats. ``main_content`` picks the element that
+holds the body:
+
+1. the selector learned for the page's host from an earlier page;
+2. the first of ``CONTENT_SELECTORS`` (``[itemprop=articleBody]``,
+   ``.entry-content``, … ``article``, ``main``) holding at least
+   ``MIN_TEXT`` characters;
+3. readability-style density scoring: every paragraph scores its parent
+   (and half for the grandparent) by length and commas, and the best
+   candidate is discounted by its link density.
+
+When the element was found by 2 or 3, a CSS selector for it is remembered
+per host (for the ``MAX_LEARNED_HOSTS`` most recently seen hosts), so later
+pages of the same site go straight to it. ``body`` is never remembered, nor
+is an element whose text is mostly links: one bad page would otherwise
+decide the body for every later page of the host. ``main_text``
+then reads the element's text, skipping ``BOILERPLATE_TAGS`` and elements
+whose class or id looks like chrome (share bars, related posts, comments…).
+"""
+
+import re
+import threading
+from collections import OrderedDict
+
+from bs4 import CData, NavigableString, Tag
+
+MIN_TEXT = 250  # characters a selector match needs to count as the body
+MIN_PARAGRAPH = 25
+DENSITY_CANDIDATES = 5  # top raw scores re-ranked by link density
+MIN_LEARN_TEXT_RATIO = 0.7  # share of an element's text outside links for its selector to be remembered
+MAX_LEARNED_HOSTS = 1024
+
+CONTENT_SELECTORS = (
+    "[itemprop=articleBody]",
+    ".entry-content",
+    ".post-content",
+    ".article-content",
+    ".post-body",
+    ".single-content",
+    "article",
+    "main",
+    "[role=main]",
+)
+BOILERPLATE_TAGS = frozenset(["script", "style", "noscript", "template", "nav", "aside", "footer", "header", "form",
+                              "iframe", "svg", "button", "select"])
+# No bare "widget": page builders such as Elementor wrap the body itself in "elementor-widget" classes
+BOILERPLATE = re.compile(r"share|social|related|comment|sidebar|widget-area|cookie|consent|newsletter|subscribe|"
+                         r"breadcrumb|advert|promo|popup|modal|menu|navigation|author-box|\bnav\b", re.I)
+_DIGITS = re.compile(r"\d")
+_NAME = re.compile(r"[\w-]+")  # an id or class usable in a selector
+_TEXT_TYPES = (NavigableString, CData)
+
+_learned = OrderedDict()  # host -> CSS selector of the content element, least recently used first
+_learned_lock = threading.Lock()
+
+
+def learned_selectors():
+    """A copy of the host -> selector map learned so far in this process."""
+    with _learned_lock:
+        return dict(_learned)
+
+
+def is_boilerplate(tag):
+    """Whether ``tag`` is chrome: one of ``BOILERPLATE_TAGS`` or a class / id / role matching ``BOILERPLATE``."""
+    return tag.name in BOILERPLATE_TAGS or _chrome_attrs(tag)
+
+
+def _chrome_attrs(tag):
+    attrs = tag.attrs
+    if not attrs:
+        return False
+    classes = attrs.get("class")
+    names = " ".join(classes) if isinstance(classes, list) else (classes or "")
+    names += " " + (attrs.get("id") or "") + " " + (attrs.get("role") or "")
+    return bool(BOILERPLATE.search(names))
+
+
+def main_text(node, separator=" "):
+    """Text of ``node`` without boilerplate subtrees; ``node`` itself is never skipped."""
+    parts = []
+    stack = [node]
+    while stack:
+        el = stack.pop()
+        if isinstance(el, Tag):
+            if el is not node and is_boilerplate(el):
+                continue
+            stack.extend(reversed(el.contents))
+        elif type(el) in _TEXT_TYPES:  # not comments, doctypes or script/style strings
+            parts.append(el)
+    return separator.join(parts)
+
+
+def _has_text(node, min_chars=MIN_TEXT):
+    """Whether ``node`` holds at least ``min_chars`` of non-blank text; stops reading once it does."""
+    total = 0
+    for text in node.strings:
+        total += len(text.strip())
+        if total >= min_chars:
+            return True
+    return False
+
+
+def _text_length(node):
+    return len(" ".join(node.get_text(" ").split()))
+
+
+_SELECTOR = re.compile(r"(\w+)?(?:\.([\w-]+)|#([\w-]+)|\[([\w-]+)=([\w-]+)\])?")
+
+
+def _parse_selector(selector):
+    """``(tag, attribute, value)`` for the simple selectors used here: ``tag``, ``tag.class``, ``tag#id``, ``[attr=value]``."""
+    tag, cls, element_id, attr, value = _SELECTOR.fullmatch(selector).groups()
+    if cls:
+        return tag, "class", cls
+    if element_id:
+        return tag, "id", element_id
+    return tag, attr, value
+
+
+def find_first(soup, selectors):
+    """The first element matching each of ``selectors`` (``None`` if none), found in a single pass.
+
+    One ``find_all`` walk with dictionary lookups per element is several
+    times cheaper than a CSS ``select_one`` per selector on a large page.
+    """
+    wanted = {}  # (attribute, value), or (None, tag) for bare tags -> [(position, required tag)]
+    for i, selector in enumerate(selectors):
+        tag, attr, value = _parse_selector(selector)
+        wanted.setdefault((attr, value) if attr else (None, tag), []).append((i, tag))
+    attributes = {attr for attr, _ in wanted if attr}
+    found = [None] * len(selectors)
+    missing = len(selectors)
+    for el in soup.find_all(True):
+        keys = [(None, el.name)]
+        el_attrs = el.attrs
+        for attr in attributes:
+            value = el_attrs.get(attr)
+            if value is not None:
+                keys.extend((attr, v) for v in (value if isinstance(value, list) else (value,)))
+        for key in keys:
+            for i, tag in wanted.get(key, ()):
+                if found[i] is None and (tag is None or tag == el.name):
+                    found[i] = el
+                    missing -= 1
+        if not missing:
+            break
+    return found
+
+
+def _selector_for(node):
+    """A selector that should find ``node`` on other pages of the site, or ``None``.
+
+    Ids and classes with digits (``post-123``) are page-specific and skipped.
+    """
+    if node.name in ("article", "main"):
+        return node.name
+    if node.name in ("body", "html"):
+        return None  # would match every page, and skip content selection on all of them
+    element_id = node.get("id")
+    if element_id and not _DIGITS.search(element_id) and _NAME.fullmatch(element_id):
+        return f"{node.name}#{element_id}"
+    classes = [c for c in node.get("class") or [] if not _DIGITS.search(c) and _NAME.fullmatch(c)]
+    return f"{node.name}.{classes[0]}" if classes else None
+
+
+def _text_ratio(node):
+    """Share of ``node``'s text that is not link text."""
+    text = _text_length(node)
+    if not text:
+        return 0.0
+    return 1 - min(sum(len(a.get_text(" ").strip()) for a in node.find_all("a")) / text, 1.0)
+
+
+def _by_density(soup):
+    scores = {}  # id(element) -> [score, element]; Tag equality is structural, so not keyed on the tag
+    for p in soup.find_all(["p", "pre", "li", "td"]):
+        text = p.get_text(" ")
+        length = len(text.strip())
+        if length < MIN_PARAGRAPH:
+            continue
+        score = 1 + text.count(",") + min(length // 100, 3)
+        for node, share in ((p.parent, score), (p.parent.parent if p.parent else None, score / 2)):
+            if isinstance(node, Tag):
+                entry = scores.setdefault(id(node), [0.0, node])
+                entry[0] += share
+    ranked = sorted((entry for entry in scores.values()
+                     if not is_boilerplate(entry[1])),
+                    key=lambda entry: entry[0], reverse=True)
+    best, best_score = None, 0.0
+    for score, node in ranked[:DENSITY_CANDIDATES]:
+        score *= _text_ratio(node)
+        if score > best_score:
+            best, best_score = node, score
+    return best
+
+
+def main_content(soup, host=None):
+    """The element holding the article body, or ``soup`` itself when nothing better is found."""
+    with _learned_lock:
+        learned = _learned.get(host) if host else None
+        if learned:
+            _learned.move_to_end(host)
+    selectors = (learned, *CONTENT_SELECTORS) if learned else CONTENT_SELECTORS
+    node = None
+    for match in find_first(soup, selectors):
+        if match is not None and _has_text(match):
+            node = match
+            break
+    if node is None:
+        node = _by_density(soup)
+    if node is None:
+        return soup
+
+    if host and not (learned and node is match):
+        selector = _selector_for(node)
+        if selector and _text_ratio(node) >= MIN_LEARN_TEXT_RATIO:
+            with _learned_lock:
+                _learned[host] = selector
+                _learned.move_to_end(host)
+                while len(_learned) > MAX_LEARNED_HOSTS:
+                    _learned.popitem(last=False)
+    return node
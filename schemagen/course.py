@@ -0,0 +1,232 @@
+"""Course schema generation, one function per course form.
+
+Parameters mirror the Streamlit form fields (same names as the app
+variables), so the apps and batch tools produce identical output from the
+same inputs. Comma separated fields are accepted as plain strings.
+"""
+
+from datetime import date
+from urllib.parse import urljoin
+
+from schemagen.builders import (
+    Answer,
+    Audience,
+    Course,
+    CourseInstance,
+    EducationalOrganization,
+    GeoCoordinates,
+    Offer,
+    OpeningHoursSpecification,
+    Organization,
+    Person,
+    Place,
+    PostalAddress,
+    Question,
+    VideoObject,
+    build_course,
+    build_faq_page,
+    build_organization,
+    split_list,
+)
+
+IN_STOCK = "https://schema.org/InStock"
+OPEN_DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+
+
+def faq_questions(faqs):
+    """``Question`` nodes for every ``(question, answer)`` pair where both are filled in."""
+    return [Question(name=q, accepted_answer=Answer(text=a)) for q, a in faqs if q and a]
+
+
+def course_schema(*, inst_name, inst_url, inst_logo="", inst_phone="", inst_street="", inst_city="",
+                  inst_state="", inst_pin="", inst_country="IN", inst_social="",
+                  course_name, course_code="", course_desc="", course_mode=("Offline",),
+                  course_start=None, course_end=None, course_duration="", course_fee=0,
+                  course_currency="INR", cert_award="", topics="", learning_methods="",
+                  inst_name_instructor="", inst_exp="", audience_type=""):
+    """Single-location Course with one CourseInstance (``GenerateSchema.py``)."""
+    address = PostalAddress(
+        street_address=inst_street,
+        address_locality=inst_city,
+        address_region=inst_state,
+        postal_code=inst_pin,
+        address_country=inst_country,
+    )
+    course = Course(
+        name=course_name,
+        alternate_name=course_name,
+        course_code=course_code,
+        description=course_desc,
+        provider=EducationalOrganization(
+            name=inst_name,
+            url=inst_url,
+            logo=inst_logo,
+            address=address,
+            telephone=inst_phone,
+            same_as=split_list(inst_social),
+        ),
+        has_course_instance=CourseInstance(
+            course_mode=list(course_mode),
+            start_date=course_start or date.today(),
+            end_date=course_end,
+            duration=course_duration,
+            instructor=Person(name=inst_name_instructor, description=inst_exp),
+            location=Place(name=f"{inst_name} - {inst_city}", address=address),
+            offers=Offer(
+                price=str(course_fee),
+                price_currency=course_currency,
+                availability=IN_STOCK,
+                url=f"{inst_url}/courses/{course_name.replace(' ', '-').lower()}",
+                valid_from=date.today(),
+            ),
+        ),
+        educational_credential_awarded=cert_award,
+        time_required=course_duration,
+        teaches=split_list(topics),
+        learning_resource_type=split_list(learning_methods),
+        about=["Computer Skills", "Office Productivity", "IT Training"],
+        audience=Audience(audience_type=audience_type),
+    )
+    return build_course(course)
+
+
+def branch_places(provider_name, branches):
+    """``Place`` nodes for branch dicts (``street``, ``city``, ``region``, ``postal``, ``country``, ``telephone``).
+
+    Branches without a street and city are skipped, as in the form.
+    """
+    places = []
+    for branch in branches:
+        if not (branch.get("street") and branch.get("city")):
+            continue
+        places.append(Place(
+            name=f"{provider_name} - {branch['city']}",
+            address=PostalAddress(
+                street_address=branch["street"],
+                address_locality=branch["city"],
+                address_region=branch.get("region", ""),
+                postal_code=branch.get("postal", ""),
+                address_country=branch.get("country", "IN"),
+            ),
+            telephone=branch.get("telephone", ""),
+        ))
+    return places
+
+
+def course_branches_schema(*, course_name, course_desc="", course_url="", course_duration="", course_fee="",
+                           course_mode="Offline", provider_name, provider_url="", provider_logo="",
+                           branches=(), faqs=()):
+    """Course offered at several branches plus its FAQPage (``GenerateSchemaFAQ.py``)."""
+    course = Course(
+        name=course_name,
+        description=course_desc,
+        provider=Organization(name=provider_name, url=provider_url, logo=provider_logo),
+        has_course_instance=CourseInstance(
+            course_mode=course_mode,
+            course_workload=course_duration,
+            offers=Offer(price=course_fee, price_currency="INR", availability=IN_STOCK, url=course_url),
+            location=branch_places(provider_name, branches),
+        ),
+    )
+    return [build_course(course), build_faq_page(faq_questions(faqs))]
+
+
+def organization_id(inst_id, inst_url):
+    """``inst_id`` as an absolute IRI: a relative one (``#FutureVision``) is resolved against ``inst_url``.
+
+    A relative ``@id`` would resolve against each page's own URL, making the
+    provider a different node on every page; absolute ones pass through unchanged.
+    """
+    return urljoin(inst_url, inst_id) if inst_id and inst_url else inst_id
+
+
+def institute_organization(*, inst_name, inst_url, inst_logo="", inst_phone="", inst_email="", inst_address="",
+                           inst_lat="", inst_long="", inst_area="", inst_map="", inst_social="",
+                           opens="08:00", closes="20:00", open_days=OPEN_DAYS, inst_id=""):
+    """EducationalOrganization + LocalBusiness node for the institute, with ``@id`` ``inst_id`` if given."""
+    return Organization(
+        id=organization_id(inst_id, inst_url) or None,
+        types=["EducationalOrganization", "LocalBusiness"],
+        name=inst_name,
+        url=inst_url,
+        logo=inst_logo,
+        telephone=inst_phone,
+        email=inst_email,
+        address=inst_address,
+        area_served=inst_area,
+        geo=GeoCoordinates(latitude=inst_lat, longitude=inst_long),
+        has_map=inst_map,
+        opening_hours_specification=[OpeningHoursSpecification(day_of_week=list(open_days), opens=opens, closes=closes)],
+        same_as=split_list(inst_social),
+    )
+
+
+def full_course_schema(*, inst_id="", inst_name, inst_url, inst_logo="", inst_phone="", inst_email="",
+                       inst_address="", inst_lat="", inst_long="", inst_area="", inst_map="", inst_social="",
+                       opens="08:00", closes="20:00",
+                       course_name, course_code="", course_desc="", course_url="", course_duration="",
+                       course_fee="", course_currency="INR", course_mode=(), course_level="Beginner", course_prereq="", course_lang="en-IN", cert_award="",
+                       topics="", methods="", outcomes="", image_urls="", video_url="", video_embed="",
+                       instructor_name="", instructor_desc="", author_sameas="", author_knows="",
+                       rating_value="", review_count="", license_url="", citations="", keywords="",
+                       about_tags="", faqs=()):
+    """Organization, Course and FAQPage documents (``GenerateEduSchema_Pro_Max.py``).
+
+    With ``inst_id`` (e.g. the site config organization's ``@id``) the
+    course's provider and the instructor's employer carry the same ``@id``
+    as the Organization document, so consumers merge them into one entity.
+    A ``course_mode`` or ``course_fee`` adds a CourseInstance with the mode
+    and an Offer at that fee.
+    """
+    inst_id = organization_id(inst_id, inst_url)
+    instance = None
+    if course_mode or course_fee:
+        instance = CourseInstance(
+            course_mode=list(course_mode) or None,
+            course_workload=course_duration or None,
+            offers=Offer(price=str(course_fee), price_currency=course_currency, availability=IN_STOCK,
+                         url=course_url) if course_fee else None,
+        )
+    org = institute_organization(
+        inst_id=inst_id, inst_name=inst_name, inst_url=inst_url, inst_logo=inst_logo, inst_phone=inst_phone,
+        inst_email=inst_email, inst_address=inst_address, inst_lat=inst_lat, inst_long=inst_long,
+        inst_area=inst_area, inst_map=inst_map, inst_social=inst_social, opens=opens, closes=closes,
+    )
+    course = Course(
+        identifier={"@type": "PropertyValue", "propertyID": "CourseCode", "value": course_code},
+        name=course_name,
+        description=course_desc,
+        url=course_url,
+        image=split_list(image_urls),
+        video=VideoObject(url=video_url, embed_url=video_embed) if video_url else None,
+        provider=EducationalOrganization(id=inst_id or None, name=inst_name, url=inst_url),
+        educational_level=course_level,
+        course_prerequisites=course_prereq,
+        educational_credential_awarded=cert_award,
+        in_language=course_lang,
+        time_required=course_duration,
+        has_course_instance=instance,
+        teaches=split_list(topics),
+        learning_resource_type=split_list(methods),
+        learning_outcome=split_list(outcomes),
+        aggregate_rating={"@type": "AggregateRating", "ratingValue": rating_value, "reviewCount": review_count},
+        author=Person(
+            name=instructor_name,
+            description=instructor_desc,
+            same_as=split_list(author_sameas),
+            knows_about=split_list(author_knows),
+            works_for=Organization(id=inst_id or None, name=inst_name),
+        ),
+        educational_alignment={"@type": "AlignmentObject", "alignmentType": "educationalLevel", "targetName": course_level},
+        potential_action={"@type": "EnrollAction", "target": f"{course_url}/enroll", "name": f"Enroll in {course_name}"},
+        license=license_url,
+        citation=split_list(citations),
+        keywords=split_list(keywords),
+        about=split_list(about_tags),
+        interaction_statistic={
+            "@type": "InteractionCounter",
+            "interactionType": "https://schema.org/LikeAction",
+            "userInteractionCount": "300"
+        },
+    )
+    return [build_organization(org), build_course(course), build_faq_page(faq_questions(faqs))]
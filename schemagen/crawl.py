@@ -0,0 +1,612 @@
+"""Concurrent bulk crawl: sitemap / URL list (or WordPress REST API posts) in, one JSON-LD document per URL out."""
+
+import gzip
+import hashlib
+import io
+import os
+import re
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import partial
+from typing import Optional
+from urllib.parse import urlparse
+
+from schemagen import engine
+from schemagen.blog import (
+    analyze_blog_html,
+    build_blog_schema,
+    cached_blog_schema,
+    facts_fingerprint,
+    remember_blog_schema,
+    schema_version,
+    score_keywords,
+)
+from schemagen.fetch import CHUNK_SIZE, XML_TYPES, FetchRejected, get_session
+from schemagen.manifest import MANIFEST_NAME, Manifest, fingerprint
+from schemagen.output import DirectorySink
+from schemagen.schedule import Scheduler
+from schemagen.timing import Timings
+from schemagen.wordpress import CHANGE_FIELDS, analyze_post, iter_posts, missing_fields, post_extracted
+
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024  # protocol limit for one (uncompressed) sitemap file
+SITEMAP_TYPES = XML_TYPES | {"application/gzip", "application/x-gzip", "application/octet-stream"}
+GZIP_MAGIC = b"\x1f\x8b"
+_FILENAME_UNSAFE = re.compile(r"[^\w.-]+")  # file names keep letters, digits, "_", "." and "-"
+SCORE_BATCH = 32  # pages whose keywords are scored together in a bulk run
+
+# refresh() outcomes
+SKIPPED = "skipped"  # source (or the facts extracted from it) unchanged, nothing regenerated
+CHANGED = "changed"  # output file written
+UNCHANGED = "unchanged"  # regenerated, but the JSON-LD is identical so the file was left alone
+FAILED = "failed"
+
+
+@dataclass
+class CrawlResult:
+    url: str
+    schema: Optional[dict] = None
+    checklist: Optional[dict] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    cached: bool = False
+    status: str = ""  # set by refresh()
+    timings: Optional[dict] = None  # ``Timings.as_dict()`` of the stages this URL went through
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+@dataclass
+class SitemapEntry:
+    url: str
+    lastmod: Optional[str] = None  # ``<lastmod>`` as written in the sitemap
+
+
+def parse_url_list(text):
+    """Return the unique URLs in a pasted / uploaded list, in input order.
+
+    One URL per line; blank lines and ``#`` comments are ignored.
+    """
+    seen = set()
+    urls = []
+    for line in text.splitlines():
+        url = line.strip()
+        if not url or url.startswith("#") or url in seen:
+            continue
+        seen.add(url)
+        urls.append(url)
+    return urls
+
+
+class _ChunkReader(io.RawIOBase):
+    """Binary file over an iterator of byte chunks (a streamed response body)."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            self._buffer = next(self._chunks, b"")
+            if not self._buffer:
+                return 0
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+class _CappedReader:
+    """``read`` of ``stream``, refusing to go past ``max_bytes`` (of decompressed XML)."""
+
+    def __init__(self, stream, max_bytes, name):
+        self._stream = stream
+        self._left = max_bytes
+        self.name = name
+
+    def read(self, size=-1):
+        data = self._stream.read(size)
+        self._left -= len(data)
+        if self._left < 0:
+            raise FetchRejected(f"{self.name} exceeds {SITEMAP_MAX_BYTES} bytes")
+        return data
+
+
+def _open_sitemap(raw, name):
+    """Wrap a binary stream for parsing, decompressing it on the fly if it starts like gzip."""
+    stream = io.BufferedReader(raw, CHUNK_SIZE)
+    if stream.peek(2)[:2] == GZIP_MAGIC:
+        stream = gzip.GzipFile(fileobj=stream)
+    return _CappedReader(stream, SITEMAP_MAX_BYTES, name)
+
+
+def _sitemap_tag(tag):
+    """Local name of a sitemap-protocol element (namespaced or not); ``None`` for other vocabularies."""
+    if tag.startswith(SITEMAP_NS):
+        return tag[len(SITEMAP_NS):]
+    return None if tag.startswith("{") else tag
+
+
+def _parse_sitemap_stream(source):
+    """``(pages, child_sitemaps)`` as ``SitemapEntry`` lists, parsed incrementally from a file.
+
+    Each ``<url>`` / ``<sitemap>`` is discarded once read, so memory holds the
+    entries rather than the document tree.
+    """
+    pages, children = [], []
+    root = target = None
+    loc = lastmod = None
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        name = _sitemap_tag(element.tag)
+        if event == "start":
+            if root is None:
+                root = element
+                target = children if name == "sitemapindex" else pages
+            continue
+        if name == "loc":
+            loc = (element.text or "").strip()
+        elif name == "lastmod":
+            lastmod = (element.text or "").strip() or None
+        elif name in ("url", "sitemap"):
+            if loc:
+                target.append(SitemapEntry(loc, lastmod))
+            loc = lastmod = None
+            root.clear()
+    return pages, children
+
+
+def sitemap_entries(data):
+    """Split a sitemap document (text, or bytes that may be gzipped) into ``(pages, child_sitemaps)`` entries."""
+    if isinstance(data, str):
+        return _parse_sitemap_stream(io.StringIO(data))
+    if data[:2] == GZIP_MAGIC:
+        data = gzip.decompress(data)
+    return _parse_sitemap_stream(io.BytesIO(data))
+
+
+def parse_sitemap(data):
+    """Split a sitemap document into ``(page_urls, child_sitemap_urls)``."""
+    pages, children = sitemap_entries(data)
+    return [entry.url for entry in pages], [entry.url for entry in children]
+
+
+def _read_sitemap(url, timeout=10):
+    with get_session().get(url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type and content_type not in SITEMAP_TYPES:
+            raise FetchRejected(f"{url} has unsupported content type {content_type!r}", response=response)
+        return _parse_sitemap_stream(_open_sitemap(_ChunkReader(response.iter_content(CHUNK_SIZE)), url))
+
+
+def iter_sitemap(sitemap_url, timeout=10, max_depth=3, scheduler=None):
+    """Yield a ``SitemapEntry`` for every unique page reachable from a sitemap or sitemap index.
+
+    Each file is parsed as it downloads, gzipped (``.xml.gz``) or not, so
+    neither its body nor a document tree is held in memory; child sitemaps
+    are followed breadth-first up to ``max_depth``. Requests go through
+    ``scheduler`` when given.
+    """
+    seen = set()
+    visited = set()
+    pending = deque([(sitemap_url, 0)])
+    while pending:
+        url, depth = pending.popleft()
+        if url in visited or depth > max_depth:
+            continue
+        visited.add(url)
+        if scheduler is not None:
+            pages, children = scheduler.call(url, _read_sitemap, url, timeout)
+        else:
+            pages, children = _read_sitemap(url, timeout)
+        for entry in pages:
+            if entry.url not in seen:
+                seen.add(entry.url)
+                yield entry
+        pending.extend((child.url, depth + 1) for child in children)
+
+
+def expand_sitemap(sitemap_url, timeout=10, max_depth=3, scheduler=None):
+    """Collect every page URL reachable from a sitemap or sitemap index."""
+    return [entry.url for entry in iter_sitemap(sitemap_url, timeout, max_depth, scheduler)]
+
+
+def _analyze(url, category, scheduler, timeout, cache):
+    """Fetch and analyse ``url`` in a worker thread. Returns ``(result, page, facts, timings)``.
+
+    ``facts`` is ``None`` when ``result`` is already final: the cache had the
+    page's schema, or fetching or parsing failed.
+    """
+    start = time.perf_counter()
+    timings = Timings()
+    result = CrawlResult(url)
+    page = facts = None
+    try:
+        with timings.stage("fetch"):
+            page = scheduler.fetch(url, timeout=timeout, cache=cache, stop_after_article=True)
+        memo = cached_blog_schema(page, category)
+        if memo is not None:
+            result.schema, result.checklist, result.cached = memo[0], memo[1], True
+        else:
+            facts = analyze_blog_html(page.text, url)
+            timings.update(facts["timings"])
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+        facts = None
+    result.elapsed = time.perf_counter() - start
+    return result, page, facts, timings
+
+
+def _build_batch(batch, category, stats):
+    """Build the schema of every ``(result, facts, timings, context)`` in ``batch``, emptying it.
+
+    The pages' keywords are scored together (``score_keywords``), one TF-IDF
+    pass per batch rather than per page. Each ``CrawlResult`` gets its schema
+    and checklist, or the error building it, plus the time taken on
+    ``elapsed``; the entries are yielded back in order.
+    """
+    pending, batch[:] = list(batch), []
+    if not pending:
+        return
+    start = time.perf_counter()
+    keywords = score_keywords([(result.url, facts) for result, facts, _, _ in pending], stats)
+    share = (time.perf_counter() - start) / len(pending)
+    for (result, facts, timings, context), terms in zip(pending, keywords):
+        start = time.perf_counter()
+        timings.add("keywords", share)
+        try:
+            result.schema, result.checklist = build_blog_schema(result.url, category, facts, stats, timings=timings,
+                                                                keywords=terms)
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        result.elapsed += share + time.perf_counter() - start
+        yield result, facts, timings, context
+
+
+def _remembered(built, category, cache):
+    """``CrawlResult``s of ``_build_batch`` entries, memoised in ``cache`` when their context is the fetched page."""
+    for result, _, timings, page in built:
+        if result.ok and page is not None:
+            try:
+                remember_blog_schema(cache, page, category, result.schema, result.checklist)
+            except Exception as e:
+                result.schema = result.checklist = None
+                result.error = f"{type(e).__name__}: {e}"
+        result.timings = timings.as_dict()
+        yield result
+
+
+def crawl(urls, category, workers=8, per_host=4, timeout=10, cache=None, stats=None, processes=0, chunk_size=1,
+          scheduler=None):
+    """Fetch and extract every URL concurrently, yielding results as they finish.
+
+    At most ``workers * 2`` URLs are queued at once so very long lists do not
+    allocate a future per URL up front. Requests go through ``scheduler`` (a
+    ``schemagen.schedule.Scheduler``, by default one allowing ``per_host``
+    concurrent requests per host), which rate-limits and retries them. Pass a
+    ``PageCache`` to skip downloading and re-parsing pages that have not
+    changed since the last run, and a ``CorpusStats`` to score keywords by
+    TF-IDF across the site. Keywords are scored ``SCORE_BATCH`` pages at a
+    time, so results arrive in batches of that size.
+
+    With ``processes`` > 0 the ``workers`` threads only download, and parsing
+    runs on that many worker processes in chunks of ``chunk_size`` pages (see
+    ``schemagen.engine``); use this when the crawl is CPU-bound.
+    """
+    scheduler = scheduler or Scheduler(per_host=per_host)
+    if processes:
+        yield from _crawl_processes(urls, category, workers, scheduler, timeout, cache, stats, processes, chunk_size)
+        return
+    url_iter = iter(urls)
+    batch = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        in_flight = set()
+        for url in url_iter:
+            in_flight.add(pool.submit(_analyze, url, category, scheduler, timeout, cache))
+            if len(in_flight) >= workers * 2:
+                break
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                result, page, facts, timings = future.result()
+                if facts is None:
+                    result.timings = timings.as_dict()
+                    yield result
+                else:
+                    batch.append((result, facts, timings, page))
+                next_url = next(url_iter, None)
+                if next_url is not None:
+                    in_flight.add(pool.submit(_analyze, next_url, category, scheduler, timeout, cache))
+            if len(batch) >= SCORE_BATCH or not in_flight:
+                yield from _remembered(_build_batch(batch, category, stats), category, cache)
+
+
+def _timed_fetch(scheduler, url, timeout, cache):
+    start = time.perf_counter()
+    page = scheduler.fetch(url, timeout=timeout, cache=cache, stop_after_article=True)
+    return page, time.perf_counter() - start
+
+
+def _download(url, category, scheduler, timeout, cache, pages):
+    page, seconds = _timed_fetch(scheduler, url, timeout, cache)
+    memo = cached_blog_schema(page, category)
+    if memo is not None:
+        return engine.Done((memo[0], memo[1], seconds))
+    pages[url] = (page, seconds)  # kept in this process for remember_blog_schema
+    return page.text
+
+
+def _crawl_processes(urls, category, workers, scheduler, timeout, cache, stats, processes, chunk_size):
+    pages = {}
+    download = partial(_download, category=category, scheduler=scheduler, timeout=timeout, cache=cache, pages=pages)
+    results = engine.run(urls, analyze_blog_html, download, workers=processes, fetch_workers=workers,
+                         chunk_size=chunk_size, ordered=False)
+    batch = []
+    for result in results:
+        page, fetch_seconds = pages.pop(result.item, (None, 0.0))
+        if not result.ok:
+            yield CrawlResult(result.item, error=result.error, elapsed=result.elapsed)
+            continue
+        timings = Timings()
+        if page is None:  # served from the cache memo
+            schema, checklist, fetch_seconds = result.value
+            timings.add("fetch", fetch_seconds)
+            yield CrawlResult(result.item, schema, checklist, elapsed=result.elapsed, cached=True,
+                              timings=timings.as_dict())
+            continue
+        timings.add("fetch", fetch_seconds)
+        timings.update(result.value["timings"])
+        batch.append((CrawlResult(result.item, elapsed=result.elapsed), result.value, timings, page))
+        if len(batch) >= SCORE_BATCH:
+            yield from _remembered(_build_batch(batch, category, stats), category, cache)
+    yield from _remembered(_build_batch(batch, category, stats), category, cache)
+
+
+def _is_current(entry, category, path):
+    return (entry is not None and entry["error"] is None and entry["category"] == category
+            and entry["version"] == schema_version() and os.path.exists(path))
+
+
+def _refresh_download(url, category, out_dir, scheduler, timeout, cache, manifest, lastmods, pages):
+    entry = manifest.get(url)
+    current = _is_current(entry, category, os.path.join(out_dir, output_filename(url)))
+    lastmod = lastmods.get(url)
+    if current and lastmod and entry["lastmod"] == lastmod:
+        return engine.Done(None)  # the sitemap says it has not changed: not even fetched
+    page, seconds = _timed_fetch(scheduler, url, timeout, cache)
+    source_hash = fingerprint(page.text)
+    if current and entry["source_hash"] == source_hash:
+        if lastmod:
+            manifest.record(url, lastmod=lastmod)
+        return engine.Done(seconds)
+    pages[url] = (page, source_hash, entry, seconds)
+    return page.text
+
+
+def _facts_unchanged(url, category, facts, entry, out_dir):
+    """Whether ``url``'s stored schema was built from the same ``facts`` and is still current."""
+    path = os.path.join(out_dir, output_filename(url))
+    return _is_current(entry, category, path) and entry["facts_hash"] == facts_fingerprint(facts)
+
+
+def _store(url, category, facts, entry, schema, out_dir, sink, manifest, timings, **fields):
+    """Write ``schema`` for ``url`` (when it changed) and record it. Returns ``CHANGED`` or ``UNCHANGED``.
+
+    ``fields`` (``source_hash``, ``lastmod``) are recorded in the manifest with the fingerprints.
+    """
+    path = os.path.join(out_dir, output_filename(url))
+    schema_hash = fingerprint(schema)
+    status = UNCHANGED
+    if not (entry and entry["schema_hash"] == schema_hash and os.path.exists(path)):
+        written = sink.bytes
+        with timings.stage("serialize"):
+            sink.write(output_filename(url), schema)
+        timings.count("json_bytes", sink.bytes - written)
+        status = CHANGED
+    manifest.record(url, category=category, version=schema_version(), facts_hash=facts_fingerprint(facts),
+                    schema_hash=schema_hash, path=path, error=None, **fields)
+    return status
+
+
+def _stored(built, category, out_dir, sink, manifest, cache):
+    """``CrawlResult``s of ``_build_batch`` entries for a refresh: written, recorded and given their status.
+
+    Each entry's context is ``(page, entry, fields)``: the fetched page (or
+    ``None``), its manifest entry before this run and the fields to record.
+    """
+    for result, facts, timings, (page, entry, fields) in built:
+        start = time.perf_counter()
+        if result.ok:
+            try:
+                result.status = _store(result.url, category, facts, entry, result.schema, out_dir, sink, manifest,
+                                       timings, **fields)
+                if page is not None:
+                    remember_blog_schema(cache, page, category, result.schema, result.checklist)
+            except Exception as e:
+                result.error = f"{type(e).__name__}: {e}"
+        if not result.ok:
+            manifest.record(result.url, error=result.error)
+            result.schema = result.checklist = None
+            result.status = FAILED
+        result.elapsed += time.perf_counter() - start
+        result.timings = timings.as_dict()
+        yield result
+
+
+def refresh(urls, category, out_dir, manifest=None, workers=8, per_host=4, timeout=10, cache=None, stats=None,
+            processes=0, chunk_size=1, scheduler=None, compact=False, lastmods=None):
+    """Bring ``out_dir`` (one JSON-LD file per URL) up to date, redoing only what changed.
+
+    A page is skipped without parsing when its body hashes the same as in the
+    ``manifest`` (default: ``MANIFEST_NAME`` inside ``out_dir``), and without
+    rebuilding when only markup outside the extracted fields changed. With
+    ``lastmods`` (URL -> sitemap ``<lastmod>``, see ``iter_sitemap``) a page
+    whose ``lastmod`` is the one recorded is skipped without a request. A
+    rebuilt schema is written only if it differs from the file on disk.
+    Changing the category, ``GENERATOR_VERSION`` or the site config
+    regenerates everything. Files are indented by 2 unless ``compact`` (see ``schemagen.output``).
+    Yields a ``CrawlResult`` per URL with ``status`` ``SKIPPED``,
+    ``CHANGED``, ``UNCHANGED`` or ``FAILED``; rebuilt pages come in batches
+    of ``SCORE_BATCH`` as in ``crawl``.
+    """
+    sink = DirectorySink(out_dir, compact=compact)
+    own_manifest = manifest is None
+    if own_manifest:
+        manifest = Manifest(os.path.join(out_dir, MANIFEST_NAME))
+    scheduler = scheduler or Scheduler(per_host=per_host)
+    lastmods = lastmods or {}
+    pages = {}
+    download = partial(_refresh_download, category=category, out_dir=out_dir, scheduler=scheduler, timeout=timeout,
+                       cache=cache, manifest=manifest, lastmods=lastmods, pages=pages)
+    try:
+        results = engine.run(urls, analyze_blog_html, download, workers=processes, fetch_workers=workers,
+                             chunk_size=chunk_size, ordered=False)
+        batch = []
+        for result in results:
+            url = result.item
+            page, source_hash, entry, fetch_seconds = pages.pop(url, (None, None, None, 0.0))
+            if not result.ok:
+                manifest.record(url, error=result.error)
+                yield CrawlResult(url, error=result.error, elapsed=result.elapsed, status=FAILED)
+                continue
+            timings = Timings()
+            if page is None:
+                if result.value is not None:
+                    timings.add("fetch", result.value)
+                yield CrawlResult(url, elapsed=result.elapsed, status=SKIPPED, timings=timings.as_dict())
+                continue
+            timings.add("fetch", fetch_seconds)
+            timings.update(result.value["timings"])
+            fields = {"source_hash": source_hash, "lastmod": lastmods.get(url)}
+            if _facts_unchanged(url, category, result.value, entry, out_dir):
+                manifest.record(url, **fields)
+                yield CrawlResult(url, elapsed=result.elapsed, status=SKIPPED, timings=timings.as_dict())
+                continue
+            batch.append((CrawlResult(url, elapsed=result.elapsed), result.value, timings, (page, entry, fields)))
+            if len(batch) >= SCORE_BATCH:
+                yield from _stored(_build_batch(batch, category, stats), category, out_dir, sink, manifest, cache)
+        yield from _stored(_build_batch(batch, category, stats), category, out_dir, sink, manifest, cache)
+    finally:
+        if own_manifest:
+            manifest.close()
+
+
+# --- WordPress REST API posts ---
+
+def _post_download(post, scheduler, timeout, cache, pages):
+    if not missing_fields(post_extracted(post)):
+        return post, None
+    page, pages[post["link"]] = _timed_fetch(scheduler, post["link"], timeout, cache)
+    return post, page.text
+
+
+def _post_unchanged(post, category, out_dir, manifest):
+    entry = manifest.get(post["link"])
+    path = os.path.join(out_dir, output_filename(post["link"]))
+    return bool(post.get("modified_gmt")) and _is_current(entry, category, path) and entry["lastmod"] == post["modified_gmt"]
+
+
+def crawl_posts(posts, category, workers=8, per_host=4, timeout=10, cache=None, stats=None, processes=0, chunk_size=8,
+                scheduler=None):
+    """``crawl`` for posts from the WordPress REST API (``schemagen.wordpress.iter_posts``).
+
+    Each post is analysed from the API's fields and rendered content; only
+    posts missing a required field are fetched (through ``scheduler``, with
+    ``workers`` threads) and analysed from their HTML.
+    """
+    scheduler = scheduler or Scheduler(per_host=per_host)
+    pages = {}
+    download = partial(_post_download, scheduler=scheduler, timeout=timeout, cache=cache, pages=pages)
+    results = engine.run(posts, analyze_post, download, workers=processes, fetch_workers=workers,
+                         chunk_size=chunk_size, ordered=False)
+    batch = []
+    for result in results:
+        url = result.item["link"]
+        fetch_seconds = pages.pop(url, None)
+        if not result.ok:
+            yield CrawlResult(url, error=result.error, elapsed=result.elapsed)
+            continue
+        timings = Timings()
+        if fetch_seconds is not None:
+            timings.add("fetch", fetch_seconds)
+        timings.update(result.value["timings"])
+        batch.append((CrawlResult(url, elapsed=result.elapsed), result.value, timings, None))
+        if len(batch) >= SCORE_BATCH:
+            yield from _remembered(_build_batch(batch, category, stats), category, cache)
+    yield from _remembered(_build_batch(batch, category, stats), category, cache)
+
+
+def refresh_posts(site_url, category, out_dir, manifest=None, workers=8, per_host=4, timeout=10, cache=None, stats=None,
+                  processes=0, chunk_size=8, scheduler=None, compact=False):
+    """``refresh`` for the posts of the WordPress site at ``site_url``, read from its REST API.
+
+    The site's posts are first listed with just their ``modified_gmt``; a
+    post whose ``modified_gmt`` is the one recorded in the manifest is
+    skipped, and only the others are fetched in full (100 per request),
+    handled as in ``crawl_posts`` and written, compared and recorded as in
+    ``refresh``.
+    """
+    sink = DirectorySink(out_dir, compact=compact)
+    own_manifest = manifest is None
+    if own_manifest:
+        manifest = Manifest(os.path.join(out_dir, MANIFEST_NAME))
+    scheduler = scheduler or Scheduler(per_host=per_host)
+    pages = {}
+    download = partial(_post_download, scheduler=scheduler, timeout=timeout, cache=cache, pages=pages)
+    try:
+        changed = []
+        for post in iter_posts(site_url, timeout=timeout, scheduler=scheduler, fields=CHANGE_FIELDS):
+            if _post_unchanged(post, category, out_dir, manifest):
+                yield CrawlResult(post["link"], status=SKIPPED, timings={})
+            else:
+                changed.append(post["id"])
+        posts = iter_posts(site_url, timeout=timeout, scheduler=scheduler, include=changed)
+        results = engine.run(posts, analyze_post, download, workers=processes, fetch_workers=workers,
+                             chunk_size=chunk_size, ordered=False)
+        batch = []
+        for result in results:
+            url = result.item["link"]
+            fetch_seconds = pages.pop(url, None)
+            if not result.ok:
+                manifest.record(url, error=result.error)
+                yield CrawlResult(url, error=result.error, elapsed=result.elapsed, status=FAILED)
+                continue
+            timings = Timings()
+            if fetch_seconds is not None:
+                timings.add("fetch", fetch_seconds)
+            timings.update(result.value["timings"])
+            entry = manifest.get(url)
+            fields = {"source_hash": None, "lastmod": result.item.get("modified_gmt")}
+            if _facts_unchanged(url, category, result.value, entry, out_dir):
+                manifest.record(url, **fields)
+                yield CrawlResult(url, elapsed=result.elapsed, status=SKIPPED, timings=timings.as_dict())
+                continue
+            batch.append((CrawlResult(url, elapsed=result.elapsed), result.value, timings, (None, entry, fields)))
+            if len(batch) >= SCORE_BATCH:
+                yield from _stored(_build_batch(batch, category, stats), category, out_dir, sink, manifest, cache)
+        yield from _stored(_build_batch(batch, category, stats), category, out_dir, sink, manifest, cache)
+    finally:
+        if own_manifest:
+            manifest.close()
+
+
+def output_filename(url):
+    """Stable per-URL file name for ZIP / directory exports.
+
+    The readable part is the path (or the host for a home page); the
+    suffix is a hash of the whole URL, so pages on other hosts, with other
+    query strings, or whose paths only differ in ``/`` vs ``_`` get
+    different files.
+    """
+    parsed = urlparse(url)
+    slug = _FILENAME_UNSAFE.sub("-", parsed.path.strip("/").replace("/", "_"))[:100] or parsed.netloc
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:8]
+    return f"{slug}-{digest}.json"
@@ -0,0 +1,165 @@
+"""Two-stage parallel engine: threaded I/O stage feeding a process-pool CPU stage.
+
+    for result in run(urls, analyze, fetch=download, fetch_workers=16, workers=4):
+        ...
+
+``fetch`` (optional) runs on a thread pool and is meant for network or disk
+I/O; whatever it returns is batched into chunks of ``chunk_size`` and handed
+to ``work`` on a ``ProcessPoolExecutor``, where the GIL no longer serialises
+parsing. ``work`` and its payloads must be picklable, so use module level
+functions (``functools.partial`` is fine).
+
+At most ``max_pending`` items are between the input and the output at any
+time — being fetched, waiting for a chunk, being worked on or, in ordered
+mode, waiting for an earlier item — so input is pulled lazily and memory
+stays bounded for inputs of any length. An exception in either stage is
+captured on that item's ``Result`` and the rest of the batch carries on.
+"""
+
+import os
+import time
+from concurrent import futures  # ProcessPoolExecutor (and multiprocessing) only load when a pool is started
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class Result:
+    index: int  # position of the item in the input
+    item: Any
+    value: Any = None
+    error: Optional[str] = None
+    elapsed: float = 0.0  # seconds spent in fetch + work for this item
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+@dataclass
+class Done:
+    """Return ``Done(value)`` from ``fetch`` to skip the CPU stage for that item (e.g. a cache hit)."""
+
+    value: Any
+
+
+def _error(e):
+    return f"{type(e).__name__}: {e}"
+
+
+def _timed_fetch(fetch, item):
+    start = time.perf_counter()
+    return fetch(item), time.perf_counter() - start
+
+
+def _work_chunk(work, payloads):
+    """Run ``work`` over one chunk in a worker process, capturing errors per payload."""
+    out = []
+    for payload in payloads:
+        start = time.perf_counter()
+        try:
+            out.append((work(payload), None, time.perf_counter() - start))
+        except Exception as e:
+            out.append((None, _error(e), time.perf_counter() - start))
+    return out
+
+
+def run(items, work, fetch=None, *, workers=None, fetch_workers=8, chunk_size=1, ordered=True, max_pending=None):
+    """Yield a ``Result`` for every item in ``items``.
+
+    ``workers`` is the number of processes (default: CPU count); ``0`` runs
+    ``work`` in the calling process, which is handy for debugging. With
+    ``ordered`` results come back in input order, otherwise as they complete.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = max(workers, 1) * chunk_size * 2 + (fetch_workers * 2 if fetch else 0)
+    max_pending = max(max_pending, chunk_size)
+
+    source = enumerate(items)
+    exhausted = False
+    fetching = {}  # future -> (index, item)
+    computing = {}  # future -> [(index, item, fetch_elapsed), ...]
+    ready = []  # (index, item, payload, fetch_elapsed) waiting to fill a chunk
+    finished = {}  # index -> Result, ordered mode only
+    next_index = 0
+    pending = 0
+
+    io_pool = futures.ThreadPoolExecutor(max_workers=fetch_workers) if fetch else None
+    cpu_pool = futures.ProcessPoolExecutor(max_workers=workers) if workers else None
+    try:
+        while True:
+            # --- Pull input while under the pending limit ---
+            while not exhausted and pending < max_pending and (not fetch or len(fetching) < fetch_workers * 2):
+                try:
+                    index, item = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending += 1
+                if fetch:
+                    fetching[io_pool.submit(_timed_fetch, fetch, item)] = (index, item)
+                else:
+                    ready.append((index, item, item, 0.0))
+
+            # --- Hand full chunks (or the tail once nothing is being fetched) to the CPU stage ---
+            completed = []
+            while len(ready) >= chunk_size or (ready and not fetching):
+                chunk, ready = ready[:chunk_size], ready[chunk_size:]
+                meta = [(index, item, elapsed) for index, item, _, elapsed in chunk]
+                payloads = [payload for _, _, payload, _ in chunk]
+                if cpu_pool is None:
+                    completed.extend(_results(meta, _work_chunk(work, payloads)))
+                    continue
+                try:
+                    computing[cpu_pool.submit(_work_chunk, work, payloads)] = meta
+                except Exception as e:  # pool broken by a crashed worker
+                    completed.extend(Result(i, item, error=_error(e), elapsed=t) for i, item, t in meta)
+
+            if not completed:
+                if not fetching and not computing:
+                    if exhausted:
+                        break
+                    continue
+                done, _ = futures.wait(list(fetching) + list(computing), return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    if future in fetching:
+                        index, item = fetching.pop(future)
+                        try:
+                            payload, elapsed = future.result()
+                        except Exception as e:
+                            completed.append(Result(index, item, error=_error(e)))
+                            continue
+                        if isinstance(payload, Done):
+                            completed.append(Result(index, item, payload.value, elapsed=elapsed))
+                        else:
+                            ready.append((index, item, payload, elapsed))
+                    else:
+                        meta = computing.pop(future)
+                        try:
+                            completed.extend(_results(meta, future.result()))
+                        except Exception as e:
+                            completed.extend(Result(i, item, error=_error(e), elapsed=t) for i, item, t in meta)
+
+            # --- Emit ---
+            for result in completed:
+                if not ordered:
+                    pending -= 1
+                    yield result
+                    continue
+                finished[result.index] = result
+                while next_index in finished:
+                    pending -= 1
+                    yield finished.pop(next_index)
+                    next_index += 1
+    finally:
+        if io_pool is not None:
+            io_pool.shutdown(cancel_futures=True)
+        if cpu_pool is not None:
+            cpu_pool.shutdown(cancel_futures=True)
+
+
+def _results(meta, outcomes):
+    return [Result(index, item, value, error, fetch_elapsed + work_elapsed)
+            for (index, item, fetch_elapsed), (value, error, work_elapsed) in zip(meta, outcomes)]
@@ -0,0 +1,80 @@
+"""Fast-path HTML parsing primitives used by the blog extractor.
+
+The page is narrowed to ``<head>`` plus the ``<article>`` region (and any
+JSON-LD outside it) before it is parsed, parsed with lxml when it is installed, and all ``<meta>`` tags are read in
+one pass. FAQ detection lives in ``schemagen.faq``.
+"""
+
+import re
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+_HEAD_END = re.compile(r"</head\s*>", re.I)
+_ARTICLE_START = re.compile(r"<article[\s>]", re.I)
+_ARTICLE_END = re.compile(r"</article\s*>", re.I)
+_LD_JSON_SCRIPT = re.compile(r"<script\b[^>]*\btype\s*=\s*[\"']?application/ld\+json\b[^>]*>.*?</script\s*>", re.I | re.S)
+
+
+def narrow_html(html):
+    """Cut theme chrome out of ``html``, keeping ``<head>`` and the article body.
+
+    JSON-LD scripts elsewhere in the body, where FAQ and SEO plugins often
+    put them, are moved into ``<head>`` so they survive too. Returns ``html``
+    unchanged when the page has no ``</head>`` or no ``<article>`` element
+    to anchor on.
+    """
+    head_end = _HEAD_END.search(html)
+    if not head_end:
+        return html
+    start = _ARTICLE_START.search(html, head_end.end())
+    if not start:
+        return html
+    end = None
+    for end in _ARTICLE_END.finditer(html, start.end()):
+        pass
+    if end is None:
+        return html
+    scripts = "".join(_LD_JSON_SCRIPT.findall(html, head_end.end(), start.start())
+                      + _LD_JSON_SCRIPT.findall(html, end.end()))
+    return (html[:head_end.start()] + scripts + html[head_end.start():head_end.end()]
+            + "<body>" + html[start.start():end.end()] + "</body></html>")
+
+
+def parse_html(html, narrow=True):
+    if narrow:
+        html = narrow_html(html)
+    return BeautifulSoup(html, PARSER)
+
+
+def collect_meta(soup):
+    """Index every ``<meta>`` tag by ``(attribute, value)`` in a single pass.
+
+    Keys look like ``("property", "og:title")`` or ``("name", "description")``;
+    the first tag wins, matching ``soup.find`` semantics.
+    """
+    metas = {}
+    for tag in soup.find_all("meta"):
+        content = tag.get("content")
+        if content is None:
+            continue
+        for attr in ("property", "name"):
+            value = tag.get(attr)
+            if value is not None:
+                metas.setdefault((attr, value), content.strip())
+    return metas
+
+
+def page_title(soup):
+    title = soup.title
+    return title.string.strip() if title and title.string else None
+
+
+def canonical_url(soup):
+    link = soup.find("link", rel="canonical")
+    return link.get("href") if link else None
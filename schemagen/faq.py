@@ -0,0 +1,187 @@
+"""Linear-time FAQ detection for blog pages.
+
+Questions are gathered from four sources in one walk of the parsed page:
+
+* FAQPage JSON-LD already embedded in ``<script type="application/ld+json">``;
+* ``schema.org/Question`` microdata (``itemprop="name"`` / ``itemprop="text"``);
+* ``<details>`` / ``<summary>`` accordions;
+* question-like headings, ``<strong>`` and ``<p>`` tags, each paired with the
+  next answer block that follows it.
+
+Structured sources win over heuristics, questions are de-duplicated on their
+normalised text, and the result is capped at ``limit`` pairs.
+"""
+
+import json
+import re
+
+from bs4 import Tag
+
+from schemagen.content import is_boilerplate
+
+MAX_FAQS = 20
+MAX_QUESTION_CHARS = 250
+
+QUESTION_TAGS = frozenset(["h2", "h3", "h4", "strong", "summary", "p"])
+HEADING_TAGS = frozenset(["h2", "h3", "h4", "summary"])
+
+_SPACE = re.compile(r"\s+")
+_MARKUP = re.compile(r"<[^>]+>")
+_LD_JSON = re.compile(r"^\s*application/ld\+json\s*$", re.I)
+
+
+def _clean(text):
+    return _SPACE.sub(" ", text).strip()
+
+
+def _key(question):
+    return _clean(question).lower().rstrip("?:. ")
+
+
+def is_question(text, heading=True):
+    """Whether ``text`` reads like a FAQ question.
+
+    Headings qualify with a ``?`` anywhere; running text (``<p>``, ``<strong>``)
+    must end with one, so ordinary paragraphs that merely contain a question
+    are not picked up.
+    """
+    if not text or len(text) > MAX_QUESTION_CHARS:
+        return False
+    if text.lower().startswith(("q:", "question")):
+        return True
+    return "?" in text if heading else text.endswith("?")
+
+
+def _has_own_text(tag):
+    return any(isinstance(child, str) and child.strip() for child in tag.children)
+
+
+def _jsonld_faqs(node, out):
+    if isinstance(node, list):
+        for item in node:
+            _jsonld_faqs(item, out)
+        return
+    if not isinstance(node, dict):
+        return
+    types = node.get("@type")
+    types = types if isinstance(types, list) else [types]
+    if "Question" in types:
+        answer = node.get("acceptedAnswer") or {}
+        if isinstance(answer, list):
+            answer = answer[0] if answer else {}
+        text = answer.get("text") if isinstance(answer, dict) else None
+        if node.get("name") and text:
+            out.append((_clean(str(node["name"])), _clean(_MARKUP.sub(" ", str(text)))))
+        return
+    for key in ("@graph", "mainEntity"):
+        if key in node:
+            _jsonld_faqs(node[key], out)
+
+
+def _read_jsonld(script, out):
+    if script.string:
+        try:
+            _jsonld_faqs(json.loads(script.string), out)
+        except ValueError:
+            pass
+
+
+def _microdata_faq(tag):
+    name = tag.find(attrs={"itemprop": "name"})
+    answer = tag.find(attrs={"itemprop": "acceptedAnswer"})
+    text = answer.find(attrs={"itemprop": "text"}) if answer else None
+    if name is None or text is None:
+        return None
+    question = _clean(name.get("content") or name.get_text())
+    answer_text = _clean(text.get("content") or text.get_text())
+    return (question, answer_text) if question and answer_text else None
+
+
+def _details_faq(tag):
+    summary = tag.find("summary")
+    if summary is None:
+        return None
+    question = _clean(summary.get_text())
+    parts = [child.get_text(" ") if isinstance(child, Tag) else str(child)
+             for child in tag.children if child is not summary]
+    answer = _clean(" ".join(parts))
+    return (question, answer) if question and answer else None
+
+
+def extract_faqs(soup, limit=MAX_FAQS, content=None):
+    """Return up to ``limit`` de-duplicated ``(question, answer)`` pairs from ``soup``.
+
+    With ``content`` (the article body, see ``schemagen.content.main_content``)
+    only that element is walked, skipping boilerplate inside it, so sidebar
+    widgets and footers cannot contribute questions; embedded JSON-LD is
+    still read from the whole page.
+
+    The walk is iterative and visits every node once; subtrees consumed by a
+    structured source (JSON-LD, microdata item, ``<details>``) are not
+    descended into again. A heuristic question waits for the next ``<p>``, or
+    ``<div>`` with its own text, that is not itself a question; a new question
+    arriving first replaces it, so stacked headings do not all share one
+    answer.
+    """
+    structured = []
+    heuristic = []
+    pending = None
+    scoped = content is not None and content is not soup
+    if scoped:
+        for script in soup.find_all("script", type=_LD_JSON):
+            _read_jsonld(script, structured)
+    stack = [content if scoped else soup]
+    while stack:
+        el = stack.pop()
+        if not isinstance(el, Tag):
+            continue
+        name = el.name
+
+        if scoped:
+            if el is not content and is_boilerplate(el):
+                continue
+        elif name == "script":
+            if (el.get("type") or "").lower() == "application/ld+json":
+                _read_jsonld(el, structured)
+            continue
+        if "schema.org/Question" in (el.get("itemtype") or ""):
+            pair = _microdata_faq(el)
+            if pair:
+                structured.append(pair)
+                pending = None
+                continue
+        if name == "details":
+            pair = _details_faq(el)
+            if pair:
+                structured.append(pair)
+                pending = None
+                continue
+
+        if name in QUESTION_TAGS or name == "div":
+            text = None
+            if name in QUESTION_TAGS:
+                text = _clean(el.get_text(" "))
+                if is_question(text, heading=name in HEADING_TAGS):
+                    if pending is None or _key(pending) != _key(text):
+                        pending = text
+                    stack.extend(reversed(el.contents))
+                    continue
+            if pending is not None and (name == "p" or _has_own_text(el)):
+                answer = text if text is not None else _clean(el.get_text(" "))
+                if answer:
+                    heuristic.append((pending, answer))
+                    pending = None
+
+        stack.extend(reversed(el.contents))
+
+    faqs = []
+    seen = set()
+    for question, answer in structured + heuristic:
+        key = _key(question)
+        if key in seen:
+            continue
+        seen.add(key)
+        faqs.append((question, answer))
+        if len(faqs) >= limit:
+            break
+    return faqs
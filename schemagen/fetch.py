@@ -0,0 +1,289 @@
+"""Shared keep-alive HTTP session and an on-disk page cache with conditional GET."""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = "Mozilla/5.0"
+DEFAULT_CACHE_DIR = os.environ.get(
+    "SCHEMAGEN_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "schemagen", "pages")
+)
+
+MAX_BYTES = 5 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+DRAIN_BYTES = 256 * 1024  # read past the article for the JSON-LD a page puts after it
+HTML_TYPES = frozenset(["text/html", "application/xhtml+xml"])
+XML_TYPES = frozenset(["application/xml", "text/xml", "text/plain"])
+JSON_TYPES = frozenset(["application/json"])
+
+_META_CHARSET = re.compile(rb"<meta[^>]+charset=[\"']?([\w-]+)", re.I)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session(pool_size=32):
+    """Return the process-wide ``requests.Session``.
+
+    Reusing one session keeps TCP/TLS connections alive between pages, so
+    only the first request to a host pays for the handshake.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["User-Agent"] = USER_AGENT
+            _session = session
+        return _session
+
+
+class PageCache:
+    """Persistent URL -> page cache stored as one JSON file per URL.
+
+    Each entry keeps the body together with its ``ETag`` / ``Last-Modified``
+    validators and a ``derived`` dict where callers can memoise results
+    computed from the body (parsed fields, generated schema). ``derived`` is
+    dropped whenever the body changes.
+
+    * ``max_age`` — seconds an entry is served without contacting the server.
+    * ``ttl`` — entries not refreshed for this long are evicted.
+    * ``max_bytes`` — least recently used entries are evicted above this size.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_age=300, ttl=30 * 86400, max_bytes=200 * 1024 * 1024):
+        self.directory = directory
+        self.max_age = max_age
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._writes = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.evict()
+
+    def _path(self, url):
+        return os.path.join(self.directory, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, url):
+        path = self._path(url)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("fetched_at", 0) > self.ttl:
+            self.delete(url)
+            return None
+        try:
+            os.utime(path)  # LRU bookkeeping for size-based eviction
+        except OSError:  # evicted or deleted by another thread or process since the read
+            pass
+        return entry
+
+    def put(self, url, entry):
+        path = self._path(url)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"  # thread ids repeat across processes
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp, path)
+        with self._lock:
+            self._writes += 1
+            due = self._writes % 100 == 0
+        if due:
+            self.evict()
+
+    def remember(self, url, entry, key, value):
+        """Memoise ``value`` under ``key`` alongside the cached body of ``url``."""
+        entry.setdefault("derived", {})[key] = value
+        self.put(url, entry)
+
+    def delete(self, url):
+        try:
+            os.remove(self._path(url))
+        except OSError:
+            pass
+
+    def evict(self):
+        """Drop expired entries, then the least recently used until under ``max_bytes``."""
+        now = time.time()
+        files = []
+        for item in os.scandir(self.directory):
+            if not item.name.endswith(".json"):
+                continue
+            try:
+                stat = item.stat()
+                if now - stat.st_mtime > self.ttl:
+                    os.remove(item.path)
+                else:
+                    files.append((stat.st_mtime, stat.st_size, item.path))
+            except OSError:  # removed by another thread meanwhile
+                continue
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+
+_default_cache = None
+
+
+def default_cache():
+    """Return the process-wide ``PageCache`` in ``DEFAULT_CACHE_DIR``."""
+    global _default_cache
+    with _session_lock:
+        if _default_cache is None:
+            _default_cache = PageCache()
+        return _default_cache
+
+
+@dataclass
+class Page:
+    url: str
+    text: str
+    status: int
+    not_modified: bool = False  # body is unchanged since it was cached
+    entry: Optional[dict] = None
+
+
+class FetchRejected(requests.RequestException):
+    """The response was refused: wrong content type or larger than allowed."""
+
+
+class ArticleEndDetector:
+    """Spots the point where the first top-level ``<article>`` closes.
+
+    Fed raw byte chunks as they arrive; tags split across chunk boundaries are
+    handled by rescanning a short overlap. Nested ``<article>`` elements are
+    counted so an inner one closing does not end the read early.
+    """
+
+    _TAG = re.compile(rb"<(/?)article[\s>]", re.I)
+
+    def __init__(self):
+        self._tail = b""
+        self._depth = 0
+        self.done = False
+
+    def feed(self, chunk):
+        data = self._tail + chunk
+        last_end = 0
+        for match in self._TAG.finditer(data):
+            if match.group(1):
+                if self._depth == 0:  # stray close before any <article>
+                    continue
+                self._depth -= 1
+                if self._depth == 0:
+                    self.done = True
+                    return True
+            else:
+                self._depth += 1
+            last_end = match.end()
+        self._tail = data[max(last_end, len(data) - 16):]
+        return False
+
+
+def _decode(body, response):
+    """Decode ``body`` using the header charset, then ``<meta charset>``, then UTF-8."""
+    encoding = None
+    if "charset=" in response.headers.get("Content-Type", "").lower():
+        encoding = response.encoding
+    if encoding is None:
+        match = _META_CHARSET.search(body[:4096])
+        encoding = match.group(1).decode("ascii") if match else "utf-8"
+    try:
+        return body.decode(encoding, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _read_body(response, max_bytes, stop_after_article):
+    length = response.headers.get("Content-Length")
+    if length and length.isdigit() and int(length) > max_bytes:
+        raise FetchRejected(f"{response.url} is {int(length)} bytes (limit {max_bytes})", response=response)
+    detector = ArticleEndDetector() if stop_after_article else None
+    chunks = []
+    size = drained = 0
+    for chunk in response.iter_content(CHUNK_SIZE):
+        if detector is not None and detector.done:
+            # Keep a short remainder, for JSON-LD placed after the article
+            # (see ``narrow_html``), which also lets the connection go back to
+            # the pool; give up on it (and the keep-alive) for long tails.
+            drained += len(chunk)
+            if drained > DRAIN_BYTES:
+                break
+            chunks.append(chunk)
+            continue
+        size += len(chunk)
+        if size > max_bytes:
+            raise FetchRejected(f"{response.url} exceeds {max_bytes} bytes", response=response)
+        chunks.append(chunk)
+        if detector is not None:
+            detector.feed(chunk)
+    return b"".join(chunks)
+
+
+def fetch(url, timeout=10, cache=None, session=None, max_bytes=MAX_BYTES,
+          content_types=HTML_TYPES, stop_after_article=False):
+    """GET ``url`` through the shared session, revalidating against ``cache``.
+
+    A fresh cache hit makes no request at all; a stale one sends
+    ``If-None-Match`` / ``If-Modified-Since`` and a ``304`` reuses the cached
+    body. Either way the returned page has ``not_modified=True`` and its
+    ``entry["derived"]`` still holds whatever was memoised for that body.
+
+    The body is streamed in ``CHUNK_SIZE`` pieces: responses whose
+    ``Content-Type`` is not in ``content_types`` or that grow past
+    ``max_bytes`` raise ``FetchRejected`` without being read in full. With
+    ``stop_after_article`` the download ends within ``DRAIN_BYTES`` of the
+    page's ``<article>`` element closing, since nothing after it but
+    embedded JSON-LD is used.
+    """
+    session = session or get_session()
+    entry = cache.get(url) if cache is not None else None
+    headers = {}
+    if entry is not None:
+        if time.time() - entry["fetched_at"] < cache.max_age:
+            return Page(url, entry["body"], 200, not_modified=True, entry=entry)
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    with session.get(url, timeout=timeout, headers=headers, stream=True) as response:
+        if response.status_code == 304 and entry is not None:
+            entry["fetched_at"] = time.time()
+            cache.put(url, entry)
+            return Page(url, entry["body"], 304, not_modified=True, entry=entry)
+
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type and content_types and content_type not in content_types:
+            raise FetchRejected(f"{url} has unsupported content type {content_type!r}", response=response)
+        text = _decode(_read_body(response, max_bytes, stop_after_article), response)
+
+    if cache is not None:
+        entry = {
+            "url": url,
+            "body": text,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "derived": {},
+        }
+        cache.put(url, entry)
+    return Page(url, text, response.status_code, entry=entry)
@@ -0,0 +1,243 @@
+"""Site-wide ``@graph``: entities from every page merged by ``@id`` and linked by reference.
+
+    graph = SiteGraph("https://futurevisioncomputers.com/")
+    for url, document in documents:
+        graph.add(url, document)
+    graph.page(url)       # that page's nodes plus every entity they reference
+    graph.document()      # one consolidated @graph for the whole site
+
+Every generator nests its entities inline — the provider inside each
+course, the instructor and branches inside each course instance, the
+publisher on every post — so a site's pages repeat the same organization,
+people and places thousands of times, with whatever small differences the
+forms they came from had. ``add`` flattens a document: each entity
+(``ENTITY_TYPES``) gets a canonical ``@id``, is stored once in an index
+keyed by that ``@id``, and is replaced where it was nested by an
+``{"@id": ...}`` reference, so Course -> CourseInstance -> Place / Person
+are linked by reference. Value nodes (addresses, offers, answers...) stay
+inline.
+
+An entity keeps its own ``@id`` (relative ones are resolved against the
+site URL, so ``#organization`` is the same entity on every page). Without
+one, it is looked up by identifying properties — name for people,
+organizations and places, course code, URL or name for courses — and
+otherwise given ``<site>#<kind>-<slug>``; a course instance is named after
+its course. When the same entity is seen again, properties it lacked are
+filled in and lists are merged, but values already set win; ``conflicts``
+counts the properties whose values disagreed.
+"""
+
+import json
+import re
+from collections import Counter
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from schemagen.builders import CONTEXT
+
+ENTITY_TYPES = {
+    "Organization": "organization",
+    "EducationalOrganization": "organization",
+    "LocalBusiness": "organization",
+    "Person": "person",
+    "Place": "place",
+    "Course": "course",
+    "CourseInstance": "instance",
+    "BlogPosting": "article",
+    "Article": "article",
+    "EducationalArticle": "article",
+    "WebPage": "webpage",
+    "FAQPage": "faq",
+}
+_GENERIC_TYPES = ("Thing", "Organization")  # dropped when merged with a more specific type
+
+_SLUG = re.compile(r"[^a-z0-9]+")
+
+
+def _slug(text):
+    return _SLUG.sub("-", str(text).lower()).strip("-") or "node"
+
+
+def _types(value):
+    return value if isinstance(value, list) else [value] if value else []
+
+
+def _family(node):
+    for schema_type in _types(node.get("@type")):
+        if schema_type in ENTITY_TYPES:
+            return ENTITY_TYPES[schema_type]
+    return None
+
+
+def _empty(value):
+    return value is None or value == "" or value == [] or value == {}
+
+
+def _normalize_url(url):
+    parts = urlsplit(str(url).strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/") or "/", parts.query, ""))
+
+
+def _keys(family, node):
+    """Identifying ``(property, value)`` pairs of an entity without an ``@id``, strongest first."""
+    name = " ".join(str(node.get("name") or "").lower().split())
+    url = node.get("url") if isinstance(node.get("url"), str) and node.get("url") else None
+    if family == "course":
+        identifier = node.get("identifier")
+        code = node.get("courseCode") or (identifier.get("value") if isinstance(identifier, dict) else identifier)
+        keys = [("code", code), ("url", url and _normalize_url(url)), ("name", name)]
+    elif family == "person":
+        keys = [("name", name)] + [("sameAs", _normalize_url(u)) for u in _types(node.get("sameAs"))]
+    elif family in ("organization", "place"):
+        address = node.get("address")
+        if isinstance(address, dict):
+            address = " ".join(str(address.get(k) or "") for k in ("streetAddress", "addressLocality")).strip()
+        keys = [("name", name), ("address", " ".join(str(address or "").lower().split()))]
+        if not name:
+            keys.append(("url", url and _normalize_url(url)))
+    else:
+        keys = [("url", url and _normalize_url(url))]
+    return [(prop, value) for prop, value in keys if value]
+
+
+def _nodes(document):
+    if isinstance(document, list):
+        for item in document:
+            yield from _nodes(item)
+    elif isinstance(document, dict) and "@graph" in document:
+        yield from document["@graph"]
+    elif isinstance(document, dict):
+        yield document
+
+
+def _merge_types(old, new):
+    merged = list(dict.fromkeys(_types(old) + _types(new)))
+    if len(merged) > 1:
+        merged = [t for t in merged if t not in _GENERIC_TYPES] or merged
+    return merged[0] if len(merged) == 1 else merged
+
+
+def _key(value):
+    return json.dumps(value, sort_keys=True, ensure_ascii=False)
+
+
+class SiteGraph:
+    """Entities of many pages, de-duplicated by ``@id``; ``page`` slices it, ``document`` emits all of it."""
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.entities = {}  # @id -> flattened node, in first-seen order
+        self.pages = {}  # page URL -> @ids of its top-level nodes
+        self.conflicts = Counter()  # (@id, property) -> values that disagreed with the stored one
+        self.seen = 0  # entity occurrences added, before de-duplication
+        self._refs = {}  # @id -> {@id it references: None}, in order
+        self._aliases = {}  # (kind, property, value) -> @id
+        self._stack = []  # references collected for the entities being flattened
+
+    def add(self, page_url, document):
+        """Flatten the nodes of ``document`` (a node, a list of documents or an ``@graph``) into the graph."""
+        roots = self.pages.setdefault(page_url, [])
+        for node in _nodes(document):
+            if isinstance(node, dict):
+                ref = self._flatten(node, page_url, None, top=True)
+                roots.append(ref["@id"])
+        self.pages[page_url] = list(dict.fromkeys(roots))
+
+    def page(self, page_url):
+        """``@graph`` document for one page: its own nodes first, then every entity they reference, transitively."""
+        order = list(self.pages[page_url])
+        seen = set(order)
+        for entity_id in order:  # grows while iterating: breadth-first
+            for ref in self._refs.get(entity_id, ()):
+                if ref not in seen and ref in self.entities:
+                    seen.add(ref)
+                    order.append(ref)
+        return {"@context": CONTEXT, "@graph": [self.entities[entity_id] for entity_id in order]}
+
+    def document(self):
+        """One ``@graph`` with every entity of every page."""
+        return {"@context": CONTEXT, "@graph": list(self.entities.values())}
+
+    def canonical(self, entity_id):
+        return urljoin(self.base_url, entity_id)
+
+    def _identify(self, node, family, page_url, parent, top):
+        if node.get("@id"):
+            return self.canonical(node["@id"])
+        keys = _keys(family, node) if family else []
+        for prop, value in keys:
+            entity_id = self._aliases.get((family, prop, value))
+            if entity_id is not None:
+                return entity_id
+        if family == "instance" and parent:
+            entity_id = f"{parent}-instance"
+            n = 1
+            while entity_id in self._stack[-1]:  # the course's other instances in this document
+                n += 1
+                entity_id = f"{parent}-instance-{n}"
+            return entity_id
+        if family == "faq" or (top and not keys):
+            return f"{page_url}#{family or _slug(node.get('@type', 'node'))}"
+        if not keys:
+            return None  # e.g. a Place known only by its coordinates: stays inline
+        prop, value = keys[0]
+        return f"{value}#{family}" if prop == "url" else f"{self.base_url.rstrip('/')}/#{family}-{_slug(value)}"
+
+    def _flatten(self, value, page_url, parent, top=False):
+        if isinstance(value, list):
+            return [self._flatten(item, page_url, parent) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if "@id" in value and set(value) <= {"@id", "@type"} and not top:
+            # A reference, or a typed stub like mainEntityOfPage: points at an entity, adds nothing to it
+            ref = dict(value, **{"@id": self.canonical(value["@id"])})
+            if self._stack:
+                self._stack[-1][ref["@id"]] = None
+            return ref
+        family = _family(value)
+        entity_id = self._identify(value, family, page_url, parent, top) if family or value.get("@id") or top else None
+        if entity_id is None:
+            return {key: item if key.startswith("@") else self._flatten(item, page_url, parent)
+                    for key, item in value.items() if key != "@context"}
+
+        self.seen += 1
+        flat = {"@type": value.get("@type", "Thing"), "@id": entity_id}
+        self._stack.append({})
+        try:
+            for key, item in value.items():
+                if key not in ("@context", "@type", "@id"):
+                    flat[key] = self._flatten(item, page_url, entity_id)
+        finally:
+            refs = self._stack.pop()
+        self._store(entity_id, family, flat, refs)
+        if self._stack:
+            self._stack[-1][entity_id] = None
+        return {"@id": entity_id}
+
+    def _store(self, entity_id, family, flat, refs):
+        for prop, value in _keys(family, flat) if family else ():
+            self._aliases.setdefault((family, prop, value), entity_id)
+        self._refs.setdefault(entity_id, {}).update(refs)
+        existing = self.entities.get(entity_id)
+        if existing is None:
+            self.entities[entity_id] = flat
+            return
+        for key, value in flat.items():
+            if key == "@type":
+                existing[key] = _merge_types(existing[key], value)
+            elif _empty(value):
+                continue
+            elif key not in existing or _empty(existing[key]):
+                existing[key] = value
+            elif isinstance(existing[key], list) and isinstance(value, list):
+                known = {_key(item) for item in existing[key]}
+                existing[key] = existing[key] + [item for item in value if _key(item) not in known]
+            elif _key(existing[key]) != _key(value):
+                self.conflicts[(entity_id, key)] += 1
+
+
+def linked_graph(document, page_url, base_url=None):
+    """``document`` (e.g. a generator's list of documents) as one ``@graph`` whose entities refer to each other by ``@id``."""
+    parts = urlsplit(page_url)
+    graph = SiteGraph(base_url or f"{parts.scheme}://{parts.netloc}/")
+    graph.add(page_url, document)
+    return graph.page(page_url)
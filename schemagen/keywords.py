@@ -0,0 +1,232 @@
+"""TF-IDF keyword scoring with stopwords, n-gram phrases and persisted corpus statistics.
+
+Documents are scored as a batch: term counts for every document go into one
+CSR-style sparse matrix (``indptr`` / ``indices`` / ``counts`` NumPy arrays),
+TF-IDF is a couple of vector operations over it, and the top terms of every
+row are picked with a single ``lexsort``. Ties break on vocabulary order, so
+results are the same on every run.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+
+from schemagen.fetch import DEFAULT_CACHE_DIR
+
+DEFAULT_STATS_PATH = os.path.join(os.path.dirname(DEFAULT_CACHE_DIR), "corpus_stats.json")
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are aren as at be because been before being below
+between both but by can cannot could did do does doing don down during each even every few for from further
+get gets getting got had has have having he her here hers herself him himself his how however i if in into is
+isn it its itself just let like ll lot make makes many may me might more most much must my myself need new no
+nor not now of off on once one only or other our ours ourselves out over own per re really same see she should
+so some such than that the their theirs them themselves then there these they this those through to too two
+under until up upon us use used using very via want was we well were what when where which while who whom why
+will with within without would yet you your yours yourself yourselves
+click read more share comment comments reply post posts blog home menu search copyright rights reserved
+privacy policy cookie cookies accept login sign subscribe next previous
+""".split())
+
+_TOKEN = re.compile(r"[a-z][a-z0-9]+")
+MIN_TOKEN_CHARS = 3
+MIN_PHRASE_COUNT = 2  # a phrase seen once in a post is usually a sentence fragment
+MAX_TERMS = 200_000  # vocabulary cap: terms first seen once it is full are never counted
+SAVE_EVERY_DOCS = 20
+SAVE_INTERVAL = 300  # seconds
+
+
+def tokenize(text):
+    return [t for t in _TOKEN.findall(text.lower()) if len(t) >= MIN_TOKEN_CHARS]
+
+
+def _doc_key(doc_id):
+    """Short fixed-size key for a document id, so the saved ids cost 16 bytes each rather than a URL."""
+    return hashlib.sha1(str(doc_id).encode("utf-8")).hexdigest()[:16]
+
+
+def terms(tokens, max_n=3):
+    """Unigrams and phrases up to ``max_n`` words that do not start or end with a stopword."""
+    content = [t not in STOPWORDS for t in tokens]
+    out = [t for t, ok in zip(tokens, content) if ok]
+    for n in range(2, max_n + 1):
+        for i in range(len(tokens) - n + 1):
+            if content[i] and content[i + n - 1]:
+                out.append(" ".join(tokens[i:i + n]))
+    return out
+
+
+class CorpusStats:
+    """Document frequencies across every post processed so far, persisted as JSON.
+
+    Documents are counted once per ``doc_id`` (the post URL), so re-running
+    over the same site does not inflate frequencies. The vocabulary holds at
+    most ``MAX_TERMS`` terms: a term first seen after it is full is never
+    counted, in this run or after a reload, so it scores as unseen while
+    every term in the vocabulary keeps its exact frequency. ``save`` writes
+    all of it, so ``df``, ``n_docs`` and the counted documents stay consistent.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.vocab = {}
+        self.terms = []
+        self.df = np.zeros(0, dtype=np.int64)
+        self.n_docs = 0
+        self.doc_ids = set()  # _doc_key of every document counted
+        self._lock = threading.Lock()
+        self._unsaved = 0
+        self._saved_at = time.monotonic()
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.terms = data["terms"]
+            self.vocab = {term: i for i, term in enumerate(self.terms)}
+            self.df = np.asarray(data["df"], dtype=np.int64)
+            self.n_docs = data["n_docs"]
+            self.doc_ids = set(data.get("doc_keys") or map(_doc_key, data.get("doc_ids", ())))
+
+    def _index(self, term):
+        index = self.vocab.get(term)
+        if index is None and len(self.terms) < MAX_TERMS:
+            index = self.vocab[term] = len(self.terms)
+            self.terms.append(term)
+        return index
+
+    def indices(self, doc_terms):
+        """Vocabulary indices for ``doc_terms``; -1 for terms no document has contained (frequency 0)."""
+        with self._lock:
+            return [self.vocab.get(t, -1) for t in doc_terms]
+
+    def _grow(self):
+        if len(self.df) < len(self.vocab):
+            self.df = np.concatenate([self.df, np.zeros(len(self.vocab) - len(self.df), dtype=np.int64)])
+
+    def add(self, doc_id, doc_terms):
+        """Count ``doc_terms`` towards document frequencies unless ``doc_id`` was already seen."""
+        key = _doc_key(doc_id)
+        with self._lock:
+            if key in self.doc_ids:
+                return
+            self.doc_ids.add(key)
+            indices = [index for index in map(self._index, dict.fromkeys(doc_terms)) if index is not None]
+            self._grow()
+            np.add.at(self.df, np.asarray(indices, dtype=np.int64), 1)
+            self.n_docs += 1
+            self._unsaved += 1
+
+    def idf(self, indices):
+        """Smoothed inverse document frequency for vocabulary ``indices`` (-1 counts as frequency 0)."""
+        indices = np.asarray(indices, dtype=np.int64)
+        with self._lock:
+            self._grow()
+            df = np.zeros(len(indices), dtype=np.int64)
+            known = indices >= 0
+            df[known] = self.df[indices[known]]
+            return np.log((1 + self.n_docs) / (1 + df)) + 1.0
+
+    def save(self, path=None):
+        """Write the statistics: every counted term with its frequency, and the keys of the documents counted."""
+        path = path or self.path
+        with self._lock:
+            self._grow()
+            data = {"n_docs": self.n_docs, "terms": list(self.terms), "df": self.df.tolist(),
+                    "doc_keys": sorted(self.doc_ids)}
+            self._unsaved = 0
+            self._saved_at = time.monotonic()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    def maybe_save(self, every=SAVE_EVERY_DOCS, interval=SAVE_INTERVAL):
+        """``save`` once ``every`` new documents were counted, or ``interval`` seconds after the last save."""
+        with self._lock:
+            due = self._unsaved >= every or (self._unsaved and time.monotonic() - self._saved_at >= interval)
+        if due:
+            self.save()
+        return bool(due)
+
+
+_default_stats = None
+_default_stats_lock = threading.Lock()
+
+
+def default_stats():
+    """Return the process-wide ``CorpusStats`` stored at ``DEFAULT_STATS_PATH``."""
+    global _default_stats
+    with _default_stats_lock:
+        if _default_stats is None:
+            _default_stats = CorpusStats(DEFAULT_STATS_PATH)
+        return _default_stats
+
+
+def count_terms(text, max_n=3):
+    """Term counts for one document, as taken by ``score_counts``."""
+    return Counter(terms(tokenize(text), max_n))
+
+
+def score_batch(docs, stats=None, top_k=10, max_n=3, doc_ids=None):
+    """Return the ``top_k`` TF-IDF terms for every text in ``docs``.
+
+    ``stats`` supplies document frequencies; when ``doc_ids`` is given the
+    batch is first added to it, so it is learned incrementally. Without
+    ``stats`` the batch itself is the corpus. Phrases are weighted by their
+    length in words so "pivot table" outranks "pivot" at equal counts, but only
+    when they occur at least ``MIN_PHRASE_COUNT`` times in the document.
+    """
+    return score_counts([count_terms(text, max_n) for text in docs], stats, top_k, doc_ids)
+
+
+def score_counts(docs, stats=None, top_k=10, doc_ids=None):
+    """``score_batch`` for documents already reduced to term counts by ``count_terms``.
+
+    Counting is the expensive part and needs no shared state, so it can run
+    in a worker process while only the scoring touches ``stats``.
+    """
+    if stats is None:
+        stats = CorpusStats()
+        doc_ids = doc_ids or range(len(docs))
+    if doc_ids is not None:
+        for doc_id, counter in zip(doc_ids, docs):
+            stats.add(doc_id, counter)
+
+    indptr = [0]
+    indices = []
+    counts = []
+    batch_terms = []
+    for counter in docs:
+        indices.extend(stats.indices(counter))
+        counts.extend(counter.values())
+        batch_terms.extend(counter)
+        indptr.append(len(indices))
+    if not indices:
+        return [[] for _ in docs]
+    indptr = np.asarray(indptr, dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    counts = np.asarray(counts, dtype=np.float64)
+    # Ties break on vocabulary order, then terms new to the corpus in the order they first appear
+    new, known = {}, len(stats.terms)
+    order_key = np.fromiter((index if index >= 0 else known + new.setdefault(term, len(new))
+                             for index, term in zip(indices.tolist(), batch_terms)), dtype=np.int64, count=len(indices))
+
+    rows = np.repeat(np.arange(len(docs)), np.diff(indptr))
+    lengths = np.bincount(rows, weights=counts, minlength=len(docs))
+    words = np.fromiter((term.count(" ") + 1 for term in batch_terms), dtype=np.float64, count=len(indices))
+    scores = counts / lengths[rows] * stats.idf(indices) * words
+    scores[(words > 1) & (counts < MIN_PHRASE_COUNT)] = 0.0
+
+    order = np.lexsort((order_key, -scores, rows))
+    rank = np.arange(len(order)) - indptr[rows[order]]
+    keep = order[(rank < top_k) & (scores[order] > 0)]
+    result = [[] for _ in docs]
+    for row, position in zip(rows[keep].tolist(), keep.tolist()):
+        result[row].append(batch_terms[position])
+    return result
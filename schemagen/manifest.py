@@ -0,0 +1,79 @@
+"""SQLite manifest of what was generated for each URL, for incremental re-runs.
+
+Per URL it records three fingerprints — the fetched body, the facts
+extracted from it and the JSON-LD written — together with the category and
+schema version (generator and site config) they were produced with, and
+the ``lastmod`` the source advertised (sitemap ``<lastmod>`` or WordPress
+``modified_gmt``). A re-run compares against them to skip pages whose
+source has not changed — without even fetching them when ``lastmod`` is
+unchanged — and to leave output files alone when the regenerated JSON-LD is
+identical.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+MANIFEST_NAME = ".manifest.sqlite3"
+
+_COLUMNS = ("category", "version", "source_hash", "facts_hash", "schema_hash", "path", "updated_at", "error",
+            "lastmod")
+
+
+def fingerprint(value):
+    """Stable SHA-256 of a string or any JSON-serialisable value."""
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+class Manifest:
+    """URL -> fingerprints, stored in one SQLite file and safe to share between threads."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS pages (url TEXT PRIMARY KEY, category TEXT, version TEXT, "
+            "source_hash TEXT, facts_hash TEXT, schema_hash TEXT, path TEXT, updated_at REAL, error TEXT, lastmod TEXT)"
+        )
+        existing = {row[1] for row in self._db.execute("PRAGMA table_info(pages)")}
+        if "lastmod" not in existing:  # manifests written before lastmod was recorded
+            self._db.execute("ALTER TABLE pages ADD COLUMN lastmod TEXT")
+        self._db.commit()
+
+    def get(self, url):
+        with self._lock:
+            row = self._db.execute(f"SELECT {', '.join(_COLUMNS)} FROM pages WHERE url = ?", (url,)).fetchone()
+        return dict(zip(_COLUMNS, row)) if row else None
+
+    def record(self, url, **fields):
+        """Insert or update the entry for ``url`` with ``fields`` (a subset of the columns)."""
+        fields["updated_at"] = time.time()
+        names = list(fields)
+        with self._lock:
+            self._db.execute(
+                f"INSERT INTO pages (url, {', '.join(names)}) VALUES (?{', ?' * len(names)}) "
+                f"ON CONFLICT(url) DO UPDATE SET {', '.join(f'{n} = excluded.{n}' for n in names)}",
+                [url, *fields.values()],
+            )
+            self._db.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,123 @@
+"""Streaming JSON-LD writers: JSONL, one file per document, or a ZIP archive.
+
+Each document is serialised and written as soon as it is handed over, so an
+export of any size holds only the document being written in memory:
+
+    with open_sink("schemas.zip", compact=True) as sink:
+        for result in crawl(urls, category):
+            sink.write(output_filename(result.url), result.schema)
+
+``compact`` drops all whitespace (``separators=(",", ":")``); otherwise
+files are indented by 2 and JSONL lines are single-line either way. The
+serialiser is orjson when it is installed (``backend="auto"``), which is
+several times faster than the standard library and produces the same
+bytes for our documents.
+"""
+
+import json
+import os
+import threading
+import zipfile
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+BACKENDS = ("auto", "json", "orjson")
+
+
+def dumps(obj, compact=False, backend="auto"):
+    """Serialise ``obj`` to UTF-8 JSON bytes, indented by 2 unless ``compact``."""
+    if backend == "orjson" or (backend == "auto" and orjson is not None):
+        if orjson is None:
+            raise RuntimeError("backend='orjson' needs the orjson package: pip install orjson")
+        return orjson.dumps(obj, option=0 if compact else orjson.OPT_INDENT_2)
+    if compact:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+class JsonlSink:
+    """One compact JSON document per line; ``name`` is ignored."""
+
+    def __init__(self, target, backend="auto", **_):
+        self._own = isinstance(target, (str, os.PathLike))
+        self._file = open(target, "wb") if self._own else target
+        self.backend = backend
+        self.count = 0
+        self.bytes = 0
+
+    def write(self, name, obj):
+        data = dumps(obj, compact=True, backend=self.backend) + b"\n"
+        self._file.write(data)
+        self.count += 1
+        self.bytes += len(data)
+
+    def close(self):
+        if self._own:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class DirectorySink(JsonlSink):
+    """One ``name`` file per document inside a directory, each written atomically."""
+
+    def __init__(self, directory, compact=False, backend="auto"):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.compact = compact
+        self.backend = backend
+        self.count = 0
+        self.bytes = 0
+
+    def write(self, name, obj):
+        data = dumps(obj, compact=self.compact, backend=self.backend)
+        path = os.path.join(self.directory, name)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        self.count += 1
+        self.bytes += len(data)
+
+    def close(self):
+        pass
+
+
+class ZipSink(JsonlSink):
+    """One ``name`` entry per document in a deflated ZIP, streamed to a path or binary file."""
+
+    def __init__(self, target, compact=False, backend="auto"):
+        self._zip = zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED)
+        self.compact = compact
+        self.backend = backend
+        self.count = 0
+        self.bytes = 0
+
+    def write(self, name, obj):
+        data = dumps(obj, compact=self.compact, backend=self.backend)
+        with self._zip.open(name, "w") as entry:
+            entry.write(data)
+        self.count += 1
+        self.bytes += len(data)
+
+    def close(self):
+        self._zip.close()
+
+
+def open_sink(target, compact=False, backend="auto"):
+    """Pick a sink from ``target``: ``*.jsonl`` / ``*.ndjson`` file, ``*.zip`` archive, otherwise a directory."""
+    ext = os.path.splitext(str(target))[1].lower()
+    if ext in (".jsonl", ".ndjson"):
+        return JsonlSink(target, backend=backend)
+    if ext == ".zip":
+        return ZipSink(target, compact=compact, backend=backend)
+    return DirectorySink(target, compact=compact, backend=backend)
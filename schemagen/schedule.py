@@ -0,0 +1,239 @@
+"""Per-host politeness for outbound fetches: rate limits, concurrency caps, retries.
+
+Every request to a host goes through a ``Scheduler`` slot, which
+
+* caps concurrent requests per host (``per_host``),
+* spaces requests with a token bucket (``rate`` per second, bursts of
+  ``burst``), slowed further to the host's robots.txt ``Crawl-delay``,
+* retries 429 / 5xx responses, timeouts and connection errors with
+  exponential backoff and full jitter, honouring ``Retry-After``; the pause
+  applies to the whole host, not just the request that was throttled.
+
+``metrics()`` reports per-host queue depth, waits, retries and throttles.
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+
+from schemagen.fetch import USER_AGENT, fetch, get_session
+
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+ROBOTS_TIMEOUT = 5
+
+
+class _Host:
+    def __init__(self, rate, burst, per_host):
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(per_host)
+        self.rate = rate
+        self.burst = burst
+        self.tat = 0.0  # theoretical arrival time of the next request at exactly ``rate``
+        self.not_before = 0.0  # set by backoff / Retry-After
+        self.robots_checked = False
+        self.robots_ready = threading.Event()
+        self.crawl_delay = None
+        self.queued = 0
+        self.in_flight = 0
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.failures = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def reserve(self):
+        """Book the next send time and return how long to sleep until it.
+
+        A token bucket in its virtual-scheduling form (GCRA): requests are
+        spaced ``1 / rate`` apart, up to ``burst`` may go early, and nothing
+        is booked before ``not_before`` so a backoff is not followed by a
+        stampede of waiters.
+        """
+        with self.lock:
+            now = time.monotonic()
+            interval = 1.0 / self.rate
+            send_at = max(now, self.not_before, self.tat - (self.burst - 1) * interval)
+            self.tat = max(self.tat, send_at) + interval
+            return send_at - now
+
+
+def crawl_delay(robots_txt, agent=USER_AGENT):
+    """``Crawl-delay`` in seconds for ``agent`` (falling back to ``*``), or ``None``.
+
+    Parsed by hand because ``urllib.robotparser`` only accepts whole seconds.
+    """
+    agent = agent.split("/")[0].lower()
+    delays = {}
+    group, in_rules = [], False
+    for line in robots_txt.splitlines():
+        key, _, value = line.split("#", 1)[0].partition(":")
+        key, value = key.strip().lower(), value.strip()
+        if key == "user-agent":
+            if in_rules:
+                group, in_rules = [], False
+            group.append(value.lower())
+        elif key:
+            in_rules = True
+            if key == "crawl-delay":
+                try:
+                    delays.update((name, float(value)) for name in group)
+                except ValueError:
+                    pass
+    for name, delay in delays.items():
+        if name != "*" and name in agent:
+            return delay
+    return delays.get("*")
+
+
+def retry_after(response):
+    """Seconds from a ``Retry-After`` header (delta-seconds or HTTP date), or ``None``."""
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class Scheduler:
+    """Thread-safe per-host scheduler shared by every fetch of a crawl."""
+
+    def __init__(self, rate=4.0, burst=8, per_host=4, max_retries=4, backoff=0.5, max_backoff=60.0,
+                 respect_robots=True):
+        self.rate = rate
+        self.burst = burst
+        self.per_host = per_host
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.respect_robots = respect_robots
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host(self, host):
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _Host(self.rate, self.burst, self.per_host)
+            return state
+
+    def _check_robots(self, scheme, host, state):
+        """Slow ``state`` down to the host's robots.txt ``Crawl-delay``; fetched once per host."""
+        with state.lock:
+            first = not state.robots_checked
+            state.robots_checked = True
+        if not first:
+            state.robots_ready.wait()
+            return
+        try:
+            self._read_robots(scheme, host, state)
+        finally:
+            state.robots_ready.set()
+
+    def _read_robots(self, scheme, host, state):
+        try:
+            response = get_session().get(f"{scheme}://{host}/robots.txt", timeout=ROBOTS_TIMEOUT)
+        except requests.RequestException:
+            return
+        if response.status_code != 200:
+            return
+        delay = crawl_delay(response.text)
+        if delay:
+            with state.lock:
+                state.crawl_delay = float(delay)
+                state.rate = min(state.rate, 1.0 / float(delay))
+                state.burst = 1
+
+    @contextmanager
+    def slot(self, url):
+        """Hold one request slot for ``url``'s host, waiting for concurrency, rate and backoff."""
+        parsed = urlparse(url)
+        state = self._host(parsed.netloc)
+        if self.respect_robots and not state.robots_ready.is_set():
+            self._check_robots(parsed.scheme or "https", parsed.netloc, state)
+        start = time.monotonic()
+        with state.lock:
+            state.queued += 1
+        state.slots.acquire()
+        try:
+            wait = state.reserve()
+            if wait > 0:
+                time.sleep(wait)
+            waited = time.monotonic() - start
+            with state.lock:
+                state.queued -= 1
+                state.in_flight += 1
+                state.requests += 1
+                state.wait_total += waited
+                state.wait_max = max(state.wait_max, waited)
+            try:
+                yield
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+        finally:
+            state.slots.release()
+
+    def _penalize(self, url, delay):
+        state = self._host(urlparse(url).netloc)
+        with state.lock:
+            state.not_before = max(state.not_before, time.monotonic() + delay)
+
+    def call(self, url, fn, *args, **kwargs):
+        """Run ``fn(*args, **kwargs)`` in a slot for ``url``, retrying transient failures."""
+        state = self._host(urlparse(url).netloc)
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self.slot(url):
+                    return fn(*args, **kwargs)
+            except (requests.HTTPError, requests.ConnectionError, requests.Timeout) as e:
+                response = getattr(e, "response", None)
+                status = response.status_code if response is not None else None
+                if isinstance(e, requests.HTTPError) and status not in RETRY_STATUSES:
+                    raise
+                with state.lock:
+                    state.throttled += status == 429
+                    if attempt == self.max_retries:
+                        state.failures += 1
+                    else:
+                        state.retries += 1
+                if attempt == self.max_retries:
+                    raise
+                delay = retry_after(response)
+                if delay is None:
+                    delay = random.uniform(0, self.backoff * 2 ** attempt)
+                self._penalize(url, min(delay, self.max_backoff))
+
+    def fetch(self, url, **kwargs):
+        """``schemagen.fetch.fetch`` through the scheduler."""
+        return self.call(url, fetch, url, **kwargs)
+
+    def metrics(self):
+        """Per-host counters: queue depth, in-flight, requests, retries, throttles and waits."""
+        with self._lock:
+            hosts = dict(self._hosts)
+        out = {}
+        for host, state in hosts.items():
+            with state.lock:
+                out[host] = {
+                    "queued": state.queued,
+                    "in_flight": state.in_flight,
+                    "requests": state.requests,
+                    "retries": state.retries,
+                    "throttled": state.throttled,
+                    "failures": state.failures,
+                    "rate": state.rate,
+                    "crawl_delay": state.crawl_delay,
+                    "wait_avg": state.wait_total / state.requests if state.requests else 0.0,
+                    "wait_max": state.wait_max,
+                }
+        return out
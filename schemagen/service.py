@@ -0,0 +1,417 @@
+"""ASGI service exposing schema generation over HTTP, e.g. for a CMS publish hook.
+
+    pip install -r requirements-service.txt
+    uvicorn schemagen.service:app --host 0.0.0.0 --port 8000
+
+Endpoints (request bodies are JSON):
+
+* ``POST /schema/blog`` — ``{"url": ..., "category": ..., "html": optional}``.
+  Without ``html`` the page is fetched; the JSON-LD ``@graph`` is returned.
+* ``POST /schema/course`` — ``{"kind": "course" | "course-branches" |
+  "full-course", "fields": {...}}`` with the same field names as the CLI
+  columns / ``schemagen.course`` parameters.
+* ``POST /schema/article`` — the same for ``"article"`` / ``"blog-posting"``.
+* ``POST /schema/batch`` — ``{"items": [{"type": "blog" | "course" |
+  "article", ...}, ...]}``; one ``{"schema": ...}`` or ``{"error": ...}``
+  per item, in order.
+
+Pages are fetched with a pooled ``httpx.AsyncClient`` and revalidated
+against the ``PageCache``; parsing runs on a process pool so the event loop
+never blocks on BeautifulSoup. Responses carry an ``ETag`` and honour
+``If-None-Match``, and blog results are kept in memory for
+``RESULT_TTL`` seconds, with concurrent requests for the same URL sharing
+one fetch, so repeat requests never touch the network or the parser.
+
+Only public addresses are fetched: a URL whose host is, or resolves to, a
+private, loopback, link-local or otherwise non-global address is rejected
+(422), and redirects are followed by hand (at most ``MAX_REDIRECTS``) so
+every hop is checked the same way. ``SCHEMAGEN_ALLOW_PRIVATE_URLS=1``
+lifts the check for local testing.
+
+``GET /metrics`` reports the time spent per blog pipeline stage (fetch,
+parse, text, FAQs, serialisation…) and byte / node counts since start-up in
+the Prometheus text format (``schemagen.timing``).
+"""
+
+import asyncio
+import hashlib
+import ipaddress
+import os
+import socket
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Literal, Optional
+from urllib.parse import urljoin, urlsplit
+
+import httpx
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
+
+from schemagen.blog import analyze_blog_html, build_blog_schema, cached_blog_schema, remember_blog_schema
+from schemagen.cli import generate
+from schemagen.fetch import (
+    CHUNK_SIZE,
+    DRAIN_BYTES,
+    HTML_TYPES,
+    MAX_BYTES,
+    USER_AGENT,
+    ArticleEndDetector,
+    FetchRejected,
+    Page,
+    _decode,
+    default_cache,
+)
+from schemagen.keywords import default_stats
+from schemagen.manifest import fingerprint
+from schemagen.output import dumps
+from schemagen.timing import StageStats, Timings
+
+RESULT_TTL = 300  # same as PageCache.max_age
+RESULT_ENTRIES = 4096
+FETCH_TIMEOUT = 10
+BATCH_CONCURRENCY = 16
+WORKERS = int(os.environ.get("SCHEMAGEN_WORKERS", 0)) or None  # parse processes, default: CPU count
+MAX_REDIRECTS = 5
+ALLOW_PRIVATE_URLS = os.environ.get("SCHEMAGEN_ALLOW_PRIVATE_URLS") == "1"
+
+JSON_LD = "application/ld+json"
+
+
+# --- Request models ---
+class BlogRequest(BaseModel):
+    url: str
+    category: str = "Education"
+    html: Optional[str] = None
+
+
+class CourseRequest(BaseModel):
+    kind: Literal["course", "course-branches", "full-course"] = "course"
+    fields: Dict[str, Any]
+
+
+class ArticleRequest(BaseModel):
+    kind: Literal["article", "blog-posting"] = "article"
+    fields: Dict[str, Any]
+
+
+class BatchItem(BaseModel):
+    type: Literal["blog", "course", "article"]
+    url: Optional[str] = None
+    category: str = "Education"
+    html: Optional[str] = None
+    kind: Optional[str] = None
+    fields: Dict[str, Any] = Field(default_factory=dict)
+
+
+class BatchRequest(BaseModel):
+    items: List[BatchItem]
+
+
+# --- Fetching ---
+async def _read_body(response, max_bytes, stop_after_article):
+    length = response.headers.get("Content-Length")
+    if length and length.isdigit() and int(length) > max_bytes:
+        raise FetchRejected(f"{response.url} is {int(length)} bytes (limit {max_bytes})")
+    detector = ArticleEndDetector() if stop_after_article else None
+    chunks = []
+    size = drained = 0
+    async for chunk in response.aiter_bytes(CHUNK_SIZE):
+        if detector is not None and detector.done:
+            drained += len(chunk)
+            if drained > DRAIN_BYTES:
+                break
+            chunks.append(chunk)
+            continue
+        size += len(chunk)
+        if size > max_bytes:
+            raise FetchRejected(f"{response.url} exceeds {max_bytes} bytes")
+        chunks.append(chunk)
+        if detector is not None:
+            detector.feed(chunk)
+    return b"".join(chunks)
+
+
+async def check_public_url(url):
+    """Raise ``FetchRejected`` unless ``url`` is http(s) and its host resolves only to public addresses."""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise FetchRejected(f"{url} is not an http(s) URL")
+    if ALLOW_PRIVATE_URLS:
+        return
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(parts.hostname, parts.port or parts.scheme, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        raise FetchRejected(f"{parts.hostname} does not resolve ({e})")
+    for info in infos:
+        address = ipaddress.ip_address(info[4][0].split("%")[0])
+        if not address.is_global:
+            raise FetchRejected(f"{url} resolves to non-public address {address}")
+
+
+async def fetch_async(client, url, cache=None, max_bytes=MAX_BYTES, content_types=HTML_TYPES,
+                      stop_after_article=False):
+    """``schemagen.fetch.fetch`` on an ``httpx.AsyncClient``: same cache, validators and limits.
+
+    ``url`` and every redirect target must pass ``check_public_url``.
+    """
+    entry = await asyncio.to_thread(cache.get, url) if cache is not None else None
+    headers = {}
+    if entry is not None:
+        if time.time() - entry["fetched_at"] < cache.max_age:
+            return Page(url, entry["body"], 200, not_modified=True, entry=entry)
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    target = url
+    for _ in range(MAX_REDIRECTS + 1):
+        await check_public_url(target)
+        request = client.build_request("GET", target, headers=headers)
+        response = await client.send(request, stream=True, follow_redirects=False)
+        if not response.is_redirect:
+            break
+        await response.aclose()
+        target = urljoin(str(response.url), response.headers["Location"])
+    else:
+        raise FetchRejected(f"{url} redirected more than {MAX_REDIRECTS} times")
+
+    try:
+        if response.status_code == 304 and entry is not None:
+            entry["fetched_at"] = time.time()
+            await asyncio.to_thread(cache.put, url, entry)
+            return Page(url, entry["body"], 304, not_modified=True, entry=entry)
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type and content_types and content_type not in content_types:
+            raise FetchRejected(f"{url} has unsupported content type {content_type!r}")
+        text = _decode(await _read_body(response, max_bytes, stop_after_article), response)
+    finally:
+        await response.aclose()
+
+    if cache is not None:
+        entry = {
+            "url": url,
+            "body": text,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "derived": {},
+        }
+        await asyncio.to_thread(cache.put, url, entry)
+    return Page(url, text, response.status_code, entry=entry)
+
+
+# --- Result cache ---
+class Abandoned(Exception):
+    """Set on a single-flight future whose computing request was cancelled."""
+
+
+class ResultCache:
+    """In-memory LRU of serialised results with a TTL, plus single-flight for misses."""
+
+    def __init__(self, ttl=RESULT_TTL, max_entries=RESULT_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._inflight = {}
+
+    def get(self, key):
+        hit = self._entries.get(key)
+        if hit is None or hit[0] < time.monotonic():
+            return None
+        self._entries.move_to_end(key)
+        return hit[1]
+
+    def put(self, key, value):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_compute(self, key, compute):
+        """Return ``(value, hit)``; concurrent misses for ``key`` await a single ``compute()``."""
+        value = self.get(key)
+        if value is not None:
+            return value, True
+        future = self._inflight.get(key)
+        if future is not None:
+            try:
+                return await asyncio.shield(future), True
+            except Abandoned:  # the request computing it was cancelled: one of the waiters takes over
+                return await self.get_or_compute(key, compute)
+        future = self._inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            # Only this request was cancelled; the ones waiting on it must not be cancelled or left hanging
+            future.set_exception(Abandoned(key))
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else is waiting
+            raise
+        finally:
+            del self._inflight[key]
+        self.put(key, value)
+        future.set_result(value)
+        return value, False
+
+
+class Rendered:
+    """A schema serialised once, with its ETag."""
+
+    __slots__ = ("schema", "body", "etag")
+
+    def __init__(self, schema, timings=None):
+        self.schema = schema
+        start = time.perf_counter()
+        self.body = dumps(schema, compact=True)
+        if timings is not None:
+            timings.add("serialize", time.perf_counter() - start)
+            timings.count("json_bytes", len(self.body))
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+
+
+# --- Generation ---
+async def _blog(state, url, category, html=None):
+    loop = asyncio.get_running_loop()
+    cache, stats = state.page_cache, state.stats
+    timings = Timings()
+
+    if html is None:
+        with timings.stage("fetch"):
+            page = await fetch_async(state.client, url, cache=cache, stop_after_article=True)
+        memo = cached_blog_schema(page, category)
+        if memo is not None:
+            rendered = Rendered(memo[0], timings)
+            state.timings.add(timings)
+            return rendered
+        html = page.text
+    else:
+        page = None
+    facts = await loop.run_in_executor(state.pool, analyze_blog_html, html, url)
+    timings.update(facts["timings"])
+    schema, checklist = await asyncio.to_thread(build_blog_schema, url, category, facts, stats, timings=timings)
+    if page is not None:
+        await asyncio.to_thread(remember_blog_schema, cache, page, category, schema, checklist)
+    await asyncio.to_thread(stats.maybe_save)
+    rendered = Rendered(schema, timings)
+    state.timings.add(timings)
+    return rendered
+
+
+async def blog_schema(state, url, category, html=None):
+    """``(Rendered, hit)`` for a blog post, served from the result cache when possible."""
+    key = ("blog", url, category, fingerprint(html) if html is not None else None)
+    return await state.results.get_or_compute(key, lambda: _blog(state, url, category, html))
+
+
+def form_schema(kind, fields):
+    return Rendered(generate(kind, fields))
+
+
+def _respond(request, rendered, hit=False):
+    headers = {"ETag": rendered.etag, "X-Schema-Cache": "hit" if hit else "miss"}
+    if rendered.etag in request.headers.get("If-None-Match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(rendered.body, media_type=JSON_LD, headers=headers)
+
+
+def _http_error(e):
+    if isinstance(e, FetchRejected):
+        return HTTPException(422, str(e))
+    if isinstance(e, httpx.HTTPStatusError):
+        return HTTPException(502, f"upstream returned {e.response.status_code} for {e.request.url}")
+    if isinstance(e, httpx.HTTPError):
+        return HTTPException(502, f"{type(e).__name__}: {e}")
+    if isinstance(e, (ValueError, TypeError)):
+        return HTTPException(422, str(e))
+    return HTTPException(500, f"{type(e).__name__}: {e}")
+
+
+# --- App ---
+@asynccontextmanager
+async def lifespan(app):
+    state = app.state
+    state.client = httpx.AsyncClient(
+        timeout=FETCH_TIMEOUT,
+        headers={"User-Agent": USER_AGENT},
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=32),
+    )
+    state.pool = ProcessPoolExecutor(max_workers=WORKERS)
+    state.page_cache = default_cache()
+    state.stats = default_stats()
+    state.results = ResultCache()
+    state.timings = StageStats()
+    try:
+        yield
+    finally:
+        await state.client.aclose()
+        state.pool.shutdown(cancel_futures=True)
+        state.stats.save()
+
+
+app = FastAPI(title="Schema Generator", lifespan=lifespan)
+
+
+@app.get("/healthz")
+async def healthz():
+    return {"ok": True}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics(request: Request):
+    return PlainTextResponse(request.app.state.timings.to_prometheus(), media_type="text/plain; version=0.0.4")
+
+
+@app.post("/schema/blog")
+async def post_blog(body: BlogRequest, request: Request):
+    try:
+        rendered, hit = await blog_schema(request.app.state, body.url, body.category, body.html)
+    except Exception as e:
+        raise _http_error(e)
+    return _respond(request, rendered, hit)
+
+
+@app.post("/schema/course")
+async def post_course(body: CourseRequest, request: Request):
+    try:
+        return _respond(request, form_schema(body.kind, body.fields))
+    except Exception as e:
+        raise _http_error(e)
+
+
+@app.post("/schema/article")
+async def post_article(body: ArticleRequest, request: Request):
+    try:
+        return _respond(request, form_schema(body.kind, body.fields))
+    except Exception as e:
+        raise _http_error(e)
+
+
+async def _batch_item(state, item, semaphore):
+    async with semaphore:
+        try:
+            if item.type == "blog":
+                if not item.url:
+                    raise ValueError("blog items need a url")
+                rendered, _ = await blog_schema(state, item.url, item.category, item.html)
+            else:
+                request_type = CourseRequest if item.type == "course" else ArticleRequest
+                request = request_type(kind=item.kind or request_type.model_fields["kind"].default, fields=item.fields)
+                rendered = form_schema(request.kind, request.fields)
+            return {"schema": rendered.schema}
+        except Exception as e:
+            return {"error": _http_error(e).detail}
+
+
+@app.post("/schema/batch")
+async def post_batch(body: BatchRequest, request: Request):
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    results = await asyncio.gather(*(_batch_item(request.app.state, item, semaphore) for item in body.items))
+    return {"results": results}
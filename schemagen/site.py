@@ -0,0 +1,89 @@
+"""Site-wide schema nodes (Organization / publisher, branches) defined once in a config file.
+
+``site.json`` (or the file named by ``SCHEMAGEN_SITE_CONFIG``) holds the
+JSON-LD of nodes that are the same on every page:
+
+* ``organization`` — the publisher, with an ``@id`` that per-page nodes
+  reference (``{"@id": "https://futurevisioncomputers.com/#organization"}``)
+  instead of repeating it. A relative ``@id`` is resolved against the
+  organization's ``url``, so it names the same node on every page;
+* ``nodes`` — further site-wide nodes, e.g. branches as ``LocalBusiness``
+  with ``"parentOrganization": {"@id": ...}``, added to every page graph.
+
+The file is read and its nodes built once, then shared by every page until
+the file changes on disk. ``version`` fingerprints the config so cached and
+incrementally refreshed schema is regenerated after an edit.
+"""
+
+import json
+import os
+import threading
+from urllib.parse import urljoin
+
+from schemagen.manifest import fingerprint
+
+DEFAULT_SITE_CONFIG = os.environ.get(
+    "SCHEMAGEN_SITE_CONFIG", os.path.join(os.path.dirname(os.path.abspath(__file__)), "site.json")
+)
+
+
+def _replace_id(value, old, new):
+    """``value`` with every ``"@id": old`` reference changed to ``new``."""
+    if isinstance(value, list):
+        return [_replace_id(item, old, new) for item in value]
+    if isinstance(value, dict):
+        return {key: new if key == "@id" and item == old else _replace_id(item, old, new) for key, item in value.items()}
+    return value
+
+
+class SiteConfig:
+    """The parsed config: ``organization``, ``nodes`` (organization first) and ``version``."""
+
+    def __init__(self, config, path=None):
+        organization = config.get("organization")
+        if not isinstance(organization, dict) or not organization.get("@id"):
+            raise ValueError(f"{path or 'site config'}: 'organization' must be a JSON-LD node with an '@id'")
+        self.path = path
+        nodes = config.get("nodes", [])
+        absolute = urljoin(organization.get("url") or "", organization["@id"])
+        if absolute != organization["@id"]:
+            nodes = _replace_id(nodes, organization["@id"], absolute)
+            organization = dict(organization, **{"@id": absolute})
+        self.organization = organization
+        self.nodes = [organization, *nodes]
+        self.version = fingerprint(config)[:12]
+
+    @property
+    def publisher(self):
+        """``@id`` reference to the organization, for ``publisher`` / ``provider`` properties."""
+        return {"@id": self.organization["@id"]}
+
+    def get(self, path, default=""):
+        """An organization property as plain text, e.g. for form defaults: ``get("location.geo.latitude")``."""
+        value = self.organization
+        for key in path.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        if isinstance(value, dict):
+            value = value.get("url")
+        if isinstance(value, list):
+            value = ", ".join(value)
+        return default if value is None else value
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f), path)
+
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+def load_site(path=DEFAULT_SITE_CONFIG):
+    """Return the ``SiteConfig`` for ``path``, re-read only when the file has changed."""
+    mtime = os.stat(path).st_mtime_ns
+    with _lock:
+        hit = _loaded.get(path)
+        if hit is None or hit[0] != mtime:
+            hit = _loaded[path] = (mtime, SiteConfig.load(path))
+        return hit[1]
@@ -0,0 +1,355 @@
+"""SQLite project store: institutes, branches, instructors, courses and blog posts saved from the forms.
+
+    store = ProjectStore()                       # DEFAULT_STORE_PATH
+    course_id = store.save_course(fields)        # a course form's fields, as passed to the generator
+    store.search("power bi")                     # full text over names, codes and descriptions
+    store.course_fields(course_id)               # the same fields back, institute and instructor included
+
+Records keep the form fields under their generator parameter names (see
+``schemagen.course`` / ``schemagen.article``). A saved course form is
+split into its institute (``inst_*``, opening hours), instructor
+(``instructor_*``, ``author_*``), branches and the course itself, so every
+course of an institute shares one institute row and editing it once
+changes them all. Institutes and instructors are matched by name, courses
+by code (or name) and posts by URL (or headline) — each kept as an
+indexed ``slug`` — so saving a form again updates its record instead of
+adding one. Saving merges: fields a form does not have (the FAQ app has
+no institute phone) keep their stored values.
+
+``rows(kind)`` yields a generator's fields for every stored course or
+post, which is what ``python -m schemagen <kind> projects.sqlite3`` reads
+to regenerate a whole catalogue. Search uses SQLite's FTS5 when it is
+compiled in and falls back to ``LIKE`` otherwise.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+# Next to the page cache (schemagen.fetch.DEFAULT_CACHE_DIR), read from the environment here so that the
+# form apps can open the store without importing requests
+_CACHE_DIR = os.environ.get("SCHEMAGEN_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "schemagen", "pages"))
+DEFAULT_STORE_PATH = os.environ.get("SCHEMAGEN_STORE", os.path.join(os.path.dirname(_CACHE_DIR), "projects.sqlite3"))
+
+INSTITUTE_FIELDS = ("inst_id", "inst_name", "inst_url", "inst_logo", "inst_phone", "inst_email", "inst_address",
+                    "inst_street", "inst_city", "inst_state", "inst_pin", "inst_country", "inst_lat", "inst_long",
+                    "inst_area", "inst_map", "inst_social", "opens", "closes")
+INSTRUCTOR_FIELDS = ("instructor_name", "instructor_desc", "author_sameas", "author_knows", "inst_exp")
+BRANCH_FIELDS = ("street", "city", "region", "postal", "country", "telephone")
+# Forms that name the same fields differently: form name -> stored name
+ALIASES = {"provider_name": "inst_name", "provider_url": "inst_url", "provider_logo": "inst_logo",
+           "inst_name_instructor": "instructor_name"}
+
+COURSE_KINDS = ("course", "course-branches", "full-course")
+POST_KINDS = ("article", "blog-posting")
+_SEARCH_COLUMNS = ("course_name", "course_code", "course_desc", "topics", "keywords", "about_tags",
+                   "headline", "description")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS institutes (
+    id INTEGER PRIMARY KEY, slug TEXT NOT NULL UNIQUE, name TEXT, url TEXT, fields TEXT NOT NULL, updated_at REAL);
+CREATE INDEX IF NOT EXISTS institutes_url ON institutes (url);
+CREATE TABLE IF NOT EXISTS branches (
+    id INTEGER PRIMARY KEY, institute_id INTEGER NOT NULL REFERENCES institutes (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL, fields TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS branches_institute ON branches (institute_id, position);
+CREATE TABLE IF NOT EXISTS instructors (
+    id INTEGER PRIMARY KEY, slug TEXT NOT NULL UNIQUE, name TEXT, fields TEXT NOT NULL, updated_at REAL);
+CREATE TABLE IF NOT EXISTS courses (
+    id INTEGER PRIMARY KEY, slug TEXT NOT NULL UNIQUE, code TEXT, name TEXT, url TEXT,
+    institute_id INTEGER REFERENCES institutes (id) ON DELETE SET NULL,
+    instructor_id INTEGER REFERENCES instructors (id) ON DELETE SET NULL,
+    fields TEXT NOT NULL, updated_at REAL);
+CREATE INDEX IF NOT EXISTS courses_code ON courses (code);
+CREATE INDEX IF NOT EXISTS courses_url ON courses (url);
+CREATE INDEX IF NOT EXISTS courses_institute ON courses (institute_id);
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY, kind TEXT NOT NULL, slug TEXT NOT NULL, headline TEXT, url TEXT,
+    fields TEXT NOT NULL, updated_at REAL, UNIQUE (kind, slug));
+CREATE INDEX IF NOT EXISTS posts_url ON posts (url);
+"""
+
+_SLUG = re.compile(r"[^a-z0-9]+")
+_SCHEME = re.compile(r"^https?://(www\.)?")
+_WORD = re.compile(r"\w+")
+
+
+def slugify(text):
+    return _SLUG.sub("-", str(text or "").lower()).strip("-")
+
+
+def _url_slug(url):
+    return slugify(_SCHEME.sub("", str(url or "").strip().rstrip("/")))
+
+
+def _dumps(fields):
+    return json.dumps(fields, ensure_ascii=False, default=str)  # dates from the forms become ISO strings
+
+
+def _canonical(fields):
+    """Form fields under their stored names."""
+    return {ALIASES.get(key, key): value for key, value in fields.items()}
+
+
+def _with_aliases(fields):
+    """Stored fields plus every form's name for them, so any generator finds what it takes."""
+    return {**fields, **{alias: fields[name] for alias, name in ALIASES.items() if name in fields}}
+
+
+class ProjectStore:
+    """Institutes, branches, instructors, courses and posts in one SQLite file, safe to share between threads."""
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        self._db.executescript(_SCHEMA)
+        try:
+            self._db.execute("CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5(kind UNINDEXED, title, body)")
+            self.full_text = True
+        except sqlite3.OperationalError:  # SQLite built without FTS5
+            self.full_text = False
+        self._db.commit()
+
+    # --- Saving ---
+
+    def _upsert(self, table, key, fields, **columns):
+        """Insert or merge the record of ``table`` whose unique columns are ``key`` (a dict); returns its id."""
+        where = " AND ".join(f"{name} = ?" for name in key)
+        row = self._db.execute(f"SELECT id, fields FROM {table} WHERE {where}", list(key.values())).fetchone()
+        if row is not None:
+            fields = {**json.loads(row[1]), **fields}
+        columns.update(fields=_dumps(fields), updated_at=time.time())
+        names = [*key, *columns]
+        self._db.execute(
+            f"INSERT INTO {table} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))}) "
+            f"ON CONFLICT({', '.join(key)}) DO UPDATE SET {', '.join(f'{n} = excluded.{n}' for n in columns)}",
+            [*key.values(), *columns.values()],
+        )
+        if row is not None:
+            return row[0]
+        return self._db.execute(f"SELECT id FROM {table} WHERE {where}", list(key.values())).fetchone()[0]
+
+    def _index(self, kind, record_id):
+        if not self.full_text:
+            return
+        table = {"course": "courses", "post": "posts"}[kind]
+        fields = json.loads(self._db.execute(f"SELECT fields FROM {table} WHERE id = ?", (record_id,)).fetchone()[0])
+        title = fields.get("course_name") or fields.get("headline") or ""
+        body = " ".join(str(fields.get(key) or "") for key in _SEARCH_COLUMNS if key not in ("course_name", "headline"))
+        faqs = fields.get("faqs")
+        if isinstance(faqs, list):  # (question, answer) pairs, but index whatever a row holds
+            body += " " + " ".join(" ".join(map(str, faq)) if isinstance(faq, (list, tuple)) else str(faq) for faq in faqs)
+        rowid = record_id * 2 + (kind == "post")  # courses and posts share the index
+        self._db.execute("INSERT OR REPLACE INTO search (rowid, kind, title, body) VALUES (?, ?, ?, ?)",
+                         (rowid, kind, title, body))
+
+    def save_institute(self, fields, branches=None):
+        """Save the institute fields (``inst_*``) and, when given, replace its branches; returns its id."""
+        fields = {key: value for key, value in _canonical(fields).items() if key in INSTITUTE_FIELDS}
+        name = fields.get("inst_name") or fields.get("inst_url")
+        if not name:
+            raise ValueError("an institute needs a name or URL")
+        with self._lock, self._db:
+            institute_id = self._save_institute(fields, branches)
+        return institute_id
+
+    def _save_institute(self, fields, branches):
+        slug = slugify(fields.get("inst_name")) or _url_slug(fields.get("inst_url"))
+        institute_id = self._upsert("institutes", {"slug": slug}, fields, name=fields.get("inst_name"), url=fields.get("inst_url"))
+        if branches is not None:
+            self._db.execute("DELETE FROM branches WHERE institute_id = ?", (institute_id,))
+            self._db.executemany(
+                "INSERT INTO branches (institute_id, position, fields) VALUES (?, ?, ?)",
+                [(institute_id, position, _dumps({key: branch.get(key, "") for key in BRANCH_FIELDS}))
+                 for position, branch in enumerate(branches)],
+            )
+        return institute_id
+
+    def save_course(self, fields, branches=None):
+        """Save a course form's fields, split into institute, instructor, branches and course; returns the course id."""
+        fields = _canonical(fields)
+        if branches is None and "branches" in fields:
+            branches = fields["branches"]
+        institute = {key: value for key, value in fields.items() if key in INSTITUTE_FIELDS}
+        instructor = {key: value for key, value in fields.items() if key in INSTRUCTOR_FIELDS}
+        course = {key: value for key, value in fields.items()
+                  if key not in INSTITUTE_FIELDS and key not in INSTRUCTOR_FIELDS and key != "branches"}
+        code = str(course.get("course_code") or "").strip()
+        url = str(course.get("course_url") or "").strip()
+        if not (code or course.get("course_name")):
+            raise ValueError("a course needs a name or code")
+        # Only what the form has: the FAQ app has no course code or instructor, and must not unset them
+        columns = {"name": course.get("course_name"), **({"code": code} if code else {}), **({"url": url} if url else {})}
+        with self._lock, self._db:
+            if institute.get("inst_name") or institute.get("inst_url"):
+                columns["institute_id"] = self._save_institute(institute, branches)
+            if instructor.get("instructor_name"):
+                columns["instructor_id"] = self._upsert("instructors", {"slug": slugify(instructor["instructor_name"])},
+                                                        instructor, name=instructor["instructor_name"])
+            course_id = self._upsert("courses", {"slug": self._course_slug(code, url, course.get("course_name"))},
+                                     course, **columns)
+            self._index("course", course_id)
+        return course_id
+
+    def _course_slug(self, code, url, name):
+        """The slug of the stored course with that code, else URL, else name; a new one from the code or name."""
+        for column, value in (("code", code), ("url", url), ("slug", slugify(name))):
+            row = self._db.execute(f"SELECT slug FROM courses WHERE {column} = ?", (value,)).fetchone() if value else None
+            if row is not None:
+                return row[0]
+        return slugify(code) or slugify(name)
+
+    def save_post(self, kind, fields):
+        """Save a blog form's fields for the ``kind`` generator (``article`` or ``blog-posting``); returns the post id."""
+        if kind not in POST_KINDS:
+            raise ValueError(f"unknown post kind {kind!r}")
+        url = fields.get("blog_url")
+        slug = _url_slug(url) or slugify(fields.get("headline"))
+        if not slug:
+            raise ValueError("a post needs a URL or headline")
+        with self._lock, self._db:
+            post_id = self._upsert("posts", {"kind": kind, "slug": slug}, dict(fields), headline=fields.get("headline"),
+                                   url=url or None)
+            self._index("post", post_id)
+        return post_id
+
+    def delete(self, kind, record_id):
+        """Remove a course or post (its institute and instructor stay)."""
+        table = {"course": "courses", "post": "posts"}[kind]
+        with self._lock, self._db:
+            self._db.execute(f"DELETE FROM {table} WHERE id = ?", (record_id,))
+            if self.full_text:
+                self._db.execute("DELETE FROM search WHERE rowid = ?", (record_id * 2 + (kind == "post"),))
+
+    # --- Lookup ---
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def courses(self, institute_id=None):
+        """``(id, code, name, url)`` of the stored courses, by name; only ``institute_id``'s when given."""
+        where, params = ("WHERE institute_id = ?", (institute_id,)) if institute_id is not None else ("", ())
+        return self._query(f"SELECT id, code, name, url FROM courses {where} ORDER BY name COLLATE NOCASE", params)
+
+    def posts(self, kind=None):
+        """``(id, kind, headline, url)`` of the stored posts, most recently saved first."""
+        where, params = ("WHERE kind = ?", (kind,)) if kind else ("", ())
+        return self._query(f"SELECT id, kind, headline, url FROM posts {where} ORDER BY updated_at DESC", params)
+
+    def institutes(self):
+        """``(id, name, url)`` of the stored institutes, by name."""
+        return self._query("SELECT id, name, url FROM institutes ORDER BY name COLLATE NOCASE")
+
+    def find_course(self, code=None, url=None, slug=None):
+        """Id of the course with that code, URL or slug (all indexed), or ``None``."""
+        for column, value in (("code", code), ("url", url), ("slug", slug)):
+            if value:
+                rows = self._query(f"SELECT id FROM courses WHERE {column} = ? LIMIT 1", (value,))
+                if rows:
+                    return rows[0][0]
+        return None
+
+    def find_post(self, url):
+        rows = self._query("SELECT id FROM posts WHERE url = ? LIMIT 1", (url,))
+        return rows[0][0] if rows else None
+
+    def search(self, text, kind=None, limit=20):
+        """``(kind, id, title)`` of the courses and posts matching ``text``, best first; ``kind`` is "course" or "post"."""
+        words = _WORD.findall(str(text).lower())
+        if not words:
+            return []
+        if self.full_text:
+            query = " ".join(f'"{word}"*' for word in words)  # every word, as a prefix
+            sql = "SELECT kind, rowid / 2, title FROM search WHERE search MATCH ?"
+            params = [query]
+            if kind:
+                sql += " AND kind = ?"
+                params.append(kind)
+            return [tuple(row) for row in self._query(sql + " ORDER BY rank LIMIT ?", (*params, limit))]
+        results = []
+        for record_kind, table, title in (("course", "courses", "name"), ("post", "posts", "headline")):
+            if kind and kind != record_kind:
+                continue
+            condition = " AND ".join(["(fields LIKE ? OR slug LIKE ?)"] * len(words))
+            params = [pattern for word in words for pattern in (f"%{word}%", f"%{word}%")]
+            rows = self._query(f"SELECT id, {title} FROM {table} WHERE {condition} LIMIT ?", (*params, limit))
+            results += [(record_kind, record_id, name) for record_id, name in rows]
+        return results[:limit]
+
+    # --- Fields for the generators ---
+
+    def institute_fields(self, institute_id):
+        """The institute's fields plus ``branches``."""
+        rows = self._query("SELECT fields FROM institutes WHERE id = ?", (institute_id,))
+        if not rows:
+            raise KeyError(institute_id)
+        branches = self._query("SELECT fields FROM branches WHERE institute_id = ? ORDER BY position", (institute_id,))
+        return _with_aliases({**json.loads(rows[0][0]), "branches": [json.loads(b[0]) for b in branches]})
+
+    def course_fields(self, course_id):
+        """Everything a course form had: the course's fields merged with its institute, branches and instructor."""
+        rows = self._query("SELECT slug, institute_id, instructor_id, fields FROM courses WHERE id = ?", (course_id,))
+        if not rows:
+            raise KeyError(course_id)
+        slug, institute_id, instructor_id, course = rows[0]
+        fields = {"slug": slug}
+        if institute_id is not None:
+            fields.update(self.institute_fields(institute_id))
+        if instructor_id is not None:
+            fields.update(json.loads(self._query("SELECT fields FROM instructors WHERE id = ?", (instructor_id,))[0][0]))
+        fields.update(json.loads(course))
+        return _with_aliases(fields)
+
+    def post_fields(self, post_id):
+        rows = self._query("SELECT slug, fields FROM posts WHERE id = ?", (post_id,))
+        if not rows:
+            raise KeyError(post_id)
+        return {"slug": rows[0][0], **json.loads(rows[0][1])}
+
+    def rows(self, kind):
+        """Fields of every stored course (course kinds) or post of ``kind``, as CLI input rows."""
+        if kind in COURSE_KINDS:
+            for course_id, *_ in self.courses():
+                yield self.course_fields(course_id)
+        elif kind in POST_KINDS:
+            for post_id, *_ in self.posts(kind):
+                yield self.post_fields(post_id)
+        else:
+            raise ValueError(f"the project store has no rows for {kind!r}")
+
+    def __len__(self):
+        with self._lock:
+            return sum(self._db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in ("courses", "posts"))
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def default_store():
+    """Return the process-wide ``ProjectStore`` at ``DEFAULT_STORE_PATH``."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = ProjectStore()
+        return _default_store
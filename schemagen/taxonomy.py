@@ -0,0 +1,132 @@
+"""Audience, topic and course vocabulary matched against page text in one pass.
+
+``taxonomy.json`` (or the file named by ``SCHEMAGEN_TAXONOMY``) maps, per
+kind (``audience``, ``topics``, ``courses``), each label to the terms that
+mention it::
+
+    {"audience": {"Analysts": ["analyst", "data analysts", ...]}, ...}
+
+All terms of all kinds (and the labels themselves) are compiled into a
+single regular expression shaped like a trie — alternatives share their
+common prefixes — with word boundaries on both ends, so the text is scanned
+once whatever the size of the vocabulary, and at each position only the
+branches that can still match are tried. Spaces in a term match any run of
+whitespace. Like the site config, the file is compiled once and reused
+until it changes on disk, and ``version`` fingerprints it so stored schema
+is regenerated after an edit.
+"""
+
+import json
+import os
+import re
+import threading
+from collections import Counter
+
+from schemagen.manifest import fingerprint
+
+DEFAULT_TAXONOMY = os.environ.get(
+    "SCHEMAGEN_TAXONOMY", os.path.join(os.path.dirname(os.path.abspath(__file__)), "taxonomy.json")
+)
+
+
+def normalize_term(term):
+    return " ".join(term.lower().split())
+
+
+def _trie_pattern(node):
+    """Regex source for a character trie (``""`` marks the end of a term)."""
+    branches = [(r"\s+" if char == " " else re.escape(char)) + _trie_pattern(child)
+                for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        # Optional tail: greedy, so the longest term at a position wins, and the shorter one is
+        # still found when the longer one is not followed by a word boundary.
+        return f"(?:{body})?"
+    return body
+
+
+class TermMatcher:
+    """Count occurrences of many terms in a text with a single compiled regex.
+
+    ``terms`` maps each term to the values a match counts towards; matching
+    is case-insensitive and on whole words.
+    """
+
+    def __init__(self, terms):
+        self.terms = {}
+        for term, values in terms.items():
+            self.terms.setdefault(normalize_term(term), []).extend(values)
+        trie = {}
+        for term in self.terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        self.pattern = re.compile(r"(?<!\w)" + _trie_pattern(trie) + r"(?!\w)") if trie else None
+
+    def count(self, text):
+        """``Counter`` of values over every term occurrence in ``text``."""
+        counts = Counter()
+        if self.pattern is None:
+            return counts
+        found = Counter(self.pattern.findall(text.lower()))
+        for match, n in found.items():
+            for value in self.terms[normalize_term(match)]:
+                counts[value] += n
+        return counts
+
+
+class Taxonomy:
+    """The parsed vocabulary: ``kinds`` (kind -> labels in file order), ``matcher`` and ``version``."""
+
+    def __init__(self, config, path=None):
+        self.path = path
+        self.kinds = {}
+        terms = {}
+        for kind, labels in config.items():
+            if not isinstance(labels, dict):
+                raise ValueError(f"{path or 'taxonomy'}: {kind!r} must map labels to lists of terms")
+            self.kinds[kind] = list(labels)
+            for label, label_terms in labels.items():
+                for term in [label, *label_terms]:
+                    terms.setdefault(term, []).append((kind, label))
+        self.matcher = TermMatcher({term: list(dict.fromkeys(values)) for term, values in terms.items()})
+        self._order = {(kind, label): i for kind, labels in self.kinds.items() for i, label in enumerate(labels)}
+        self.version = fingerprint(config)[:12]
+
+    def match(self, text):
+        """``(label, mentions)`` per kind for the labels mentioned in ``text``, most mentioned first."""
+        return self.rank((kind, label, n) for (kind, label), n in self.matcher.count(text).items())
+
+    def rank(self, mentions):
+        """Group ``(kind, label, mentions)`` triples by kind, most mentioned first (ties in file order)."""
+        found = {kind: [] for kind in self.kinds}
+        for kind, label, n in sorted(mentions, key=lambda m: (-m[2], self._order.get((m[0], m[1]), len(self._order)))):
+            found.setdefault(kind, []).append((label, n))
+        return found
+
+    def canonical(self, name):
+        """The label ``name`` refers to (e.g. ``"power bi"`` -> ``"Power BI"``), or ``None``."""
+        values = self.matcher.terms.get(normalize_term(name))
+        return values[0][1] if values else None
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f), path)
+
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+def load_taxonomy(path=DEFAULT_TAXONOMY):
+    """Return the ``Taxonomy`` for ``path``, compiled again only when the file has changed."""
+    mtime = os.stat(path).st_mtime_ns
+    with _lock:
+        hit = _loaded.get(path)
+        if hit is None or hit[0] != mtime:
+            hit = _loaded[path] = (mtime, Taxonomy.load(path))
+        return hit[1]
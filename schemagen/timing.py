@@ -0,0 +1,192 @@
+"""Stage timers and counters for the blog schema pipeline, with optional profiler capture.
+
+    timings = Timings()
+    with timings.stage("parse"):
+        soup = parse_html(html)
+    timings.count("nodes", len(soup.find_all(True)))
+    timings.as_dict()   # {"stages": {"parse": 0.0123}, "counts": {"nodes": 1530}}
+
+A generation records one ``Timings``: fetch, parse, main content, text,
+term counting, taxonomy, FAQs, schema build and serialisation, plus byte,
+node and term counts. ``as_dict`` is plain JSON, so timings recorded in a
+worker process travel back with the page facts. ``StageStats`` sums many
+runs for the bulk UI, the ``--timings`` summary of the command line and the
+service's ``/metrics`` endpoint (Prometheus text format). ``profiled``
+wraps a block in cProfile or, when installed, pyinstrument.
+"""
+
+import io
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+# Display order; stages not listed here sort after them
+STAGES = ("fetch", "parse", "meta", "content", "text", "terms", "taxonomy", "faq", "keywords", "build", "serialize",
+          "validate")
+PROFILERS = ("cprofile", "pyinstrument")
+
+
+def _stage_order(name):
+    return (STAGES.index(name), name) if name in STAGES else (len(STAGES), name)
+
+
+class Timings:
+    """Wall-clock seconds per stage and counters for one run."""
+
+    __slots__ = ("stages", "counts")
+
+    def __init__(self, data=None):
+        self.stages = {}
+        self.counts = {}
+        if data:
+            self.update(data)
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def count(self, name, n):
+        self.counts[name] = self.counts.get(name, 0) + n
+
+    def update(self, data):
+        """Merge an ``as_dict()`` (e.g. from a worker process) into these timings."""
+        for name, seconds in data.get("stages", {}).items():
+            self.add(name, seconds)
+        for name, n in data.get("counts", {}).items():
+            self.count(name, n)
+
+    @property
+    def total(self):
+        return sum(self.stages.values())
+
+    def as_dict(self):
+        return {"stages": dict(sorted(self.stages.items(), key=lambda item: _stage_order(item[0]))),
+                "counts": dict(self.counts)}
+
+    def rows(self):
+        """``(stage, milliseconds, share of total)`` in pipeline order, for display."""
+        total = self.total or 1.0
+        return [(name, 1000 * seconds, seconds / total) for name, seconds in self.as_dict()["stages"].items()]
+
+    def to_json(self, **extra):
+        """One structured log line: ``extra`` fields (e.g. ``url``) plus stages in ms and counts."""
+        stages = {name: round(1000 * seconds, 3) for name, seconds in self.as_dict()["stages"].items()}
+        return json.dumps({**extra, "total_ms": round(1000 * self.total, 3), "stages_ms": stages,
+                           "counts": self.counts}, ensure_ascii=False)
+
+
+class StageStats:
+    """Totals over many runs: per stage the number of runs, summed and maximum seconds; summed counters."""
+
+    def __init__(self):
+        self.runs = 0
+        self.stages = {}  # name -> [count, seconds, max seconds]
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def add(self, timings):
+        """Add a ``Timings`` or its ``as_dict()``."""
+        data = timings.as_dict() if isinstance(timings, Timings) else timings
+        with self._lock:
+            self.runs += 1
+            for name, seconds in data.get("stages", {}).items():
+                entry = self.stages.setdefault(name, [0, 0.0, 0.0])
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] = max(entry[2], seconds)
+            for name, n in data.get("counts", {}).items():
+                self.counts[name] = self.counts.get(name, 0) + n
+
+    def rows(self):
+        """``(stage, runs, total s, mean ms, max ms, share of total)`` in pipeline order."""
+        with self._lock:
+            stages = sorted(self.stages.items(), key=lambda item: _stage_order(item[0]))
+        total = sum(entry[1] for _, entry in stages) or 1.0
+        return [(name, n, seconds, 1000 * seconds / n, 1000 * peak, seconds / total)
+                for name, (n, seconds, peak) in stages]
+
+    def format(self):
+        lines = [f"{self.runs} runs",
+                 f"  {'stage':<10}{'runs':>7}{'total s':>10}{'mean ms':>10}{'max ms':>10}{'share':>8}"]
+        for name, n, seconds, mean, peak, share in self.rows():
+            lines.append(f"  {name:<10}{n:>7}{seconds:>10.2f}{mean:>10.1f}{peak:>10.1f}{share:>8.0%}")
+        if self.counts:
+            lines.append("  " + ", ".join(f"{name}={n}" for name, n in sorted(self.counts.items())))
+        return "\n".join(lines)
+
+    def to_prometheus(self, prefix="schemagen"):
+        """The totals in the Prometheus text exposition format (a summary per stage, a counter per count)."""
+        lines = [f"# HELP {prefix}_stage_seconds Time spent per blog pipeline stage.",
+                 f"# TYPE {prefix}_stage_seconds summary"]
+        for name, n, seconds, _, _, _ in self.rows():
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {seconds:.6f}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {n}')
+        lines += [f"# HELP {prefix}_pipeline_total Bytes, nodes and items processed by the blog pipeline.",
+                  f"# TYPE {prefix}_pipeline_total counter"]
+        with self._lock:
+            counts = sorted(self.counts.items())
+        lines += [f'{prefix}_pipeline_total{{count="{name}"}} {n}' for name, n in counts]
+        lines += [f"# HELP {prefix}_pipeline_runs_total Blog pipeline runs recorded.",
+                  f"# TYPE {prefix}_pipeline_runs_total counter",
+                  f"{prefix}_pipeline_runs_total {self.runs}"]
+        return "\n".join(lines) + "\n"
+
+
+class Profile:
+    """What ``profiled`` captured: ``text`` is the report, filled in when the block exits."""
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.text = ""
+
+
+@contextmanager
+def profiled(profiler="cprofile", path=None, limit=30):
+    """Profile the block with ``profiler`` (one of ``PROFILERS``); yields a ``Profile``.
+
+    cProfile reports the ``limit`` slowest functions by cumulative time and
+    writes a ``pstats`` dump to ``path`` if given; pyinstrument (an optional
+    dependency) renders its call tree, as HTML when ``path`` ends in ``.html``.
+    """
+    profile = Profile(profiler)
+    if profiler == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            raise RuntimeError("pyinstrument is not installed; pip install pyinstrument or use cProfile") from None
+        sampler = Profiler()
+        sampler.start()
+        try:
+            yield profile
+        finally:
+            sampler.stop()
+            profile.text = sampler.output_text(unicode=True)
+            if path:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(sampler.output_html() if path.endswith(".html") else profile.text)
+        return
+    if profiler != "cprofile":
+        raise ValueError(f"unknown profiler {profiler!r}; expected one of {', '.join(PROFILERS)}")
+
+    import cProfile
+    import pstats
+
+    sampler = cProfile.Profile()
+    sampler.enable()
+    try:
+        yield profile
+    finally:
+        sampler.disable()
+        out = io.StringIO()
+        pstats.Stats(sampler, stream=out).sort_stats("cumulative").print_stats(limit)
+        profile.text = out.getvalue()
+        if path:
+            sampler.dump_stats(path)
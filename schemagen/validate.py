@@ -0,0 +1,265 @@
+"""Check generated JSON-LD against Google's rich-result requirements.
+
+    issues = validate(schema)
+    report = validate_all(schemas)   # bulk: counts per problem
+    print(report.format())
+
+``RULES`` lists, per ``@type``, the properties Google requires (errors) and
+recommends (warnings) for Course, BlogPosting / Article, FAQPage and
+Organization results and the nodes inside them; ``a|b`` means either will
+do. Independently of the type, values are checked by property name:
+absolute ``http(s)`` URLs, ISO 8601 dates and durations, numeric prices and
+measurements, three-letter currency codes, and no ``null`` or empty values.
+
+The rules are compiled once into a per-type table of checker functions, so
+validating a document is a single walk over its nodes with dictionary
+lookups — fast enough to check every document of a bulk run.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+ERROR = "error"
+WARNING = "warning"
+
+_ARTICLE = {"required": ("headline",), "recommended": ("image", "datePublished", "dateModified", "author")}
+_ORGANIZATION = {"required": ("name",), "recommended": ("url", "logo")}
+
+RULES = {
+    "Course": {"required": ("name", "description"), "recommended": ("provider", "hasCourseInstance", "offers")},
+    "CourseInstance": {"required": ("courseMode",), "recommended": ("courseWorkload|courseSchedule|duration",)},
+    "Offer": {"required": ("price", "priceCurrency"), "recommended": ("availability",)},
+    "BlogPosting": _ARTICLE,
+    "Article": _ARTICLE,
+    "EducationalArticle": _ARTICLE,
+    "NewsArticle": _ARTICLE,
+    "FAQPage": {"required": ("mainEntity",)},
+    "Question": {"required": ("name", "acceptedAnswer")},
+    "Answer": {"required": ("text",)},
+    "Organization": _ORGANIZATION,
+    "EducationalOrganization": _ORGANIZATION,
+    "LocalBusiness": {"required": ("name", "address"), "recommended": ("telephone", "url", "geo")},
+    "Person": {"required": ("name",)},
+    "ImageObject": {"required": ("url",)},
+    "VideoObject": {"required": ("name", "thumbnailUrl", "uploadDate")},
+    "PostalAddress": {"recommended": ("streetAddress", "addressLocality", "addressCountry")},
+    "AggregateRating": {"required": ("ratingValue",), "recommended": ("reviewCount|ratingCount",)},
+}
+
+URL_PROPERTIES = ("url", "logo", "image", "sameAs", "contentUrl", "embedUrl", "thumbnailUrl", "hasMap", "license",
+                  "target", "relatedLink", "availability")
+DATE_PROPERTIES = ("datePublished", "dateModified", "startDate", "endDate", "uploadDate", "validFrom")
+DURATION_PROPERTIES = ("timeRequired", "courseWorkload", "duration")
+NUMBER_PROPERTIES = ("price", "ratingValue", "reviewCount", "ratingCount", "width", "height", "latitude", "longitude",
+                     "wordCount", "userInteractionCount")
+MAX_HEADLINE = 110
+
+_URL = re.compile(r"https?://[^\s/$.?#][^\s]*\Z", re.I)
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?)?\Z")
+_DURATION = re.compile(r"P(?!\Z)(\d+(\.\d+)?Y)?(\d+(\.\d+)?M)?(\d+(\.\d+)?W)?(\d+(\.\d+)?D)?"
+                       r"(T(?=\d)(\d+(\.\d+)?H)?(\d+(\.\d+)?M)?(\d+(\.\d+)?S)?)?\Z")
+_NUMBER = re.compile(r"-?\d+(\.\d+)?\Z")
+_CURRENCY = re.compile(r"[A-Z]{3}\Z")
+
+
+@dataclass(slots=True)
+class Issue:
+    severity: str  # ERROR or WARNING
+    path: str  # e.g. "@graph[0].publisher.logo"
+    type: str  # @type of the node the property belongs to
+    property: str
+    message: str  # generic, so equal problems on different pages count together
+    value: Any = None
+
+    def __str__(self):
+        shown = "" if self.value is None else f" (got {self.value!r:.60})"
+        return f"{self.severity}: {self.path}: {self.message}{shown}"
+
+
+# --- Value checkers: return a message, or None when the value is fine ---
+def _check_url(value):
+    if isinstance(value, str) and not _URL.match(value):
+        return "is not an absolute http(s) URL"
+
+
+def _check_date(value):
+    if isinstance(value, str) and not _DATE.match(value):
+        return "is not an ISO 8601 date"
+
+
+def _check_duration(value):
+    if isinstance(value, str) and not _DURATION.match(value):
+        return "is not an ISO 8601 duration (e.g. P3M, PT40H)"
+
+
+def _check_number(value):
+    if isinstance(value, bool) or not (isinstance(value, (int, float)) or _NUMBER.match(str(value))):
+        return "is not a number"
+
+
+def _check_currency(value):
+    if not (isinstance(value, str) and _CURRENCY.match(value)):
+        return "is not a three-letter ISO 4217 currency code"
+
+
+def _check_headline(value):
+    if isinstance(value, str) and len(value) > MAX_HEADLINE:
+        return f"is longer than {MAX_HEADLINE} characters"
+
+
+_VALUE_CHECKS = {}
+for _names, _check in ((URL_PROPERTIES, _check_url), (DATE_PROPERTIES, _check_date),
+                       (DURATION_PROPERTIES, _check_duration), (NUMBER_PROPERTIES, _check_number),
+                       (("priceCurrency",), _check_currency), (("headline",), _check_headline)):
+    for _name in _names:
+        _VALUE_CHECKS[_name] = _check
+
+
+@lru_cache(maxsize=None)
+def _compile(types):
+    """Checks for a node of ``types`` (a tuple): ``(type name, required, recommended, names)``.
+
+    ``required`` / ``recommended`` are tuples of ``(names, message)``, merged over all the types;
+    ``names`` are the properties they cover, which are not reported again as merely empty.
+    """
+    required, recommended = {}, {}
+    for name in types:
+        rule = RULES.get(name, {})
+        for alt in rule.get("required", ()):
+            required[tuple(alt.split("|"))] = f"missing required {alt.replace('|', ' or ')}"
+        for alt in rule.get("recommended", ()):
+            recommended[tuple(alt.split("|"))] = f"missing recommended {alt.replace('|', ' or ')}"
+    names = frozenset(name for alternatives in [*required, *recommended] for name in alternatives)
+    return "/".join(types) or "?", tuple(required.items()), tuple(recommended.items()), names
+
+
+def _missing(node, alternatives):
+    for name in alternatives:
+        value = node.get(name)
+        if not (value is None or value == "" or value == [] or value == {}):
+            return False
+    return True
+
+
+def _walk(node, path, issues):
+    types = node.get("@type")
+    if types is None:
+        if "@id" in node and len(node) == 1:
+            return  # a reference to a node defined elsewhere
+        types = ()
+    elif type(types) is str:
+        types = (types,)
+    else:
+        types = tuple(types)
+    type_name, required, recommended, covered = _compile(types)
+
+    for alternatives, message in required:
+        if _missing(node, alternatives):
+            issues.append(Issue(ERROR, path, type_name, alternatives[0], message))
+    for alternatives, message in recommended:
+        if _missing(node, alternatives):
+            issues.append(Issue(WARNING, path, type_name, alternatives[0], message))
+
+    for key, value in node.items():
+        if key[0] == "@":
+            if key == "@graph":
+                _walk_value(value, f"{path}.@graph" if path else "@graph", issues)
+            continue
+        kind = type(value)
+        if kind is str:
+            if not value:
+                if key not in covered:
+                    issues.append(Issue(WARNING, _join(path, key), type_name, key, "is empty"))
+                continue
+        elif value is None:
+            issues.append(Issue(ERROR, _join(path, key), type_name, key, "is null"))
+            continue
+        elif kind is dict:
+            _walk(value, _join(path, key), issues)
+            continue
+        elif kind is list:
+            if not value:
+                if key not in covered:
+                    issues.append(Issue(WARNING, _join(path, key), type_name, key, "is empty"))
+                continue
+        check = _VALUE_CHECKS.get(key)
+        if check is not None:
+            for item in value if kind is list else (value,):
+                if type(item) is not dict:
+                    message = check(item)
+                    if message:
+                        issues.append(Issue(ERROR, _join(path, key), type_name, key, message, item))
+        if kind is list:
+            _walk_value(value, _join(path, key), issues)
+
+
+def _join(path, key):
+    return f"{path}.{key}" if path else key
+
+
+def _walk_value(value, path, issues):
+    if isinstance(value, dict):
+        _walk(value, path, issues)
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            if isinstance(item, (dict, list)):
+                _walk_value(item, f"{path}[{i}]", issues)
+
+
+def validate(document):
+    """All problems in a JSON-LD document (a node, an ``@graph`` document or a list of documents)."""
+    issues = []
+    _walk_value(document, "", issues)
+    return issues
+
+
+class Report:
+    """Running totals over many documents, grouped by type, property and message."""
+
+    def __init__(self):
+        self.documents = 0
+        self.with_errors = 0
+        self.with_warnings = 0
+        self.counts = Counter()  # (severity, type, property, message) -> occurrences
+        self.examples = {}  # same key -> first document label it was seen in
+
+    def add(self, issues, label=None):
+        self.documents += 1
+        self.with_errors += any(issue.severity == ERROR for issue in issues)
+        self.with_warnings += any(issue.severity == WARNING for issue in issues)
+        for issue in issues:
+            key = (issue.severity, issue.type, issue.property, issue.message)
+            self.counts[key] += 1
+            if label is not None:
+                self.examples.setdefault(key, label)
+
+    @property
+    def errors(self):
+        return sum(n for key, n in self.counts.items() if key[0] == ERROR)
+
+    @property
+    def warnings(self):
+        return sum(n for key, n in self.counts.items() if key[0] == WARNING)
+
+    def format(self, limit=20):
+        lines = [f"{self.documents} documents: {self.with_errors} with errors ({self.errors} errors), "
+                 f"{self.with_warnings} with warnings ({self.warnings} warnings)"]
+        ranked = sorted(self.counts.items(), key=lambda item: (item[0][0] != ERROR, -item[1]))
+        for (severity, type_name, prop, message), n in ranked[:limit]:
+            example = self.examples.get((severity, type_name, prop, message))
+            lines.append(f"  {n:>7} {severity:<7} {type_name}.{prop} {message}" + (f"  e.g. {example}" if example else ""))
+        if len(ranked) > limit:
+            lines.append(f"  … {len(ranked) - limit} more")
+        return "\n".join(lines)
+
+
+def validate_all(documents, labels=None):
+    """``Report`` over an iterable of documents; ``labels`` (e.g. URLs) name examples in the summary."""
+    report = Report()
+    labels = iter(labels) if labels is not None else None
+    for document in documents:
+        report.add(validate(document), next(labels) if labels is not None else None)
+    return report
@@ -0,0 +1,34 @@
+from datetime import date
+
+import pytest
+
+st = pytest.importorskip("streamlit")
+
+import app_cache  # noqa: E402
+
+COURSE = dict(inst_name="Future Vision Computers", inst_url="https://futurevisioncomputers.com",
+              course_name="Advanced Excel", course_fee=6000)
+
+
+class Day(date):
+    current = date(2026, 10, 18)
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+def valid_from(schema):
+    return schema["hasCourseInstance"]["offers"]["validFrom"]
+
+
+def test_form_schema_is_cached_per_day(monkeypatch):
+    monkeypatch.setattr(app_cache, "date", Day)
+    monkeypatch.setattr("schemagen.course.date", Day)
+    st.cache_data.clear()
+
+    first, _ = app_cache.form_schema("course", **COURSE)
+    monkeypatch.setattr(Day, "current", date(2026, 10, 19))  # past midnight, same form values
+    second, _ = app_cache.form_schema("course", **COURSE)
+
+    assert (valid_from(first), valid_from(second)) == ("2026-10-18", "2026-10-19")
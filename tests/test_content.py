@@ -0,0 +1,46 @@
+import pytest
+
+from schemagen import content
+from schemagen.content import learned_selectors, main_content
+from schemagen.extract import parse_html
+
+SENTENCE = "Pivot tables summarise sales by region, month and product without a single formula. "
+
+
+@pytest.fixture(autouse=True)
+def fresh_learned(monkeypatch):
+    monkeypatch.setattr(content, "_learned", content.OrderedDict())
+
+
+def test_selector_is_learned_for_the_host(fixture_html):
+    node = main_content(parse_html(fixture_html("faq_headings.html")), host="blog.example")
+
+    assert node.get("class") == ["entry-content"]
+    assert learned_selectors() == {"blog.example": "div.entry-content"}
+
+
+def test_body_is_never_learned():
+    html = f"<html><body><p>{SENTENCE * 5}</p><p>{SENTENCE * 5}</p></body></html>"
+    node = main_content(parse_html(html, narrow=False), host="bare.example")
+
+    assert node.name == "body"
+    assert learned_selectors() == {}
+
+
+def test_link_heavy_element_is_not_learned():
+    links = "".join(f'<a href="/p{i}">{SENTENCE}</a>' for i in range(6))
+    html = f'<html><body><div class="listing"><p>{links}</p><p>{links}</p></div></body></html>'
+    main_content(parse_html(html, narrow=False), host="links.example")
+
+    assert "links.example" not in learned_selectors()
+
+
+def test_learned_hosts_are_bounded(monkeypatch, fixture_html):
+    monkeypatch.setattr(content, "MAX_LEARNED_HOSTS", 3)
+    html = fixture_html("faq_headings.html")
+    for i in range(5):
+        main_content(parse_html(html), host=f"site{i}.example")
+    main_content(parse_html(html), host="site2.example")  # recently used: kept
+    main_content(parse_html(html), host="site5.example")
+
+    assert list(learned_selectors()) == ["site4.example", "site2.example", "site5.example"]
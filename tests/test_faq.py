@@ -0,0 +1,92 @@
+from schemagen.content import main_content
+from schemagen.extract import parse_html
+from schemagen.faq import MAX_FAQS, extract_faqs, is_question
+
+
+def faqs_of(html, **kwargs):
+    soup = parse_html(html)
+    return extract_faqs(soup, content=main_content(soup), **kwargs)
+
+
+def questions(faqs):
+    return [question for question, _ in faqs]
+
+
+def test_jsonld_answers_win_over_page_text(fixture_html):
+    faqs = faqs_of(fixture_html("faq_jsonld.html"))
+
+    assert faqs == [
+        ("What is a pivot table?", "A table that summarises rows of data by category."),
+        ("Can I refresh a pivot table automatically?", "Yes, set it to refresh when the file opens."),
+        ("Do pivot tables change my source data?", "No, they only read it."),
+    ]
+
+
+def test_microdata_and_details_before_headings(fixture_html):
+    faqs = faqs_of(fixture_html("faq_microdata.html"))
+
+    assert faqs == [
+        ("Do I need to know Excel first?", "Basic Excel helps, but the course starts from scratch."),
+        ("How long is the course?", "Six weeks, three evenings a week."),
+        ("Is there a certificate?", "Yes, after the final project."),
+    ]
+
+
+def test_sidebar_questions_only_outside_the_body(fixture_html):
+    soup = parse_html(fixture_html("faq_microdata.html"))
+
+    assert "Why choose us?" in questions(extract_faqs(soup))
+    assert "Why choose us?" not in questions(extract_faqs(soup, content=main_content(soup)))
+
+
+def test_heading_questions_pair_with_the_next_answer(fixture_html):
+    faqs = faqs_of(fixture_html("faq_headings.html"))
+
+    assert faqs == [
+        ("Which GST rate applies to training services?", "Most training services are taxed at 18%."),
+        # a stacked heading replaces the one above it instead of sharing its answer
+        ("How do I delete a ledger?", "Open Chart of Accounts, select the ledger and press Alt+D."),
+        ("Can I export reports to Excel?", "Yes, with Alt+E from any report."),
+        ("Q: Does Tally Prime work offline?", "It does; only remote access needs the internet."),
+    ]
+
+
+def test_duplicates_are_dropped_on_normalised_text():
+    html = ("<article><h3>What is VLOOKUP?</h3><p>A lookup function.</p>"
+            "<h3>  what is   vlookup </h3><p>Asked again.</p>"
+            "<h3>What is VLOOKUP:</h3><p>And again.</p></article>")
+
+    assert extract_faqs(parse_html(html)) == [("What is VLOOKUP?", "A lookup function.")]
+
+
+def test_capped_at_limit():
+    html = "<article>" + "".join(f"<h3>Question {i}?</h3><p>Answer {i}.</p>" for i in range(MAX_FAQS + 10)) + "</article>"
+    soup = parse_html(html)
+
+    assert len(extract_faqs(soup)) == MAX_FAQS
+    assert questions(extract_faqs(soup, limit=3)) == ["Question 0?", "Question 1?", "Question 2?"]
+
+
+def test_cap_keeps_structured_questions_first(fixture_html):
+    faqs = faqs_of(fixture_html("faq_jsonld.html"), limit=2)
+
+    assert questions(faqs) == ["What is a pivot table?", "Can I refresh a pivot table automatically?"]
+
+
+def test_is_question():
+    assert is_question("How do I freeze panes?")
+    assert is_question("Question 4 - Macros", heading=True)
+    assert not is_question("Did you know? Excel has 16,384 columns.", heading=False)
+    assert not is_question("x" * 300 + "?")
+
+
+def test_jsonld_after_the_article_survives_narrowing(fixture_html):
+    html = fixture_html("faq_jsonld_footer.html")
+
+    assert "Why choose us?" not in str(parse_html(html))  # the sidebar is still cut
+    assert faqs_of(html) == [
+        ("What is Excel?", "A spreadsheet program for rows and columns of data."),
+        ("Is Excel hard to learn?", "No, the basics take a few evenings."),
+    ]
+    assert faqs_of(html) == extract_faqs(parse_html(html, narrow=False),
+                                         content=main_content(parse_html(html, narrow=False)))
@@ -0,0 +1,51 @@
+from collections import Counter
+
+from schemagen import keywords
+from schemagen.blog import score_keywords
+from schemagen.keywords import CorpusStats
+
+
+def session(path, docs):
+    """Load the statistics at ``path``, count ``docs`` (``doc_id`` -> terms) and save them, as one run does."""
+    stats = CorpusStats(path)
+    for doc_id, doc_terms in docs.items():
+        stats.add(doc_id, doc_terms)
+    stats.save()
+    return stats
+
+
+def df(stats, term):
+    index = stats.vocab.get(term)
+    return 0 if index is None else int(stats.df[index])
+
+
+def test_frequencies_survive_save_and_reload(tmp_path):
+    path = str(tmp_path / "corpus_stats.json")
+    session(path, {"/a": ["excel", "vlookup"]})
+    session(path, {"/b": ["excel", "vlookup", "macros"]})
+    session(path, {"/c": ["excel"], "/a": ["excel", "vlookup"]})  # /a was counted by the first run
+
+    stats = CorpusStats(path)
+
+    assert stats.n_docs == 3
+    assert (df(stats, "excel"), df(stats, "vlookup"), df(stats, "macros")) == (3, 2, 1)
+
+
+def test_terms_past_the_cap_are_never_counted(tmp_path, monkeypatch):
+    monkeypatch.setattr(keywords, "MAX_TERMS", 2)
+    path = str(tmp_path / "corpus_stats.json")
+    session(path, {"/a": ["excel", "vlookup", "macros"]})
+    stats = session(path, {"/b": ["macros", "excel"]})
+
+    assert stats.terms == ["excel", "vlookup"]
+    assert (df(stats, "excel"), df(stats, "macros")) == (2, 0)
+    assert CorpusStats(path).idf([-1]) == stats.idf([stats.vocab.get("macros", -1)])
+
+
+def test_batch_is_added_before_scoring():
+    stats = CorpusStats()
+    pages = [(f"/post-{i}", {"term_counts": Counter({"excel": 1, f"topic{i}": 1})}) for i in range(3)]
+
+    assert score_keywords(pages, stats) == [[f"topic{i}", "excel"] for i in range(3)]
+    assert stats.n_docs == 3
+    assert score_keywords(pages[:1]) == [["excel", "topic0"]]
@@ -0,0 +1,136 @@
+import os
+
+import pytest
+
+from schemagen import crawl
+from schemagen.crawl import CHANGED, FAILED, SKIPPED, UNCHANGED, output_filename, refresh
+from schemagen.fetch import Page
+from schemagen.manifest import MANIFEST_NAME, Manifest
+
+SITE = "https://futurevisioncomputers.com/blog/"
+
+
+def post(title, body, footer="Future Vision Computers"):
+    return (f"<html><head><title>{title}</title><meta property='og:title' content='{title}'>"
+            "<meta property='article:published_time' content='2026-10-01T09:00:00+05:30'>"
+            "<meta property='article:modified_time' content='2026-10-01T09:00:00+05:30'></head><body>"
+            f"<article><div class='entry-content'><p>{body}</p></div></article>"
+            f"<footer>{footer}</footer></body></html>")
+
+
+class StubSite:
+    """A scheduler whose ``fetch`` serves ``pages`` (URL -> HTML, or an exception to raise) and counts requests."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+
+    def fetch(self, url, timeout=10, cache=None, stop_after_article=False):
+        self.requests.append(url)
+        page = self.pages[url]
+        if isinstance(page, Exception):
+            raise page
+        return Page(url, page, 200)
+
+
+@pytest.fixture
+def written(monkeypatch):
+    """Names of the output files written, per run."""
+    names = []
+    write = crawl.DirectorySink.write
+
+    def spy(self, name, obj):
+        names.append(name)
+        write(self, name, obj)
+
+    monkeypatch.setattr(crawl.DirectorySink, "write", spy)
+    return names
+
+
+def run(site, out_dir, written, lastmods=None):
+    written.clear()
+    results = refresh(list(site.pages), "Advanced Excel", str(out_dir), scheduler=site, lastmods=lastmods,
+                      processes=0, workers=2)
+    return {result.url: result.status for result in results}
+
+
+def url(slug):
+    return f"{SITE}{slug}/"
+
+
+TEXT = "Pivot tables summarise thousands of rows of sales data by region and month without formulas. " * 3
+
+
+def test_refresh_redoes_only_what_changed(tmp_path, written):
+    site = StubSite({
+        url("same"): post("Same", TEXT),
+        url("footer"): post("Footer", TEXT),
+        url("edited"): post("Edited", TEXT),
+        url("reworded"): post("Reworded", TEXT),
+        url("flaky"): post("Flaky", TEXT),
+        url("new"): ConnectionError("refused"),
+    })
+
+    assert run(site, tmp_path, written) == {url("same"): CHANGED, url("footer"): CHANGED, url("edited"): CHANGED,
+                                             url("reworded"): CHANGED, url("flaky"): CHANGED, url("new"): FAILED}
+    assert sorted(written) == sorted(output_filename(url(s)) for s in ("same", "footer", "edited", "reworded", "flaky"))
+
+    site.pages.update({
+        url("footer"): post("Footer", TEXT, footer="© 2026 Future Vision Computers"),  # outside the facts
+        url("edited"): post("Edited: Pivot Tables", TEXT),  # a new headline
+        url("reworded"): post("Reworded", TEXT + "Slicers filter them."),  # new facts, same JSON-LD
+        url("flaky"): TimeoutError("timed out"),
+        url("new"): post("New", TEXT),
+    })
+    assert run(site, tmp_path, written) == {url("same"): SKIPPED, url("footer"): SKIPPED, url("edited"): CHANGED,
+                                             url("reworded"): UNCHANGED, url("flaky"): FAILED, url("new"): CHANGED}
+    assert sorted(written) == sorted([output_filename(url("edited")), output_filename(url("new"))])
+
+    site.pages[url("flaky")] = post("Flaky", TEXT)  # back, and identical to what was written before it failed
+    statuses = run(site, tmp_path, written)
+
+    assert statuses[url("flaky")] == UNCHANGED
+    assert {statuses[url(s)] for s in ("same", "footer", "edited", "reworded", "new")} == {SKIPPED}
+    assert written == []
+    with Manifest(os.path.join(tmp_path, MANIFEST_NAME)) as manifest:
+        assert manifest.get(url("flaky"))["error"] is None
+        assert manifest.get(url("flaky"))["path"] == os.path.join(tmp_path, output_filename(url("flaky")))
+
+
+def test_failure_is_recorded_and_keeps_the_old_file(tmp_path, written):
+    site = StubSite({url("flaky"): post("Flaky", TEXT)})
+    run(site, tmp_path, written)
+    path = os.path.join(tmp_path, output_filename(url("flaky")))
+    with open(path, encoding="utf-8") as f:
+        before = f.read()
+
+    site.pages[url("flaky")] = TimeoutError("timed out")
+    assert run(site, tmp_path, written) == {url("flaky"): FAILED}
+
+    with Manifest(os.path.join(tmp_path, MANIFEST_NAME)) as manifest:
+        assert manifest.get(url("flaky"))["error"] == "TimeoutError: timed out"
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == before
+
+
+def test_unchanged_lastmod_is_not_fetched(tmp_path, written):
+    site = StubSite({url("same"): post("Same", TEXT), url("edited"): post("Edited", TEXT)})
+    run(site, tmp_path, written, lastmods={url("same"): "2026-10-01", url("edited"): "2026-10-01"})
+    site.requests.clear()
+
+    site.pages[url("edited")] = post("Edited: Pivot Tables", TEXT)
+    statuses = run(site, tmp_path, written, lastmods={url("same"): "2026-10-01", url("edited"): "2026-10-17"})
+
+    assert statuses == {url("same"): SKIPPED, url("edited"): CHANGED}
+    assert site.requests == [url("edited")]
+
+
+def test_new_category_regenerates_everything(tmp_path, written):
+    site = StubSite({url("same"): post("Same", TEXT)})
+    run(site, tmp_path, written)
+    written.clear()
+
+    results = list(refresh(list(site.pages), "Power BI", str(tmp_path), scheduler=site, processes=0))
+
+    assert [result.status for result in results] == [CHANGED]
+    assert written == [output_filename(url("same"))]
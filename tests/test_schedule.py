@@ -0,0 +1,176 @@
+import pytest
+import requests
+
+from schemagen import schedule
+from schemagen.schedule import Scheduler, crawl_delay, retry_after
+
+URL = "https://blog.example/post/"
+
+
+class Clock:
+    """Stands in for the ``time`` module: ``sleep`` advances the clock instead of waiting."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(schedule, "time", clock)
+    monkeypatch.setattr(schedule.random, "uniform", lambda low, high: high)  # the longest jittered backoff
+    return clock
+
+
+def response(status, **headers):
+    r = requests.Response()
+    r.status_code = status
+    r.headers.update(headers)
+    return r
+
+
+def sends(scheduler, clock, outcomes, url=URL):
+    """Times (from the start) at which ``scheduler.call`` ran a request answered by each of ``outcomes``."""
+    start, times, answers = clock.now, [], iter(outcomes)
+
+    def request():
+        times.append(clock.now - start)
+        answer = next(answers)
+        if isinstance(answer, requests.Response):
+            raise requests.HTTPError(response=answer)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    try:
+        scheduler.call(url, request)
+    except requests.RequestException:
+        pass
+    return times
+
+
+def slot_times(scheduler, clock, urls):
+    """Times (from the start) at which each of ``urls`` was let through ``scheduler.slot``."""
+    start, times = clock.now, []
+    for url in urls:
+        with scheduler.slot(url):
+            times.append(clock.now - start)
+    return times
+
+
+def test_requests_are_spaced_at_the_rate(clock):
+    scheduler = Scheduler(rate=2, burst=1, respect_robots=False)
+
+    assert slot_times(scheduler, clock, [URL] * 4) == [0.0, 0.5, 1.0, 1.5]
+
+
+def test_burst_goes_early_then_spacing_resumes(clock):
+    scheduler = Scheduler(rate=2, burst=3, respect_robots=False)
+
+    assert slot_times(scheduler, clock, [URL] * 5) == [0.0, 0.0, 0.0, 0.5, 1.0]
+
+
+def test_hosts_are_limited_separately(clock):
+    scheduler = Scheduler(rate=1, burst=1, respect_robots=False)
+
+    assert slot_times(scheduler, clock, [URL, "https://other.example/", URL]) == [0.0, 0.0, 1.0]
+
+
+def test_server_errors_back_off_exponentially_up_to_the_cap(clock):
+    scheduler = Scheduler(rate=100, burst=10, max_retries=4, backoff=1.0, max_backoff=3.0, respect_robots=False)
+
+    times = sends(scheduler, clock, [response(503), response(500), response(502), requests.Timeout(), "ok"])
+
+    assert times == [0.0, 1.0, 3.0, 6.0, 9.0]
+    assert scheduler.metrics()["blog.example"]["retries"] == 4
+
+
+def test_retry_after_is_honoured_and_capped(clock):
+    scheduler = Scheduler(rate=100, burst=10, max_backoff=60.0, respect_robots=False)
+
+    times = sends(scheduler, clock, [response(429, **{"Retry-After": "7"}), response(429, **{"Retry-After": "600"}), "ok"])
+
+    assert times == [0.0, 7.0, 67.0]
+    assert scheduler.metrics()["blog.example"]["throttled"] == 2
+
+
+def test_backoff_pauses_the_whole_host(clock):
+    scheduler = Scheduler(rate=100, burst=10, respect_robots=False)
+    sends(scheduler, clock, [response(429, **{"Retry-After": "5"}), "ok"])
+    clock.now -= 5  # rewind to the 429, as seen by another thread fetching the same host
+
+    assert slot_times(scheduler, clock, ["https://blog.example/other-post/"]) == [5.0]
+
+
+def test_gives_up_after_max_retries(clock):
+    scheduler = Scheduler(rate=100, burst=10, max_retries=2, backoff=1.0, respect_robots=False)
+
+    assert sends(scheduler, clock, [response(503)] * 4) == [0.0, 1.0, 3.0]
+    assert scheduler.metrics()["blog.example"]["failures"] == 1
+    assert scheduler.metrics()["blog.example"]["retries"] == 2
+
+
+def test_client_errors_are_not_retried(clock):
+    scheduler = Scheduler(respect_robots=False)
+
+    assert sends(scheduler, clock, [response(404), "ok"]) == [0.0]
+    assert scheduler.metrics()["blog.example"]["retries"] == 0
+
+
+def test_retry_after_forms(clock):
+    assert retry_after(response(429, **{"Retry-After": "120"})) == 120.0
+    clock.now = 1_700_000_000.0  # 2023-11-14 22:13:20 GMT
+    assert retry_after(response(503, **{"Retry-After": "Tue, 14 Nov 2023 22:14:00 GMT"})) == 40.0
+    assert retry_after(response(503, **{"Retry-After": "Mon, 13 Nov 2023 00:00:00 GMT"})) == 0.0
+    assert retry_after(response(503, **{"Retry-After": "soon"})) is None
+    assert retry_after(response(503)) is None
+    assert retry_after(None) is None
+
+
+ROBOTS = """
+User-agent: *
+Disallow: /wp-admin/
+Crawl-delay: 2
+
+# slower for one named crawler, shared by a group of two
+User-agent: BadBot
+User-agent: Mozilla
+Crawl-delay: 0.5  # fractions are allowed here
+
+User-agent: Other
+Crawl-delay: often
+"""
+
+
+def test_crawl_delay_for_named_and_default_agents():
+    assert crawl_delay(ROBOTS, "Mozilla/5.0") == 0.5
+    assert crawl_delay(ROBOTS, "BadBot/2.1") == 0.5
+    assert crawl_delay(ROBOTS, "SomeCrawler/1.0") == 2.0
+    assert crawl_delay(ROBOTS, "Other") == 2.0  # an unparseable delay is ignored
+    assert crawl_delay("User-agent: *\nDisallow: /") is None
+
+
+def test_robots_crawl_delay_slows_the_host(clock, monkeypatch):
+    class Session:
+        def get(self, url, timeout):
+            self.url = url
+            r = response(200)
+            r._content = b"User-agent: *\nCrawl-delay: 3\n"
+            return r
+
+    session = Session()
+    monkeypatch.setattr(schedule, "get_session", lambda: session)
+    scheduler = Scheduler(rate=4, burst=8)
+
+    assert slot_times(scheduler, clock, [URL] * 3) == [0.0, 3.0, 6.0]
+    assert session.url == "https://blog.example/robots.txt"
+    assert scheduler.metrics()["blog.example"]["crawl_delay"] == 3.0
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+httpx = pytest.importorskip("httpx")
+
+from schemagen import service  # noqa: E402
+from schemagen.fetch import FetchRejected  # noqa: E402
+from schemagen.service import ResultCache, check_public_url, fetch_async  # noqa: E402
+
+PUBLIC = "http://93.184.215.14"  # an IP literal, so no DNS lookup is needed
+
+
+@pytest.fixture(autouse=True)
+def public_only(monkeypatch):
+    monkeypatch.setattr(service, "ALLOW_PRIVATE_URLS", False)
+
+
+@pytest.mark.parametrize("url", [
+    "http://127.0.0.1:8000/admin",
+    "http://localhost/",
+    "http://10.0.0.5/",
+    "http://169.254.169.254/latest/meta-data/",
+    "http://[::1]/",
+    "file:///etc/passwd",
+])
+def test_non_public_urls_are_rejected(url):
+    with pytest.raises(FetchRejected):
+        asyncio.run(check_public_url(url))
+
+
+def fetch(handler, url):
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await fetch_async(client, url)
+    return asyncio.run(run())
+
+
+def test_redirects_are_checked_on_every_hop():
+    def handler(request):
+        if request.url.path == "/post/":
+            return httpx.Response(302, headers={"Location": "http://127.0.0.1/internal"})
+        return httpx.Response(200, text="internal", headers={"Content-Type": "text/html"})
+
+    with pytest.raises(FetchRejected, match="127.0.0.1"):
+        fetch(handler, f"{PUBLIC}/post/")
+
+
+def test_public_redirects_are_followed():
+    def handler(request):
+        if request.url.path == "/old/":
+            return httpx.Response(301, headers={"Location": "/new/"})
+        return httpx.Response(200, text="<p>moved</p>", headers={"Content-Type": "text/html"})
+
+    page = fetch(handler, f"{PUBLIC}/old/")
+
+    assert page.text == "<p>moved</p>"
+
+
+def test_waiters_take_over_from_a_cancelled_leader():
+    cache = ResultCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "schema"
+
+    async def run():
+        leader = asyncio.create_task(cache.get_or_compute("key", compute))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_compute("key", compute))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await asyncio.wait_for(waiter, 1)
+
+    assert asyncio.run(run()) == ("schema", False)
+    assert len(calls) == 2
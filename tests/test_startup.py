@@ -0,0 +1,24 @@
+import os
+
+import pytest
+
+from benchmarks import bench_startup
+
+# Loading a FORBIDDEN module fails anywhere; the time budgets get headroom for slower, noisier CI runners
+SCALE = float(os.environ.get("SCHEMAGEN_STARTUP_SCALE", "2"))
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    imports, result = bench_startup.run("")
+    return {"imports": set(imports), "rss_kb": result["rss_kb"]}
+
+
+@pytest.mark.parametrize("target", list(bench_startup.BUDGETS))
+def test_first_render_stays_within_budget(target, baseline):
+    if target.endswith(".py"):
+        pytest.importorskip("streamlit")
+    row = bench_startup.measure(target, baseline, repeat=2)
+
+    assert sorted(name for name in bench_startup.FORBIDDEN[target] if name in row["modules"]) == []
+    assert row["import_ms"] <= bench_startup.BUDGETS[target] * SCALE
@@ -0,0 +1,131 @@
+import pytest
+
+from schemagen.cli import generate
+from schemagen.course import full_course_schema
+from schemagen.store import ProjectStore
+
+INSTITUTE = {"inst_name": "Future Vision Computers", "inst_url": "https://futurevisioncomputers.com/",
+             "inst_phone": "+91-9825771678", "inst_city": "Surat", "opens": "08:00", "closes": "20:00"}
+INSTITUTE_KWARGS = {key: value for key, value in INSTITUTE.items() if key != "inst_city"}  # full_course_schema has no city
+INSTRUCTOR = {"instructor_name": "Siddharth Parakh", "instructor_desc": "Certified trainer.",
+              "author_knows": "Excel, Power BI"}
+EXCEL = {"course_name": "Advanced Excel", "course_code": "XL-201", "course_desc": "Pivot tables and dashboards.",
+         "course_url": "https://futurevisioncomputers.com/courses/excel/", "course_fee": "6000",
+         "course_currency": "INR", "course_mode": ["Offline"], "faqs": [["Is there a certificate?", "Yes."]]}
+BRANCHES = [{"street": "G-40, Navmanglam Complex", "city": "Surat", "region": "Gujarat", "postal": "395007",
+             "country": "IN", "telephone": "+91-9825771678"}]
+
+
+@pytest.fixture
+def store():
+    with ProjectStore(":memory:") as store:
+        yield store
+
+
+def test_course_is_split_and_comes_back_whole(store):
+    course_id = store.save_course({**INSTITUTE, **INSTRUCTOR, **EXCEL, "branches": BRANCHES})
+
+    [(institute_id, name, url)] = store.institutes()
+    assert (name, url) == ("Future Vision Computers", "https://futurevisioncomputers.com/")
+    assert store.institute_fields(institute_id)["branches"] == BRANCHES
+    assert store.courses() == [(course_id, "XL-201", "Advanced Excel", EXCEL["course_url"])]
+    fields = store.course_fields(course_id)
+    assert {key: fields[key] for key in [*INSTITUTE, *INSTRUCTOR, *EXCEL]} == {**INSTITUTE, **INSTRUCTOR, **EXCEL}
+    assert fields["provider_name"] == "Future Vision Computers"  # the FAQ app's name for inst_name
+    assert store.find_course(code="XL-201") == store.find_course(url=EXCEL["course_url"]) == course_id
+
+
+def test_courses_share_the_institute(store):
+    excel = store.save_course({**INSTITUTE, **EXCEL})
+    power_bi = store.save_course({**INSTITUTE, "course_name": "Power BI", "course_code": "PBI-101"})
+    store.save_institute({**INSTITUTE, "inst_phone": "+91-261-0000000"})
+
+    assert len(store.institutes()) == 1
+    assert {store.course_fields(course_id)["inst_phone"] for course_id in (excel, power_bi)} == {"+91-261-0000000"}
+
+
+def test_saving_again_merges_instead_of_clearing(store):
+    course_id = store.save_course({**INSTITUTE, **INSTRUCTOR, **EXCEL})
+    # The FAQ app: its own names for the provider, no phone, no course code, no instructor
+    again = store.save_course({"provider_name": "Future Vision Computers", "course_name": "Advanced Excel",
+                               "course_url": EXCEL["course_url"], "course_desc": "Now with Power Query."})
+
+    fields = store.course_fields(again)
+    assert again == course_id and len(store) == 1
+    assert fields["course_desc"] == "Now with Power Query."
+    assert (fields["inst_phone"], fields["course_code"], fields["instructor_name"]) == (
+        "+91-9825771678", "XL-201", "Siddharth Parakh")
+
+
+def test_rows_feed_the_generators(store):
+    store.save_course({**INSTITUTE, **INSTRUCTOR, **EXCEL})
+    store.save_course({**INSTITUTE, "course_name": "Tally Prime", "course_fee": 4500})
+
+    schemas = {row["course_name"]: generate("full-course", row) for row in store.rows("full-course")}
+
+    direct = full_course_schema(**INSTITUTE_KWARGS, **INSTRUCTOR, **EXCEL)
+    assert schemas["Advanced Excel"] == direct
+    assert schemas["Advanced Excel"][1]["hasCourseInstance"]["offers"]["price"] == "6000"
+    assert schemas["Tally Prime"][1]["name"] == "Tally Prime"
+    with pytest.raises(ValueError):
+        list(store.rows("blog-url"))
+
+
+
+def test_posts_round_trip(store):
+    post = {"headline": "Excel Formulas", "blog_url": "https://futurevisioncomputers.com/blog/formulas/",
+            "date_published": "2026-10-01", "faqs": [["What is VLOOKUP?", "A lookup function."]]}
+    post_id = store.save_post("article", post)
+    store.save_post("article", {**post, "headline": "Excel Formulas, Updated"})
+
+    assert store.posts("blog-posting") == []
+    assert store.find_post(post["blog_url"]) == post_id
+    assert list(store.rows("article")) == [store.post_fields(post_id)]
+    assert store.post_fields(post_id)["headline"] == "Excel Formulas, Updated"
+
+
+@pytest.mark.parametrize("full_text", [True, False])
+def test_search_with_and_without_fts5(full_text):
+    with ProjectStore(":memory:") as store:
+        if not full_text:
+            store.full_text = False  # as on an SQLite built without FTS5: LIKE over the stored fields
+        excel = store.save_course({**INSTITUTE, **EXCEL})
+        power_bi = store.save_course({**INSTITUTE, "course_name": "Power BI", "course_code": "PBI-101",
+                                      "course_desc": "Dashboards from Excel data."})
+        post = store.save_post("article", {"headline": "Pivot tables in Excel", "blog_url": "https://fvc.example/p/"})
+
+        assert {(kind, record_id) for kind, record_id, _ in store.search("dashboards")} == {
+            ("course", excel), ("course", power_bi)}
+        assert store.search("certif") == [("course", excel, "Advanced Excel")]  # FAQ text, as a prefix
+        assert store.search("pivot", kind="post") == [("post", post, "Pivot tables in Excel")]
+        assert store.search("  ") == []
+        store.delete("course", excel)
+        assert store.search("certificate") == []
+
+
+def test_malformed_records_still_save_and_index(store):
+    course_id = store.save_course({**INSTITUTE, "course_name": "Excel", "faqs": ["just a note", ["Q?", "A."], 7]})
+
+    assert store.search("note") == [("course", course_id, "Excel")]
+    with pytest.raises(ValueError):
+        store.save_course({"course_desc": "No name or code"})
+    with pytest.raises(ValueError):
+        store.save_post("blog-url", {"headline": "Wrong kind"})
+
+
+def test_saved_value_falls_back_on_malformed_fields():
+    pytest.importorskip("streamlit")
+    from datetime import date
+
+    from app_cache import saved_choices, saved_value
+
+    saved = {"date_published": "01/10/2026", "date_modified": "2026-10-02", "word_count": "lots", "fee": "",
+             "course_mode": "Online", "modes": ["Hybrid"]}
+
+    assert saved_value(saved, "date_published", date(2026, 1, 1), date.fromisoformat) == date(2026, 1, 1)
+    assert saved_value(saved, "date_modified", date(2026, 1, 1), date.fromisoformat) == date(2026, 10, 2)
+    assert saved_value(saved, "word_count", 1200, int) == 1200
+    assert saved_value(saved, "fee", "5000") == "5000"
+    assert saved_value(saved, "missing", "INR") == "INR"
+    assert saved_value(saved, "course_mode", ["Offline"], saved_choices(["Online", "Offline"])) == ["Online"]
+    assert saved_value(saved, "modes", ["Offline"], saved_choices(["Online", "Offline"])) == ["Offline"]
@@ -0,0 +1,145 @@
+import pytest
+
+from schemagen.blog import analyze_blog_html, build_blog_schema
+from schemagen.validate import ERROR, WARNING, validate, validate_all
+
+URL = "https://futurevisioncomputers.com/blog/pivot-tables/"
+
+COURSE = {
+    "@context": "https://schema.org",
+    "@graph": [
+        {"@type": "EducationalOrganization", "@id": "https://futurevisioncomputers.com/#organization",
+         "name": "Future Vision Computers", "url": "https://futurevisioncomputers.com/",
+         "logo": "https://futurevisioncomputers.com/logo.png"},
+        {"@type": "Course", "name": "Advanced Excel", "description": "Formulas, pivot tables and dashboards.",
+         "provider": {"@id": "https://futurevisioncomputers.com/#organization"},
+         "hasCourseInstance": [{"@type": "CourseInstance", "courseMode": "Onsite", "courseWorkload": "PT40H",
+                                "startDate": "2026-11-02", "endDate": "2026-12-14T18:30:00+05:30"}],
+         "offers": {"@type": "Offer", "price": "12000", "priceCurrency": "INR",
+                    "availability": "https://schema.org/InStock"}},
+    ],
+}
+
+
+def found(issues):
+    return sorted((issue.severity, issue.path, issue.message) for issue in issues)
+
+
+def node(**props):
+    return {"@context": "https://schema.org", **props}
+
+
+def test_known_good_course_graph():
+    assert validate(COURSE) == []
+
+
+def test_generated_blog_schema_is_clean(fixture_html):
+    schema, _ = build_blog_schema(URL, "Advanced Excel", analyze_blog_html(fixture_html("faq_jsonld.html"), URL))
+
+    assert validate(schema) == []
+
+
+@pytest.mark.parametrize("document, expected", [
+    (node(**{"@type": "Course", "name": "Excel"}), [
+        (ERROR, "", "missing required description"),
+        (WARNING, "", "missing recommended hasCourseInstance"),
+        (WARNING, "", "missing recommended offers"),
+        (WARNING, "", "missing recommended provider"),
+    ]),
+    (node(**{"@type": "Offer", "price": "", "availability": "https://schema.org/InStock"}), [
+        (ERROR, "", "missing required price"),  # an empty required value is missing, not reported twice
+        (ERROR, "", "missing required priceCurrency"),
+    ]),
+    (node(**{"@type": "CourseInstance", "courseMode": "Online"}), [
+        (WARNING, "", "missing recommended courseWorkload or courseSchedule or duration"),
+    ]),
+    (node(**{"@type": "FAQPage", "mainEntity": [{"@type": "Question", "name": "Why?"},
+                                                  {"@type": "Question", "name": "How?",
+                                                   "acceptedAnswer": {"@type": "Answer", "text": ""}}]}), [
+        (ERROR, "mainEntity[0]", "missing required acceptedAnswer"),
+        (ERROR, "mainEntity[1].acceptedAnswer", "missing required text"),
+    ]),
+    (node(**{"@type": "LocalBusiness", "name": "FVC", "telephone": "+91 98000 00000", "url": "https://fvc.example/",
+             "geo": {"@type": "GeoCoordinates", "latitude": "22.3", "longitude": None},
+             "address": {"@type": "PostalAddress", "streetAddress": "", "addressLocality": "Vadodara"}}), [
+        (ERROR, "geo.longitude", "is null"),
+        (WARNING, "address", "missing recommended addressCountry"),
+        (WARNING, "address", "missing recommended streetAddress"),
+    ]),
+    (node(**{"@type": "AggregateRating", "ratingValue": "4.8", "ratingCount": 0}), []),  # either count will do
+])
+def test_required_and_recommended_properties(document, expected):
+    assert found(validate(document)) == expected
+
+
+def test_rules_of_every_type_apply_to_a_multi_typed_node():
+    document = node(**{"@type": ["Organization", "LocalBusiness"], "name": "FVC", "address": "Vadodara"})
+
+    assert found(validate(document)) == [
+        (WARNING, "", "missing recommended geo"),
+        (WARNING, "", "missing recommended logo"),
+        (WARNING, "", "missing recommended telephone"),
+        (WARNING, "", "missing recommended url"),
+    ]
+
+
+@pytest.mark.parametrize("prop, good, bad, message", [
+    ("url", "https://fvc.example/courses/", "/courses/", "is not an absolute http(s) URL"),
+    ("datePublished", "2026-10-18T09:30:00Z", "18/10/2026", "is not an ISO 8601 date"),
+    ("timeRequired", "PT1H30M", "90 minutes", "is not an ISO 8601 duration (e.g. P3M, PT40H)"),
+    ("timeRequired", "P3M", "P", "is not an ISO 8601 duration (e.g. P3M, PT40H)"),
+    ("wordCount", 1200, "about 1200", "is not a number"),
+    ("wordCount", "1200", True, "is not a number"),
+    ("priceCurrency", "INR", "₹", "is not a three-letter ISO 4217 currency code"),
+    ("headline", "Pivot tables", "x" * 111, "is longer than 110 characters"),
+])
+def test_value_checks(prop, good, bad, message):
+    assert validate(node(**{prop: good})) == []
+    [issue] = validate(node(**{prop: bad}))
+
+    assert (issue.severity, issue.property, issue.message, issue.value) == (ERROR, prop, message, bad)
+
+
+def test_every_item_of_a_list_is_checked():
+    document = node(sameAs=["https://facebook.com/fvc", "instagram.com/fvc", {"@id": "https://x.example/"}])
+
+    assert [(issue.path, issue.value) for issue in validate(document)] == [("sameAs", "instagram.com/fvc")]
+
+
+def test_empty_and_null_values():
+    document = node(**{"@type": "Person", "name": "Siddharth", "jobTitle": "", "knowsAbout": [], "email": None})
+
+    assert found(validate(document)) == [
+        (ERROR, "email", "is null"),
+        (WARNING, "jobTitle", "is empty"),
+        (WARNING, "knowsAbout", "is empty"),
+    ]
+
+
+def test_references_are_not_checked_as_nodes():
+    document = node(**{"@type": "BlogPosting", "headline": "Pivot tables", "image": "https://fvc.example/a.jpg",
+                       "datePublished": "2026-10-01", "dateModified": "2026-10-02",
+                       "author": {"@id": "https://fvc.example/#author"}})
+
+    assert validate(document) == []
+
+
+def test_graph_paths_and_types():
+    [issue] = validate({"@graph": [{"@type": "Organization", "name": "FVC", "url": "https://fvc.example/",
+                                    "logo": {"@type": "ImageObject", "url": "logo.png"}}]})
+
+    assert (issue.path, issue.type, issue.property) == ("@graph[0].logo.url", "ImageObject", "url")
+    assert str(issue) == "error: @graph[0].logo.url: is not an absolute http(s) URL (got 'logo.png')"
+
+
+def test_report_groups_problems_across_documents():
+    documents = [COURSE, node(**{"@type": "Course", "name": "A"}), node(**{"@type": "Course", "name": "B"})]
+    report = validate_all(documents, labels=["/good/", "/a/", "/b/"])
+
+    assert (report.documents, report.with_errors, report.with_warnings) == (3, 2, 2)
+    assert (report.errors, report.warnings) == (2, 6)
+    assert report.counts[(ERROR, "Course", "description", "missing required description")] == 2
+    assert report.format().splitlines()[:2] == [
+        "3 documents: 2 with errors (2 errors), 2 with warnings (6 warnings)",
+        "        2 error   Course.description missing required description  e.g. /a/",
+    ]